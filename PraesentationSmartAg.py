@@ -1,10 +1,9 @@
 import streamlit as st
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from datetime import datetime
 
-import base64
-from pathlib import Path
+from smartag.assets import cache as asset_cache
+from smartag import content, diagnostics, edge, stylesheet
+from smartag.profiling import profiled, section
+from smartag.static_assets import download_url, lite_img, responsive_img
 
 # --- PAGE CONFIG ---
 st.set_page_config(
@@ -14,610 +13,115 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# Abschnittsmessung nur bei Bedarf (?diag=1&token=…), sonst ohne Kosten
+show_diagnostics = diagnostics.requested()
+
 # --- CUSTOM STYLING ---
-st.markdown("""
-<style>
-    .title {
-        font-size: 2.8rem;
-        font-weight: 700;
-        color: #1b5e20;
-        text-align: center;
-        margin-bottom: 0.5rem;
-    }
-    .subtitle {
-        font-size: 1.3rem;
-        color: #424242;
-        text-align: center;
-        margin-bottom: 2.5rem;
-    }
-    .section {
-        font-size: 1.8rem;
-        font-weight: 600;
-        color: #2e7d32;
-        margin-top: 2.5rem;
-        padding-bottom: 0.5rem;
-        border-bottom: 2px solid #c8e6c9;
-    }
-    .section-header {
-        font-size: 1.5rem;
-        color: #2e7d32;
-        border-left: 4px solid #66bb6a;
-        padding-left: 1rem;
-        margin-top: 2rem;
-    }
-    .highlight {
-        background-color: #f5f9f5;
-        padding: 1.2rem;
-        border-radius: 8px;
-        border-left: 4px solid #4caf50;
-        margin: 1.5rem 0;
-    }
-    .box {
-        background: white;
-        padding: 1.2rem;
-        border-radius: 8px;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-        margin: 1rem 0;
-    }
-    .metric-row {
-        display: flex;
-        justify-content: space-around;
-        flex-wrap: wrap;
-        gap: 1rem;
-        margin: 2rem 0;
-    }
-    .metric {
-        flex: 1;
-        min-width: 200px;
-        text-align: center;
-        padding: 1rem;
-        background: #f1f8e9;
-        border-radius: 8px;
-        border: 1px solid #dcedc8;
-    }
-    .highlight-box {
-        background-color: #f1f8e9;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border: 1px solid #c8e6c9;
-        margin: 1rem 0;
-    }
-    .metric-card {
-        background: white;
-        padding: 1rem;
-        border-radius: 10px;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        text-align: center;
-        transition: transform 0.2s;
-    }
-    .metric-card:hover {
-        transform: translateY(-5px);
-    }
-    .pros-cons {
-        display: flex;
-        justify-content: space-between;
-        gap: 2rem;
-        margin-top: 2rem;
-    }
-    .pros, .cons {
-        flex: 1;
-        padding: 1.5rem;
-        border-radius: 10px;
-    }
-    .pros {
-        background-color: #e8f5e8;
-        border: 2px solid #81c784;
-    }
-    .cons {
-        background-color: #ffebee;
-        border: 2px solid #ef9a9a;
-    }
-    .footer {
-        text-align: center;
-        margin: 0 !important;          
-        padding: 0.5rem 0 !important;  
-        color: #757575;
-        font-size: 0.9rem;
-        border-top: 1px solid #e0e0e0;
-        width: 100%;
-        box-sizing: border-box;        /* Verhindert Überlappungen */
-    }
-    .disclaimer {
-        font-size: 0.85rem;
-        color: #616161;
-        margin: 0 !important;          /* Kein Margin */
-        padding: 0 !important;
-        font-style: italic;
-    }
-    /* Verhindert unnoetigen Leerraum beim Drucken */
-    @media print {
-        
-        .main .block-container {
-            padding-top: 0.rem !important;
-            padding-bottom: 0 !important;
-            margin-bottom: 0 !important;  
-            max-width: 100% !important;
-        }
-
-        .stDeployButton, header, footer, #MainMenu {
-            display: none !important;
-        }
-
-        .footer {
-            display: block !important; 
-            position: fixed; 
-            bottom: 0;
-            width: 100%;
-            margin-top: 3rem !important; 
-            margin-bottom: 0rem !important;  
-            padding: 0rem 0 !important;
-            page-break-inside: avoid; 
-            page-break-after: avoid;  
-        }
-        
-        .disclaimer {
-            margin-bottom: 0 !important;
-        }
-    }
-
-</style>
-""", unsafe_allow_html=True)
+with section("styles"):
+    # Theme, Hintergrund-Tabelle und Druckregeln aus smartag/styles.css (einmal gebaut, gehasht),
+    # als <style> über st.html gesendet; Reruns übertragen dank Nachrichten-Cache nur den Hash
+    # Lite-Profil (wenig freier RAM auf dem Gateway): CSS-Verläufe statt Hintergrundbilder
+    stylesheet.inject(lite=edge.is_lite())
+
+# Jeder Abschnitt ist ein eigenes Fragment: Interaktionen darin (Widgets, Tabs mit
+# künftigen Demos) führen nur diesen Abschnitt erneut aus, nicht die ganze Seite.
 
 # --- HEADER ---
+@st.fragment
+@profiled("header")
+def render_header():
+    st.markdown(content.section_html("header"), unsafe_allow_html=True)
 
-st.markdown('<div class="title"><a href="https://smartelandwirtschaft.streamlit.app/" style="color: inherit; text-decoration: none;">🌾Smarte und resiliente Landwirtschaft mit Edge AI</a></div>', unsafe_allow_html=True)
-st.markdown('<div class="subtitle">Ein Projekt zur intelligenten Nahrungsmittelüberwachung durch KI-Kamerasysteme – lokal, unabhängig und zukunftsfähig.'
-' </div>', unsafe_allow_html=True)
+render_header()
 
 # --- PROBLEM STATEMENT ---
-st.markdown('<div class="section"> Hintergrund & Motivation</div>', unsafe_allow_html=True)
-
-# Funktion zum Laden des Bildes als Base64
-def get_base64_image(image_path):
-    try:
-        img_bytes = Path(image_path).read_bytes()
-        encoded = base64.b64encode(img_bytes).decode()
-        return f"data:image/png;base64,{encoded}"
-    except:
-        return ""
-
-# Bild laden
-bg_image = get_base64_image("smartgreenhouse.png")
-bg_image2 = get_base64_image("DryPlants.jpeg")
-
-st.markdown(f"""
-<style>
-    .table-container {{
-        display: flex;
-        gap: 40px;
-    }}
-    .column {{
-        flex: 1;
-    }}
-    ul {{
-        margin: 0;
-        padding-left: 20px;
-    }}
-    .highlight li {{
-        font-size: 1.25rem;
-        margin-bottom: 0.75rem;
-        line-height: 1.4;
-    }}
-    .column-with-bg {{
-        background-image: url('{bg_image}');
-        background-size: cover;
-        background-position: center;
-        background-repeat: no-repeat;
-        position: relative;
-        border-radius: 10px;
-        overflow: hidden;
-        padding: 1.2rem 1.2rem 0.6rem 1.2rem;
-        border-radius: 8px;
-        border-left: 4px solid #4caf50;
-        margin: 1.5rem 0;
-    }}
-    .column-with-bg::before {{
-        content: "";
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background-color: rgba(245, 249, 245, 0.75); /* Semi-transparent overlay */
-        z-index: 1;
-    }}
-    .column-content {{
-        position: relative;
-        z-index: 2;
-        padding: 5px;
-    }}
-    .column-with-bg2 {{
-        background-image: url('{bg_image2}');
-        background-size: cover;
-        background-position: bottom;
-        background-repeat: no-repeat;
-        position: relative;
-        border-radius: 10px;
-        overflow: hidden;
-        padding: 1.2rem 1.2rem 0rem 1.2rem;;
-        border-radius: 8px;
-        border-left: 4px solid #4caf50;
-        margin: 1.5rem 0;
-    }}
-    .column-with-bg2::before {{
-        content: "";
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background-color: rgba(245, 249, 245, 0.85); /* Semi-transparent overlay */
-        z-index: 1;
-    }}
-</style>
-
-<div class="table-container">
-    <div class="column">
-        <div class="column-with-bg2">
-            <div class="column-content">
-            <h4 style="text-align: center;">🧭  Ausgangszustand</h4>
-            <p><strong><span style="font-size: 1.25rem;">Die Landwirtschaft steht zunehmend unter Druck – ausgelöst durch:</span></strong></p>
-            <ul><span style="font-size: 1.25rem;">
-              <li>Klimawandel</li>
-              <li>Ressourcenknappheit (z. B. Wasser)</li>
-              <li>Preisvolatilitäten und Marktschwankungen</li>
-              <li>Geopolitische Spannungen</li>
-              <li>Störungen in Lieferketten</li>
-              <li>Stromausfälle und Energieengpässe</li>
-              <li>Unterbrechungen in der Kommunikationsinfrastruktur (Internet/Mobilfunk)</li>
-              <li>Zunehmende Bedrohung durch Cyberangriffe</li>
-            </ul>
-            <p><span style="font-size: 1.25rem;">Gleichzeitig steigt die weltweite Nachfrage nach Nahrungsmitteln – bei wachsendem Anspruch an Nachhaltigkeit und Umweltschutz.</span></p>
-        </div>
-        </div>
-    </div>
-    <div class="column">
-        <div class="column-with-bg">
-            <div class="column-content">
-                <h4 style="text-align: center;">❔ Leitfragen</h4>
-                <ul>
-                <li style="font-size: 1.35rem; color: darkgreen;"><strong>Wie kann kritische Infrastruktur wie die Nahrungsmittelversorgung präziser, resilienter und effizienter überwacht werden?</strong></li>
-                <li style="font-size: 1.35rem; color: darkgreen;"><strong>Wie kann man gleichzeitig konkrete Handlungsempfehlungen ableiten, die zu nachhaltigem Nutzen (ökologisch, ökonomisch, gesellschaftlich) führen?</strong></li>
-                </ul>
-            </div>
-        </div>
-    </div>
-</div>
-""", unsafe_allow_html=True)
+@st.fragment
+@profiled("hintergrund")
+def render_hintergrund():
+    st.markdown(content.section_html("hintergrund"), unsafe_allow_html=True)
+
+render_hintergrund()
 
 #st.markdown("""<br>""", unsafe_allow_html=True)
 
 # --- SOLUTION APPROACH ---
-st.markdown('<div class="section">Ein Lösungsansatz</div>', unsafe_allow_html=True)
-
-st.markdown("""""")
-
-# --- TABS ---
-tab1, tab2= st.tabs(["🛠️ Technologie", "⚙️ Ablauf"]) #, "🛠️ Technologie 2", "⚙️ Ablauf 2"])
-
-
-# --- TAB 1: TECHNOLOGIE ---
-with tab1:
-    st.markdown('<div class="section-header">Lokales Netzwerk mit Edge AI & LoRaWAN/WiFi - optional mit Internetanbindung und energieautark</div>', unsafe_allow_html=True)
-    
-    import base64
-    
-    # Bild als Base64 einbetten, um bessere Kontrolle über Groesse und Position zu haben
-    with open("TechnologieAufbauErweitert3.png", "rb") as f:
-        img_data = base64.b64encode(f.read()).decode()
-    
-    st.markdown(f"""
-        <div style="display: flex; justify-content: center; align-items: center; flex-direction: column;">
-            <img src="data:image/png;base64,{img_data}" 
-                 style="max-width: 1300px; width: 100%; height: auto;">
-            <p style="text-align: center; color: gray; margin-top: 10px;">
-                Beispielhafter technischer Aufbau
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown("""""")
-
-
-    cols = st.columns(3)
-
-    with cols[0]:
-        st.markdown("""
-        <div style="background-color:#f0f0f0; padding:10px; border-radius:5px;">
-            <h4>📡 Sensorsystem</h4>
-        </div>
-        <div style="background-color:#EDF3DB; color:black; padding:10px; border-radius:5px; margin-top:10px; font-size: 1.25rem;">
-        <ul>
-            <li><b>AI-Kamera</b> mit integriertem LoRa-Transceiver  oder integriertem WiFi</li>
-            <li><b>Lokale KI-Verarbeitung (Edge AI)</b> auf der Kamera mittels integrierter Tools wie TensorFlow Lite Micro oder PyTorch</li>
-            <li><b>Datenübertragung</b> zu definierten Zeiten über energieeffizientes LoRaWAN (bis 10 km Reichweite) oder WiFi (hohe Bandbreite)</li>
-            <li>Zusätzliche Erprobung des Einsatzes von <b>verteiltem KI-Training (Federated Learning)</b> zur kontinuierlichen Verbesserung der Modelle möglich</li>
-            <li><b>Stromversorgung</b> via Batterie (LoRaWAN-basierte Kamera) oder via Netzstrom (WiFi-basierte Kamera)</li>
-        </ul>
-        </div>
-        <div style="background-color:#B61C7B; color:white; padding:10px; border-radius:5px; margin-top:10px; font-size: 1.25rem;">
-            <ul>
-                <li>Optional: Solarbetrieb bei WiFi-Kameras für Energieautarkie*</li>
-            </ul>   
-        </div>
-        <br>
-        <i>* Solarbetrieb ist bei LoRaWAN-basierten Kameras nicht nötig.</i><br>
-        <i>** Hierzu ist eine separate SIM-Karte nötig.</i>
-        """, unsafe_allow_html=True)
-
-    # Einsatzbereiche: Überwachung von Pflanzenwachstum, Erkennung von Schädlingen/Krankheiten, Bodenfeuchteanalyse, Reifegradbestimmung
-
-    with cols[1]:
-        st.markdown("""
-        <div style="background-color:#f0f0f0; padding:10px; border-radius:5px;">
-            <h4>🖥️ Gateway & Server</h4>
-        </div>
-        <div style="background-color:#EDF3DB; color:black; padding:10px; border-radius:5px; margin-top:10px; font-size: 1.25rem;">
-            <ul>
-                <li>Ein einzelnes Gerät auf Basis des Raspberry Pi, das <b>sowohl als Gateway als auch als zentraler Server</b> dient.</li>
-                <li>Gateway beinhaltet <b>LoRa-Transceiver, WLAN-Modul, LTE-Modul und SSD-Speicher</b></li>
-                <li>Vorinstalliertes Linux mit Docker ermöglicht <b>einfache Konfiguration und Containerisierung</b></li>
-                <li>Software: ChirpStack (Network Server für LoRaWAN), MQTT Broker (Datenvermittlung), PostgreSQL/TimescaleDB (Datenbank), Grafana (Visualisierung)</li>
-                <li><b>Stromversorgung</b> via Netzstrom/Power over Ethernet (PoE)</li>
-            </ul>
-        </div>
-        <div style="background-color:#C8E3FB; color:black; padding:10px; border-radius:5px; margin-top:10px; font-size: 1.25rem;">
-            <ul>
-                <li>Optional: Internetanbindung über integriertes LTE-Modul** oder über mobilen LTE-Stick**</li>
-            </ul>
-        </div>
-        <div style="background-color:#B61C7B; color:white; padding:10px; border-radius:5px; margin-top:10px; font-size: 1.25rem;">
-            <ul>
-                <li>Optional: Solarbetrieb des Gateways/Servers für Energieautarkie</li>
-            </ul>
-        </div>
-
-        """, unsafe_allow_html=True)
-
-    # Vorteile dieses Setups: Einfache Installation, da ein Gerät; keine komplexe Netzwerkkommunikation zw. Gateway und Server; geringere Latenz; weniger potenzielle Netzwerkprobleme/-ausfälle
-
-    with cols[2]:
-        st.markdown("""
-        <div style="background-color:#f0f0f0; padding:10px; border-radius:5px;">
-            <h4>📱 Zugriff & Nutzung</h4>
-        </div>
-        <div style="background-color:#EDF3DB; color:black; padding:10px; border-radius:5px; margin-top:10px; font-size: 1.25rem;">
-            <ul>
-                <li><b>Lokales WLAN</b> vom Gateway/Server bereitgestellt</li>
-                <li>Gateway/Server fungiert als <b>zentraler Zugangspunkt</b></li>
-                    <ul>
-                    <li>Bei Netzstrombetrieb: Permanenter Zugriff auf Gateway/Server über das <b>lokale WLAN</b> per Smartphone, Tablet oder Laptop</li>
-                    <li>Bei Solarbetrieb: Aktivierung des Gateways/Servers (Sleepy Server) bei Bedarf über <b>Wake-on-WLAN</b> per Smartphone, Tablet oder Laptop</li>
-                    </ul>
-                <li>Bereitstellung einer <b>Datenvisualisierung (Dashboard)</b>, welche Pflanzenzustände nach Art, Ort und im Zeitverlauf anzeigt</li>
-                <li><b>Benachrichtigungen</b> und Alarme möglich</li>
-                <li><b>Keine Cloud- oder Internetverbindung</b> erforderlich</li>
-            </ul>
-        </div>
-        <div style="background-color:#C8E3FB; color:black; padding:10px; border-radius:5px; margin-top:10px; font-size: 1.25rem;">
-            <ul>
-                <li>Optional: Fernzugriff per Smartphone, Tablet oder Laptop mittels Internet (z.B. via lokalem WLAN-Router oder LTE-Modul**)</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # <li><b>Maßnahmen</b> können direkt vor Ort abgeleitet und umgesetzt werden (z. B. Bewässerung, Warnung, Dokumentation).</li>
+@st.fragment
+@profiled("tabs")
+def render_loesungsansatz():
+    st.markdown(f'<div class="section">{content.text("loesungsansatz", "title")}</div>', unsafe_allow_html=True)
+
+    # Erst hier importieren: NumPy und die Tab-Module laden, nachdem Titel und
+    # Hintergrund schon beim Browser sind (Kaltstart nach Wake-on-WLAN);
+    # Plotly importieren die Module selbst erst beim Zeichnen. Das Lite-Profil
+    # lässt die Zusatz-Tabs ganz weg (siehe smartag/edge.py).
+    lite = edge.is_lite()
+    from smartag import demo
+
+    # --- TABS ---
+    labels = content.text("loesungsansatz", "tabs")
+    tab1, tab2, tab3, *extra_tabs = st.tabs(labels[:3] if lite else labels)
+
+    # --- TAB 1: TECHNOLOGIE ---
+    with tab1:
+        # Bild per <img> einbinden, um bessere Kontrolle über Groesse und Position zu haben
+        if lite:
+            img_data = lite_img(
+                "TechnologieAufbauErweitert3.png",
+                style="max-width: 1000px; width: 100%; height: auto;",
+            )
+        else:
+            img_data = responsive_img(
+                "TechnologieAufbauErweitert3.png",
+                sizes="(max-width: 1300px) 100vw, 1300px",
+                style="max-width: 1300px; width: 100%; height: auto;",
+            )
+        st.markdown(content.section_html("technologie", diagram=img_data), unsafe_allow_html=True)
+
+        # Einsatzbereiche: Überwachung von Pflanzenwachstum, Erkennung von Schädlingen/Krankheiten, Bodenfeuchteanalyse, Reifegradbestimmung
+        # Vorteile dieses Setups: Einfache Installation, da ein Gerät; keine komplexe Netzwerkkommunikation zw. Gateway und Server; geringere Latenz; weniger potenzielle Netzwerkprobleme/-ausfälle
+        # <li><b>Maßnahmen</b> können direkt vor Ort abgeleitet und umgesetzt werden (z. B. Bewässerung, Warnung, Dokumentation).</li>
 
         # - Bodenfeuchte & Temperatur
         # - Lichtintensität & UV-Index
         # - Luftfeuchtigkeit & CO₂
         # - Nährstoffgehalt (Stickstoff, Phosphor, Kalium)
 
+    # --- TAB 2: ABLAUF ---
+    with tab2:
+        st.markdown(content.section_html("ablauf"), unsafe_allow_html=True)
+
+    # --- TAB 3: DEMO --- (eigenes Fragment mit run_every, siehe smartag/demo.py)
+    with tab3:
+        demo.render_tab(charts=not lite)
+
+    if extra_tabs:
+        from smartag import airtime_tab, energy_tab, gallery_tab
+
+        tab4, tab5, tab6 = extra_tabs
+
+        # --- TAB 4: ENERGIEAUTARKIE --- (Jahressimulation, siehe smartag/energy.py)
+        with tab4:
+            energy_tab.render_tab()
+
+        # --- TAB 5: FUNKBUDGET --- (Airtime-/Duty-Cycle-Raster, siehe smartag/lora.py)
+        with tab5:
+            airtime_tab.render_tab()
+
+        # --- TAB 6: SCHNAPPSCHÜSSE --- (Index und Thumbnails, siehe smartag/gallery.py)
+        with tab6:
+            gallery_tab.render_tab()
+
+render_loesungsansatz()
 
-    # with col_b:
-    #     # Mini-Diagramm: Stromverbrauch Vergleich
-    #     fig = go.Figure(go.Bar(
-    #         x=['Cloud ML', 'TinyML'],
-    #         y=[1000, 5],
-    #         marker_color=['#ef9a9a', '#81c784'],
-    #         text=[f"{y} mW" for y in [1000, 5]],
-    #         textposition='auto',
-    #     ))
-    #     fig.update_layout(
-    #         title="⚡ Energieverbrauch im Vergleich",
-    #         yaxis_title="Leistungsaufnahme (mW)",
-    #         showlegend=False,
-    #         height=300
-    #     )
-    #     st.plotly_chart(fig, use_container_width=True)
-
-with tab2:
-    st.markdown(
-        """
-        <div class="section-header">Ablaufplan</div>
-        <div class="highlight-box">
-            <ol style="font-size:1.5rem; line-height:2;">
-                <li><b>AI-Kamera</b> beobachtet Pflanzen in definierten Zeitabständen</li>
-                <li><b>TinyML-Modell</b> erkennt Fruchtanzahl und Pflanzenzustand (z. B. Reifegrad) direkt und lokal auf dem Edge-Gerät</li>
-                <li><b>Datenübertragung</b> erfolgt zu definierten Zeitpunkten an das lokale Gateway-/Serversystem</li>
-                <li><b>Gateway/Server</b> empfängt, speichert und visualisiert die Daten lokal</li>
-                <li><b>Zugriff</b> auf die Visualisierung erfolgt per Smartphone, Tablet oder Laptop über das lokale WLAN (bzw. optional über LTE)</li>
-                <li><b>Handlungsempfehlungen</b> können direkt vor Ort abgeleitet werden (z. B. Bewässern, Toppen, Ausdünnen, Auslichten, Ernten).</li>
-            </ol>
-        </div>
-        """, unsafe_allow_html=True)
-
-    st.markdown("""<br><br><br><br><br><br>""", unsafe_allow_html=True)
-
-
-# # --- TAB 3: DEMO ---
-# with tab3:
-#     st.markdown('<div class="section-header">Live Demo Simulation</div>', unsafe_allow_html=True)
-    
-#     st.info("👉 *Stellen Sie sich vor: Sie sind Bauer und überwachen Ihr Feld in Echtzeit.*")
-    
-#     col_demo1, col_demo2 = st.columns(2)
-    
-#     with col_demo1:
-#         soil_moisture = st.slider("💧 Bodenfeuchte (%)", 0, 100, 35)
-#         temperature = st.slider("🌡️ Temperatur (°C)", 0, 45, 28)
-#         light_level = st.slider("☀️ Lichtintensität (Lux)", 0, 100000, 65000)
-    
-#     with col_demo2:
-#         # Simulierte TinyML Entscheidung
-#         if soil_moisture < 30:
-#             decision = "🔴 BEWÄSSERUNG AKTIVIEREN"
-#             color = "#e53935"
-#         elif soil_moisture > 70:
-#             decision = "🟡 ÜBERFLUTUNGSWARNUNG"
-#             color = "#fb8c00"
-#         else:
-#             decision = "🟢 OPTIMALER ZUSTAND"
-#             color = "#43a047"
-        
-#         st.markdown(f"""
-#         <div style="padding: 2rem; border-radius: 15px; background-color: {color}20; border: 2px solid {color}; text-align: center;">
-#             <h2>🤖 TinyML Entscheidung:</h2>
-#             <h1 style="color:{color};">{decision}</h1>
-#         </div>
-#         """, unsafe_allow_html=True)
-    
-#     # Fortschrittsvisualisierung
-#     st.markdown("### 📈 Feldzustand Visualisierung")
-
-#     # WICHTIG: 'type="domain"' für alle Subplots, da wir go.Indicator/Gauge nutzen!
-#     fig_demo = make_subplots(
-#         rows=1, cols=3,
-#         specs=[[{'type': 'domain'}, {'type': 'domain'}, {'type': 'domain'}]],  # ← DAS FEHLTEN!
-#         subplot_titles=("Feuchte", "Temperatur", "Licht")
-#     )
 
-#     # Feuchtigkeit
-#     fig_demo.add_trace(go.Indicator(
-#         mode="gauge+number",
-#         value=soil_moisture,
-#         title={'text': "Bodenfeuchte"},
-#         gauge={
-#             'axis': {'range': [0, 100]},
-#             'bar': {'color': "#4caf50"},
-#             'steps': [
-#                 {'range': [0, 30], 'color': "#ef9a9a"},
-#                 {'range': [30, 70], 'color': "#a5d6a7"},
-#                 {'range': [70, 100], 'color': "#fff59d"}
-#             ]
-#         }
-#     ), row=1, col=1)
-
-#     # Temperatur
-#     fig_demo.add_trace(go.Indicator(
-#         mode="gauge+number",
-#         value=temperature,
-#         title={'text': "Temperatur °C"},
-#         gauge={
-#             'axis': {'range': [0, 45]},
-#             'bar': {'color': "#ff7043"},
-#             'steps': [
-#                 {'range': [0, 20], 'color': "#bbdefb"},
-#                 {'range': [20, 35], 'color': "#e1f5fe"},
-#                 {'range': [35, 45], 'color': "#ffcdd2"}
-#             ]
-#         }
-#     ), row=1, col=2)
-
-#     # Licht
-#     fig_demo.add_trace(go.Indicator(
-#         mode="gauge+number",
-#         value=light_level / 1000,  # in kLux
-#         title={'text': "Licht (kLux)"},
-#         gauge={
-#             'axis': {'range': [0, 100]},
-#             'bar': {'color': "#ffb300"},
-#             'steps': [
-#                 {'range': [0, 30], 'color': "#e0e0e0"},
-#                 {'range': [30, 80], 'color': "#fff9c4"},
-#                 {'range': [80, 100], 'color': "#ffecb3"}
-#             ]
-#         }
-#     ), row=1, col=3)
-
-#     fig_demo.update_layout(height=300, margin=dict(t=50, b=0, l=0, r=0))
-#     st.plotly_chart(fig_demo, use_container_width=True)
-
-
-st.markdown("""<br><br>""", unsafe_allow_html=True)
 # --- KEY BENEFITS/CHALLENGES ---
-st.markdown('<div class="section">Abwägungen im Überblick</div>', unsafe_allow_html=True)
-st.markdown("""""")
-
-vorteile = [
-    ("Wirtschaftlichkeit", "Senkung der Betriebskosten, Steigerung der Produktivität und Erträge", "💰"),
-    ("Nachhaltigkeit", "Umweltschonend & verbesserter Ressourceneinsatz", "🌱"),
-    ("Autarkiegrad und Resilienz", "offline-fähig & anbieterunabhängig & potenziell stromnetzunabhängig & einsetzbar in abgelegenen Regionen", "📡"),
-    ("Kosteneffizienz und Energiesparsamkeit", "geringe Initialkosten & niedrige laufende Kosten & geringer Stromverbrauch der LoRaWAN-basierten Kameras", "💡"),
-    ("Schnelligkeit", "zeitnahe Daten 24/7 und Entscheidungen möglich", "⏱️"),
-    ("Datenhoheit", "lokale KI (Edge AI) & lokale Datenspeicherung", "🔒"),
-    ("Skalier- und Erweiterbarkeit", "modularer Aufbau & ergänzende Sensoren (z. B. Multisensor für Bodendaten) möglich & für kleine und große Betriebe geeignet", "🧩"),
-    ("Lebensmittelsicherheit", "sicherere Lebensmittel durch genaues, nachvollziehbares Monitoring", "🥗"),
-    ("Nachvollziehbarkeit", "Datengetriebene, transparente Entscheidungen möglich", "📚"),
-    ("Planbarkeit", "frühere und genauere Erntevorhersage sowie Einkaufbedarfs- und Umsatzprognosen", "🔮"),
-    ("Reproduzierbarkeit", "verfügbare, marktzugängliche Hardware & Open Source", "🔄"),
-]
-
-herausforderungen = [
-    ("Hardware", "Integration & Kommunikation der Komponenten (Sensorik, Gateway/Server, Zugriffsgeräte)", "🔗"),
-    ("KI-Modellgüte und -Kalibrierung", "Bilder und ML-Modelle müssen für geringe Rechenkapazität komprimiert werden & Modellanpassungen für unterschiedl. Anwendungsfälle (z. B. Früchte, Installationsorte) nötig", "🧠"),
-    #("Sensorzuverlässigkeit", "Kälte-/Wetterfestigkeit sind zu klären", "❄️"),
-    ("Datenqualität", "Störungen oder Ausfälle können zu Datenlücken führen", "📉"),
-    ("Echtzeitfähigkeit", "Pflanzenbeobachtung nur zu definierten Zeiten, um Energieverbrauch zu minimieren", "⏳"),
-    ("Wartung", "Batteriewechsel und ggfs. Updates vor Ort nötig", "🛠️"),
-    ("Akzeptanz", "Einweisung für Visualisierungen erforderlich & Annahme der Technik in Arbeitsprozesse", "👨‍🌾"),
-    ("Opt. Energieautarkie", "Energieverbrauch, Konfiguration von Sleepy Server, Solarmodulinstallation", "🔋"),
-]
-
-# Layout: Zwei große Spalten nebeneinander
-col_vorteile, col_herausforderungen = st.columns(2)
-
-with col_vorteile:
-    st.markdown(
-        '<div style="background-color:#e8f5e9; border-radius:12px; padding:0.5rem 1rem 0rem 1rem; margin-bottom:0.5rem;">'
-        '<h4 style="color:#2e7d32; margin-top:0;">✅ Nutzenpotenziale</h4>',
-        unsafe_allow_html=True
-    )
-    for label, value, icon in vorteile:
-        st.markdown(
-            f"""
-            <div style="display:flex;align-items:center;padding:0.5rem 0;">
-                <div style="font-size:1.5rem;width:2.5rem;text-align:center;">{icon}</div>
-                <div>
-                    <span style="font-weight:600;">{label}:</span>
-                    <span style="margin-left:0.5rem;">{value}</span>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-    st.markdown('</div>', unsafe_allow_html=True)
-
-with col_herausforderungen:
-    st.markdown(
-        '<div style="background-color:#ffebee; border-radius:12px; padding:0.5rem 1rem 0rem 1rem; margin-bottom:0.5rem;">'
-        '<h4 style="color:#b71c1c; margin-top:0;">⚠️ Herausforderungen</h4>',
-        unsafe_allow_html=True
-    )
-    for label, value, icon in herausforderungen:
-        st.markdown(
-            f"""
-            <div style="display:flex;align-items:center;padding:0.5rem 0;">
-                <div style="font-size:1.5rem;width:2.5rem;text-align:center;">{icon}</div>
-                <div>
-                    <span style="font-weight:600;">{label}:</span>
-                    <span style="margin-left:0.5rem;">{value}</span>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-    st.markdown('</div>', unsafe_allow_html=True)
+@st.fragment
+@profiled("abwaegungen")
+def render_abwaegungen():
+    # Nutzenpotenziale und Herausforderungen als zwei Spalten in einem Block
+    st.markdown(content.section_html("abwaegungen"), unsafe_allow_html=True)
+
+render_abwaegungen()
 
 # with col_right:
 #     # Diagramm: Energieverbrauch TinyML vs. klassisch
@@ -777,22 +281,6 @@ with col_herausforderungen:
 # with tabA:
 
 #     st.markdown("""
-#     <style>
-#     table {
-#         border-collapse: collapse;
-#         width: 100%;
-#     }
-
-#     th, td {
-#         border: 1px solid #ddd;
-#         padding: 8px;
-#         text-align: left;
-#     }
-
-#     th {
-#         background-color: #f2f2f2;
-#     }
-#     </style>
 #     <table>
 #         <tr>
 #             <th>Phase</th>
@@ -840,22 +328,6 @@ with col_herausforderungen:
 # with tabB:
 
 #     st.markdown("""
-#     <style>
-#     table {
-#         border-collapse: collapse;
-#         width: 100%;
-#     }
-
-#     th, td {
-#         border: 1px solid #ddd;
-#         padding: 8px;
-#         text-align: left;
-#     }
-
-#     th {
-#         background-color: #f2f2f2;
-#     }
-#     </style>
 #     <table>
 #         <tr>
 #             <th>Phase</th>
@@ -908,22 +380,34 @@ with col_herausforderungen:
 # --- DISCLAIMER & FOOTER ---
 #st.markdown('<div class="disclaimer">Hinweis: Dies ist ein Forschungsprojekt. Es verspricht keine kommerzielle Reife, sondern zielt auf Machbarkeitsnachweis, Dokumentation und Transfer.</div>', unsafe_allow_html=True)
 
-with open("Smarte und resiliente Landwirtschaft.pdf", "rb") as f:
-    pdf_bytes = f.read()
-
-pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
-
-st.markdown(f"""
-<div class="footer">
-    Smarte und resiliente Landwirtschaft via Edge AI - Präsentation für potenzielle Projektpartner im Rahmen von <a href="https://innowest-brandenburg.de/">InNoWest</a> | 
-    <a href="data:application/pdf;base64,{pdf_base64}" 
-       download="Smarte und resiliente Landwirtschaft.pdf"
-       style="text-decoration: none; color: #4CAF50; font-weight: 400;">
-       als PDF herunterladen
-    </a><br>
-    © 2025 | Technische Hochschule Brandenburg | Kontakt: <a href="mailto: eren.misirli@th-brandenburg.de">eren.misirli@th-brandenburg.de</a>
-</div>
-""", unsafe_allow_html=True)
+PDF_NAME = "Smarte und resiliente Landwirtschaft.pdf"
+
+@st.fragment
+@profiled("footer")
+def render_footer():
+    # PDF wird erst beim Klick ausgeliefert: als statische URL oder über einen Download-Button
+    pdf_url = download_url(PDF_NAME)
+    st.markdown(content.section_html("footer", pdf_url=pdf_url, pdf_name=PDF_NAME), unsafe_allow_html=True)
+
+    if not pdf_url:
+        try:
+            pdf_bytes = asset_cache.get(PDF_NAME).raw
+        except OSError:
+            pdf_bytes = None  # PDF fehlt im Deployment – Seite trotzdem anzeigen
+        if pdf_bytes:
+            _, col_pdf, _ = st.columns([2, 1, 2])
+            with col_pdf:
+                st.download_button(
+                    content.text("footer", "pdf_link"),
+                    data=pdf_bytes,
+                    file_name=PDF_NAME,
+                    mime="application/pdf",
+                    type="tertiary",
+                    width="stretch",
+                    on_click="ignore",
+                )
+
+render_footer()
 
 
 # --- FOOTER WITH LOGOS ---
@@ -992,3 +476,6 @@ st.markdown(f"""
 # """, unsafe_allow_html=True)
 
 #####################
+
+if show_diagnostics:
+    diagnostics.render_panel(show_diagnostics)
@@ -0,0 +1,52 @@
+"""Rechenzeit des Airtime-/Duty-Cycle-Rasters.
+
+    python benchmarks/bench_airtime.py
+
+Misst das volle Raster (alle SF × Nutzlasten 1–222 B × Intervalle ×
+Flottengrößen) und den Ausschnitt, den der Tab „Funkbudget“ pro Eingabe
+rechnet, und zeigt für eine Einzelnachricht im Stundentakt die maximale
+Flottengröße je SF.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from smartag import codec, lora  # noqa: E402
+from smartag.airtime_tab import FLEET_SIZES, INTERVALS  # noqa: E402
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-collision", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    payloads = np.arange(1, 223)
+    t, grid = timed(lambda: lora.plan(lora.SPREADING_FACTORS, payloads, INTERVALS, FLEET_SIZES))
+    print(f"volles Raster {grid['collision'].shape} = {grid['collision'].size:,} Zellen: {t * 1000:.1f} ms")
+    t, _ = timed(lambda: lora.plan([9], [codec.SINGLE_BYTES], INTERVALS, FLEET_SIZES), repeat=50)
+    print(f"Tab-Ausschnitt ({len(INTERVALS)} × {len(FLEET_SIZES)}): {t * 1000:.2f} ms")
+
+    print(f"\nEinzelnachricht ({codec.SINGLE_BYTES} B) stündlich, ≤ {args.max_collision:.0%} Kollision:")
+    for sf in lora.SPREADING_FACTORS:
+        fleet = lora.max_fleet(codec.SINGLE_BYTES, sf, 3600, args.max_collision)
+        print(f"  SF{sf:<3}{lora.airtime(codec.SINGLE_BYTES, sf) * 1000:>8.1f} ms{int(fleet):>10,} Kameras")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Binärcodec gegen JSON: Byte pro Nachricht, Airtime je SF, Kodierdurchsatz.
+
+    python benchmarks/bench_codec.py --messages 100000 --batch 24
+
+Vergleicht für synthetische Detektionen einer Kamera (stündliche Meldungen)
+kompaktes JSON, die 9-Byte-Einzelnachricht und Delta-kodierte Batches. Ein
+Batch wird auf die je SF erlaubte LoRaWAN-Nutzlast gekürzt.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from smartag import codec  # noqa: E402
+from smartag.lora import MAX_PAYLOAD, SPREADING_FACTORS, airtime  # noqa: E402
+
+
+def synthetic(rng, n, interval=3600):
+    return {
+        "ts": 1750000000 + np.arange(n) * interval + rng.integers(0, 30, n),
+        "fruit_count": np.maximum(12 + np.cumsum(rng.integers(-2, 3, n)), 0),
+        "ripeness": rng.integers(0, 4, n),
+        "confidence": rng.uniform(0.5, 1.0, n),
+        "battery": np.linspace(100, 60, n),
+        "stress": (rng.random(n) < 0.05).astype(int),
+    }
+
+
+def json_payload(columns, i):
+    return json.dumps({
+        "ts": int(columns["ts"][i]), "fruits": int(columns["fruit_count"][i]),
+        "ripeness": int(columns["ripeness"][i]), "conf": round(float(columns["confidence"][i]), 2),
+        "bat": int(columns["battery"][i]), "stress": int(columns["stress"][i]),
+    }, separators=(",", ":")).encode()
+
+
+def largest_batch(columns, limit):
+    """Größte Anzahl Messungen, deren Batch in ``limit`` Byte passt."""
+    lo, hi = 1, min(codec.MAX_BATCH, len(columns["ts"]))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if len(codec.encode_batch({k: v[:mid] for k, v in columns.items()})) <= limit:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=100_000, help="für den Durchsatztest")
+    parser.add_argument("--batch", type=int, default=24, help="Messungen pro Batch-Uplink (max. 255)")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    sample = synthetic(rng, args.batch)
+    json_bytes = np.mean([len(json_payload(sample, i)) for i in range(args.batch)])
+    batch = codec.encode_batch(sample)
+
+    print(f"JSON:            {json_bytes:6.1f} B/Nachricht")
+    print(f"Einzelnachricht: {codec.SINGLE_BYTES:6.1f} B/Nachricht")
+    print(f"Batch ({args.batch}):      {len(batch) / args.batch:6.1f} B/Nachricht ({len(batch)} B)")
+    print()
+    print(f"{'SF':>4}{'max B':>7}{'JSON ms':>10}{'bin ms':>10}{'Batch n':>9}{'Batch ms/Msg':>14}")
+    for sf in SPREADING_FACTORS:
+        limit = MAX_PAYLOAD[sf]
+        n = largest_batch(sample, limit)
+        size = len(codec.encode_batch({k: v[:n] for k, v in sample.items()}))
+        # * = JSON überschreitet die erlaubte Nutzlast
+        fits = "" if json_bytes <= limit else "*"
+        print(f"{sf:>4}{limit:>7}{airtime(json_bytes, sf) * 1000:>9.1f}{fits:1}"
+              f"{airtime(codec.SINGLE_BYTES, sf) * 1000:>10.1f}{n:>9}{airtime(size, sf) * 1000 / n:>14.1f}")
+
+    columns = synthetic(rng, args.messages)
+    start = time.perf_counter()
+    messages = codec.encode(columns)
+    t_enc = time.perf_counter() - start
+    start = time.perf_counter()
+    decoded = codec.decode(messages)
+    t_dec = time.perf_counter() - start
+    assert np.array_equal(decoded["ts"], columns["ts"])
+    start = time.perf_counter()
+    for i in range(min(args.messages, 20_000)):
+        json.loads(json_payload(columns, i))
+    t_json = (time.perf_counter() - start) / min(args.messages, 20_000) * args.messages
+    print()
+    print(f"{args.messages:,} Nachrichten: encode {t_enc * 1000:.0f} ms, decode {t_dec * 1000:.0f} ms "
+          f"(JSON dumps+loads hochgerechnet {t_json * 1000:.0f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
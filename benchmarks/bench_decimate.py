@@ -0,0 +1,62 @@
+"""Figure-Payload und Aufbauzeit mit und ohne Dezimierung.
+
+    python benchmarks/bench_decimate.py --days 30 90 --width 1200
+
+Erzeugt minütliche Sensorwerte über ``--days`` Tage, baut daraus eine
+Plotly-Figure (roh, LTTB, Min/Max) und misst Dezimierungszeit, Zeit für
+Figure-Aufbau plus JSON-Serialisierung (das, was ``st.plotly_chart`` an den
+Browser schickt) sowie die JSON-Größe.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from smartag import decimate  # noqa: E402
+
+
+def series(days, seed=0):
+    n = days * 24 * 60
+    rng = np.random.default_rng(seed)
+    t = np.datetime64("2025-04-01T00:00") + np.arange(n).astype("timedelta64[m]")
+    minutes = np.arange(n)
+    y = 45 + 15 * np.sin(2 * np.pi * minutes / 1440) + np.cumsum(rng.normal(0, 0.05, n)) + rng.normal(0, 1, n)
+    return t, y
+
+
+def figure_json(x, y):
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Scattergl(x=x, y=y, mode="lines"))
+    fig.update_layout(height=300)
+    return fig.to_json()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, nargs="+", default=[30, 90])
+    parser.add_argument("--width", type=int, default=decimate.DEFAULT_WIDTH_PX)
+    args = parser.parse_args(argv)
+
+    print(f"{'Tage':>5}{'Methode':>9}{'Punkte':>10}{'Dezim. ms':>11}{'Figure ms':>11}{'JSON KiB':>10}")
+    for days in args.days:
+        x, y = series(days)
+        for method in ("roh", "lttb", "minmax"):
+            start = time.perf_counter()
+            xs, ys = (x, y) if method == "roh" else decimate.decimate(x, y, args.width, method)
+            t_dec = time.perf_counter() - start
+            start = time.perf_counter()
+            payload = figure_json(xs, ys)
+            t_fig = time.perf_counter() - start
+            print(f"{days:>5}{method:>9}{len(xs):>10}{t_dec * 1000:>11.1f}{t_fig * 1000:>11.1f}"
+                  f"{len(payload) / 1024:>10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Fast gleiche Kamerabilder unterdrücken: pHash-Durchsatz, Schwelle, Ersparnis.
+
+    python benchmarks/bench_dedup.py --cameras 20 --captures 48 --thresholds 0 2 4 6 8 10 12
+
+Erzeugt mit ``FleetSimulator.frames_for`` einen synthetischen Bildbestand
+(Standard: 20 Kameras × 48 stündliche Aufnahmen, 320×240 JPEG). Zwischen zwei
+Aufnahmen schwanken Tageslicht und Sensorrauschen; gelegentlich reift eine
+Frucht – das sind die Änderungen, die nicht verloren gehen sollen. Gemessen:
+
+* pHash je Bild einzeln gegen den ganzen Bestand als Batch
+* je Schwelle: unterdrückte Bilder, eingesparte Bytes und verpasste
+  Änderungen (unterdrückte Bilder, in denen eine Frucht gereift ist)
+* die ganze Strecke: Simulator mit Filter auf der Kamera (Delta-Markierung)
+  → ``IngestService`` mit Filter auf dem Gateway → Schnappschuss-Ordner;
+  mit ``--gateway-only`` filtert nur das Gateway (spart Speicher, keinen Funk)
+
+„Verpasst“ ist der Preis der Schwelle; ``--max-skipped`` (Standard
+``dedup.DEFAULT_MAX_SKIPPED``) begrenzt ihn.
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from smartag import dedup  # noqa: E402
+from smartag.fleet import FleetSimulator  # noqa: E402
+from smartag.ingest import IngestService  # noqa: E402
+from smartag.storage import DetectionStore  # noqa: E402
+
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def corpus(args):
+    """Bilder in Aufnahmereihenfolge mit Kamera-ID und Maske „Szene verändert“."""
+    fleet = FleetSimulator(args.cameras, interval=args.interval, frame_size=(args.width, args.width * 3 // 4),
+                           ripen_rate=args.ripen_rate)
+    idx = np.arange(args.cameras)
+    frames, cameras, changed = [], [], []
+    for k in range(args.captures):
+        batch, mask = fleet.frames_for(idx, k * args.interval)
+        frames += batch
+        cameras.append(fleet.ids[idx])
+        changed.append(mask)
+    return frames, np.concatenate(cameras), np.concatenate(changed)
+
+
+async def pipeline(args, root, db_path):
+    fleet = FleetSimulator(args.cameras, interval=args.interval, speedup=args.speedup,
+                           frame_size=(args.width, args.width * 3 // 4), ripen_rate=args.ripen_rate)
+    store = DetectionStore(db_path)
+    camera = dedup.NearDuplicateFilter(args.threshold, mode="delta", max_skipped=args.max_skipped)
+    gateway = dedup.NearDuplicateFilter(args.threshold, max_skipped=args.max_skipped)
+    service = IngestService(store, fleet.registry(), dedup=gateway, frames_root=root)
+    await service.start()
+    await fleet.run(service.submit, args.duration, send_frame=service.submit_frame,
+                    dedup=None if args.gateway_only else camera)
+    await service.stop()
+    store.close()
+    return fleet.stats(), camera.report(), service.metrics.snapshot()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cameras", type=int, default=20)
+    parser.add_argument("--captures", type=int, default=48, help="Aufnahmen je Kamera")
+    parser.add_argument("--interval", type=float, default=3600, help="Abstand der Aufnahmen in s")
+    parser.add_argument("--width", type=int, default=320, help="Bildbreite (4:3)")
+    parser.add_argument("--ripen-rate", type=float, default=0.02, help="Reifewahrscheinlichkeit je Frucht und Aufnahme")
+    parser.add_argument("--thresholds", type=int, nargs="+", default=[0, 2, 4, 6, 8, 10, 12])
+    parser.add_argument("--threshold", type=int, default=dedup.DEFAULT_THRESHOLD, help="Schwelle der Strecke")
+    parser.add_argument("--max-skipped", type=int, default=dedup.DEFAULT_MAX_SKIPPED,
+                        help="spätestens danach ein Bild behalten")
+    parser.add_argument("--gateway-only", action="store_true", help="Strecke ohne Filter auf der Kamera")
+    parser.add_argument("--speedup", type=float, default=3600, help="Simulationszeit / Echtzeit der Strecke")
+    parser.add_argument("--duration", type=float, default=5.0, help="Sekunden Echtzeit der Strecke")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    frames, cameras, changed = corpus(args)
+    n = len(frames)
+    total = sum(map(len, frames))
+    print(f"{n:,} Bilder ({total / n / 1024:.1f} KiB im Mittel), {int(changed.sum())} mit gereifter Frucht, "
+          f"erzeugt in {time.perf_counter() - start:.1f} s")
+
+    single, _ = timed(lambda: [dedup.hash_frames([f]) for f in frames], repeat=1)
+    batch, hashes = timed(lambda: dedup.hash_frames(frames), repeat=1)
+    print(f"pHash einzeln {single / n * 1000:.2f} ms/Bild, im Batch {batch / n * 1000:.2f} ms/Bild "
+          f"({n / batch:,.0f} Bilder/s)")
+
+    print(f"\n{'Schwelle':>8}{'unterdrückt':>13}{'gespart drop':>14}{'gespart delta':>15}{'verpasst':>10}")
+    for threshold in args.thresholds:
+        drop = dedup.NearDuplicateFilter(threshold, max_skipped=args.max_skipped)
+        keep = np.array([f is not None for f in drop.filter(cameras, frames, hashes)])
+        delta = dedup.NearDuplicateFilter(threshold, mode="delta", max_skipped=args.max_skipped)
+        delta.filter(cameras, frames, hashes)
+        missed = int((changed & ~keep).sum())
+        r, d = drop.report(), delta.report()
+        print(f"{threshold:>8}{r['suppressed'] / n:>12.0%} {r['saved_share']:>13.1%}{d['saved_share']:>15.1%}"
+              f"{missed:>6} / {int(changed.sum())}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "snapshots"
+        stats, camera, snap = asyncio.run(pipeline(args, root, Path(tmp) / "ingest.db"))
+        written = sum(p.stat().st_size for p in root.rglob("*.jpg"))
+    print(f"\nStrecke (Schwelle {args.threshold}, {args.duration:.0f} s bei {args.speedup:.0f}× Zeitraffer):")
+    if not args.gateway_only:
+        print(f"  Kamera: {camera['frames']:,} Bilder, {camera['suppressed']:,} als Delta-Markierung; "
+              f"Funk {camera['bytes_out'] / 1024:,.0f} statt {camera['bytes_in'] / 1024:,.0f} KiB "
+              f"(−{camera['saved_share']:.0%})")
+    print(f"  Gateway: {snap['frames']:,} empfangen, {snap['frames_marked']:,} Markierungen, "
+          f"{snap['frames_suppressed']:,} unterdrückt, {snap['frames_stored']:,} gespeichert "
+          f"({written / 1024:,.0f} KiB auf der Karte)")
+    print(f"  Messwerte nebenher: {stats['sent']:,} Uplinks, {snap['stored']:,} gespeichert")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""Laufzeit der Energieautarkie-Simulation über viele Konfigurationen.
+
+    python benchmarks/bench_energy.py --configs 10000 50000
+
+Simuliert für jede Größe ein Jahr (8760 Stunden) des Gateway-Profils auf
+synthetischer Einstrahlung und gibt Laufzeit, Konfigurationen pro Sekunde und
+die Größe der Pareto-Front (Verfügbarkeit ≥ 99 %) aus. ``--scalar`` rechnet
+zum Vergleich einige Konfigurationen einzeln in reinem Python.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from smartag import energy  # noqa: E402
+
+
+def scalar_simulate(panel_wp, battery_wh, duty, profile, ghi):
+    capacity = battery_wh * energy.DEPTH_OF_DISCHARGE
+    load = duty * profile.awake_w + (1 - duty) * profile.sleep_w
+    soc, outages = capacity, 0
+    for g in ghi:
+        soc += panel_wp / 1000 * g * energy.PERFORMANCE_RATIO * energy.CHARGE_EFFICIENCY - load
+        if soc < 0:
+            outages += 1
+            soc = 0.0
+        soc = min(soc, capacity)
+    return 1 - outages / len(ghi)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--configs", type=int, nargs="+", default=[1000, 10_000, 50_000])
+    parser.add_argument("--profile", choices=list(energy.PROFILES), default="gateway")
+    parser.add_argument("--scalar", type=int, default=20, help="Konfigurationen für den Python-Vergleich")
+    args = parser.parse_args(argv)
+
+    profile = energy.PROFILES[args.profile]
+    ghi = energy.synthetic_irradiance()
+    rng = np.random.default_rng(0)
+    for n in args.configs:
+        configs = {
+            "panel_wp": rng.uniform(5, 120, n),
+            "battery_wh": rng.uniform(20, 1000, n),
+            "duty": rng.uniform(0.05, 1.0, n),
+        }
+        start = time.perf_counter()
+        result = energy.simulate(configs, profile, ghi)
+        seconds = time.perf_counter() - start
+        front = energy.pareto_front(result["cost"], result["autonomy_days"], result["availability"] >= 0.99)
+        print(f"{n:>8,} Konfigurationen: {seconds:6.2f} s ({n / seconds:>10,.0f}/s), Pareto-Front {len(front)}")
+
+    if args.scalar:
+        configs = {k: v[:args.scalar] for k, v in configs.items()}
+        start = time.perf_counter()
+        scalar = [scalar_simulate(configs["panel_wp"][i], configs["battery_wh"][i], configs["duty"][i], profile, ghi)
+                  for i in range(args.scalar)]
+        per_config = (time.perf_counter() - start) / args.scalar
+        vectorized = energy.simulate(configs, profile, ghi)["availability"]
+        assert np.allclose(scalar, vectorized)
+        print(f"reines Python: {per_config * 1000:.1f} ms/Konfiguration "
+              f"(10 000 Konfigurationen ≈ {per_config * 10_000:.0f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Index-Scan, Seitenabfragen und Thumbnails der Schnappschuss-Galerie.
+
+    python benchmarks/bench_gallery.py --cameras 40 --days 21 --per-day 24
+    python benchmarks/bench_gallery.py --root snapshots    # vorhandener Ordnerbaum
+
+Legt einen synthetischen Ordnerbaum ``<kamera>/<ort>/<tag>/`` an (Standard:
+20 160 Bilder, 320×240) und misst:
+
+* ersten Scan (Hash und Abmessungen jeder Datei) und erneuten Scan ohne
+  Änderungen bzw. mit einem neuen Tagesordner
+* zum Vergleich: rekursives Listen und Sortieren aller Dateien, wie es eine
+  Galerie ohne Index bei jedem Rerun täte
+* Seitenabfragen aus dem Index, vorn und tief im Bestand
+* eine Seite Thumbnails kalt (Thread-Pool) und warm (LRU-Cache), und das
+  Vor- und Zurückblättern vieler Seiten mit kleinem Cache (Verdrängung,
+  Speichergrenze)
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from smartag.gallery import SnapshotIndex, ThumbnailCache, write_demo  # noqa: E402
+
+PER_PAGE = 24
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def walk_all(root):
+    paths = []
+    for folder, _, files in os.walk(root):
+        paths += [os.path.join(folder, f) for f in files if f.endswith(".jpg")]
+    return sorted(paths, reverse=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cameras", type=int, default=40)
+    parser.add_argument("--days", type=int, default=21)
+    parser.add_argument("--per-day", type=int, default=24)
+    parser.add_argument("--root", help="vorhandener Schnappschuss-Ordner statt synthetischer Bilder")
+    parser.add_argument("--cache-mib", type=float, default=2.0, help="Thumbnail-Cache beim Durchblättern")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(args.root or Path(tmp) / "snapshots")
+        if not args.root:
+            start = time.perf_counter()
+            n = write_demo(root, args.cameras, args.days, args.per_day, width=320, height=240)
+            print(f"{n:,} Bilder erzeugt in {time.perf_counter() - start:.1f} s")
+
+        index = SnapshotIndex(root, index_path=Path(tmp) / "index.db")
+        stats = index.scan()
+        print(f"Erster Scan: {stats['indexed']:,} Bilder, {stats['folders']:,} Ordner in {stats['seconds']:.2f} s "
+              f"({stats['indexed'] / stats['seconds']:,.0f} Bilder/s)")
+        t, _ = timed(index.scan)
+        print(f"Erneuter Scan ohne Änderung: {t * 1000:.1f} ms")
+        t, paths = timed(lambda: walk_all(root), repeat=3)
+        print(f"Zum Vergleich os.walk + sortieren: {len(paths):,} Dateien in {t * 1000:.0f} ms (je Rerun)")
+
+        first = index.page(0, 1)[0]
+        new_day = root / first["camera"] / first["location"] / "2099-01-01"
+        new_day.mkdir()
+        for i in range(args.per_day):
+            shutil.copy(index.absolute(first), new_day / f"{i:06d}.jpg")
+        stats = index.scan()
+        print(f"Scan mit neuem Tagesordner: {stats['changed']} Ordner gelistet, {stats['indexed']} Bilder "
+              f"in {stats['seconds'] * 1000:.1f} ms")
+
+        total = index.count()
+        camera = first["camera"]
+        queries = {
+            "alle, Seite 1": lambda: index.page(0, PER_PAGE),
+            "alle, letzte Seite": lambda: index.page((total - 1) // PER_PAGE, PER_PAGE),
+            "eine Kamera, Seite 10": lambda: index.page(9, PER_PAGE, camera=camera),
+            "ein Tag, Seite 1": lambda: index.page(0, PER_PAGE, day=first["day"]),
+            "Facetten (Kamera, Tag)": lambda: (index.facets("camera"), index.facets("day", camera=camera)),
+        }
+        for label, fn in queries.items():
+            t, _ = timed(fn)
+            print(f"{label:<26}{t * 1000:>8.2f} ms")
+
+        thumbs = ThumbnailCache()
+        page = [(r["hash"], index.absolute(r)) for r in index.page(3, PER_PAGE)]
+        start = time.perf_counter()
+        data = thumbs.get_many(page)
+        cold = time.perf_counter() - start
+        warm, _ = timed(lambda: thumbs.get_many(page))
+        print(f"Thumbnails einer Seite: kalt {cold * 1000:.0f} ms, warm {warm * 1000:.2f} ms, "
+              f"{sum(map(len, data)) / len(data) / 1024:.1f} KiB je Thumbnail")
+
+        small = ThumbnailCache(max_bytes=int(args.cache_mib * 1024 * 1024))
+        pages = min(40, total // PER_PAGE)
+        start = time.perf_counter()
+        for number in list(range(pages)) + list(reversed(range(pages))):
+            small.get_many([(r["hash"], index.absolute(r)) for r in index.page(number, PER_PAGE)])
+        elapsed = time.perf_counter() - start
+        s = small.stats()
+        print(f"{pages} Seiten vor und zurück geblättert in {elapsed:.1f} s: {s['hits']} Treffer, "
+              f"{s['misses']} erzeugt, {s['evictions']} verdrängt, {s['bytes'] / 1024 / 1024:.2f} "
+              f"von {s['max_bytes'] / 1024 / 1024:.1f} MiB")
+        index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
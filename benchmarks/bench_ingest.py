@@ -0,0 +1,113 @@
+"""Ab wie vielen Kameras pro Gateway fällt der Ingest zurück?
+
+    python benchmarks/bench_ingest.py --cameras 1000 5000 20000 --interval 3600 --speedup 60
+
+Für jede Flottengröße läuft der Simulator ``--duration`` Sekunden gegen die
+Ingest-Pipeline (direkt über ``submit`` mit Backpressure oder per UDP, das bei
+voller Queue verwirft) und schreibt in eine temporäre SQLite-Datei. Berichtet
+werden angebotene und gespeicherte Uplinks pro Sekunde, maximale Queue-Tiefe,
+Commit-Latenz und Verluste. ``keep_up`` < 0,95 heißt: die Pipeline hält nicht
+mit. Die tragbare Kameraanzahl bei Echtzeit ergibt sich aus
+``stored/s × Intervall``.
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from smartag.fleet import FleetSimulator  # noqa: E402
+from smartag.ingest import IngestService, UdpSource, udp_datagram  # noqa: E402
+from smartag.rollups import Rollups  # noqa: E402
+from smartag.storage import DetectionStore  # noqa: E402
+
+
+async def run_one(args, n_cameras, db_path):
+    store = DetectionStore(db_path)
+    if args.rollups:
+        Rollups(store)
+    fleet = FleetSimulator(n_cameras, interval=args.interval, speedup=args.speedup, readings=args.readings)
+    service = IngestService(store, fleet.registry(), queue_size=args.queue)
+    await service.start()
+
+    transport = None
+    if args.transport == "udp":
+        transport = await UdpSource.listen(service, port=0)
+        addr = transport.get_extra_info("sockname")
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+
+        async def send(camera_id, payload):
+            sock.sendto(udp_datagram(camera_id, payload), addr)
+            # dem Event-Loop Zeit zum Empfangen geben
+            if fleet.sent % 32 == 0:
+                await asyncio.sleep(0)
+    else:
+        send = service.submit
+
+    start = time.perf_counter()
+    await fleet.run(send, args.duration)
+    if transport is not None:
+        await asyncio.sleep(0.2)
+        transport.close()
+        sock.close()
+    await service.stop()
+    total = time.perf_counter() - start
+
+    snap = service.metrics.snapshot()
+    result = fleet.stats()
+    result.update({
+        "stored": snap["stored"],
+        "stored_per_s": snap["stored"] / total,
+        "drain_s": total - fleet.elapsed,
+        # bei UDP gehen Datagramme auch schon im Socket-Puffer des Kernels verloren
+        "dropped": snap["dropped"] + max(fleet.sent - snap["received"], 0),
+        "errors": snap["errors"],
+        "max_depth": snap["max_depth"]["uplinks"],
+        "commits": snap["commits"],
+        "commit_ms_p95": snap.get("commit_ms_p95", 0.0),
+    })
+    store.close()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cameras", type=int, nargs="+", default=[10_000, 100_000, 1_000_000, 5_000_000])
+    parser.add_argument("--interval", type=float, default=3600, help="Sendeintervall je Kamera in s")
+    parser.add_argument("--speedup", type=float, default=60, help="Simulationszeit / Echtzeit")
+    parser.add_argument("--readings", type=int, default=1, help="Messungen pro Uplink (>1: Delta-Batch)")
+    parser.add_argument("--duration", type=float, default=5.0, help="Sekunden Echtzeit pro Lauf")
+    parser.add_argument("--queue", type=int, default=10_000)
+    parser.add_argument("--transport", choices=("direct", "udp"), default="direct")
+    parser.add_argument("--rollups", action="store_true", help="Rollups beim Schreiben pflegen")
+    parser.add_argument("--json", help="Ergebnisse zusätzlich als JSON schreiben")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'Kameras':>9}{'Soll/s':>10}{'gesendet/s':>12}{'gespeichert/s':>15}{'keep_up':>9}"
+          f"{'max Queue':>11}{'verworfen':>11}{'Commit p95':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, n in enumerate(args.cameras):
+            r = asyncio.run(run_one(args, n, Path(tmp) / f"ingest-{i}.db"))
+            results.append(r)
+            flag = "" if r["keep_up"] >= 0.95 and not r["dropped"] else "  ← fällt zurück"
+            print(f"{n:>9,}{r['offered_per_s']:>10,.0f}{r['sent_per_s']:>12,.0f}{r['stored_per_s']:>15,.0f}"
+                  f"{r['keep_up']:>9.2f}{r['max_depth']:>11,}{r['dropped']:>11,}{r['commit_ms_p95']:>10.1f}ms{flag}")
+
+    best = max(r["stored_per_s"] for r in results)
+    print(f"\nMax. Durchsatz {best:,.0f} Uplinks/s → bei {args.interval:.0f} s Intervall "
+          f"≈ {best * args.interval:,.0f} Kameras pro Gateway (nur Ingest, ohne Grenzen des Funkkanals)")
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""Lasttest mit vielen gleichzeitigen Betrachtern gegen die laufende App.
+
+    python benchmarks/bench_load.py --sessions 1 10 25 50 --reruns 5
+    python benchmarks/bench_load.py --url http://pi.local:8501 --pid 1234
+
+Öffnet stufenweise N Websocket-Sessions (wie Browser-Tabs), hält sie offen
+und misst je Stufe:
+
+* RSS des Serverprozesses (nach ``gc.collect()``) und den Zuwachs pro
+  zusätzlicher Session gegenüber der vorigen Stufe
+* Latenz des ersten Laufs und von Reruns aller Sessions gleichzeitig (p50/p95/p99)
+* Websocket-Bytes pro Session (erster Lauf, Rerun, Live-Demo-Fragment pro Sekunde)
+* über ``?diag=memory``: große ``str``/``bytes``-Objekte mit Anzahl Kopien und die
+  je Session zusätzlich gehaltenen Objekte nach Typ
+
+Ohne ``--url`` wird ein eigener Server gestartet. Die RSS meldet der Server
+selbst über ``?diag=memory``; nur wenn das fehlschlägt, wird sie über ``--pid``
+aus ``/proc`` gelesen. Mit ``--url`` braucht es daher ``--token`` oder
+``--pid`` – sonst wäre die gemessene RSS die des Lasttests selbst. Das Diagnose-Token (``SMARTAG_DIAG_TOKEN``) erzeugt
+der Test für den eigenen Server selbst; bei ``--url`` kommt es aus ``--token``
+oder der Umgebung.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import secrets
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from smartag.memory import rss_bytes  # noqa: E402
+from smartag.profiling import percentile  # noqa: E402
+from smartag.wsclient import Session, local_server, wait_healthy  # noqa: E402
+
+SCRIPT = ROOT / "PraesentationSmartAg.py"
+MIB = 1024 * 1024
+
+
+async def memory_report(url, token):
+    session = await Session.connect(url)
+    try:
+        run = await session.rerun(query_string=f"diag=memory&token={token}")
+    finally:
+        session.close()
+    body = run.body('"rss"')
+    return json.loads(body) if body else None
+
+
+def per_session_types(before, after, added, top=8):
+    if not before or not after or not added:
+        return {}
+    diff = {t: (after["types"].get(t, 0) - before["types"].get(t, 0)) / added for t in after["types"]}
+    return dict(sorted(((t, round(v, 1)) for t, v in diff.items() if v >= 1), key=lambda kv: -kv[1])[:top])
+
+
+async def open_sessions(url, count):
+    async def one():
+        session = await Session.connect(url)
+        run = await session.rerun()
+        return session, run
+
+    return await asyncio.gather(*(one() for _ in range(count)))
+
+
+def server_rss(report, pid):
+    if report:
+        return report["rss"]
+    if pid is None:
+        raise RuntimeError("Speicherbericht nicht lesbar (Token?) und keine --pid für /proc")
+    return rss_bytes(pid)
+
+
+async def load_test(args, url, pid, token):
+    # eine Session vorab: Importe, Caches und Assets zählen zur geteilten Grundlast
+    warm, _ = (await open_sessions(url, 1))[0]
+    warm.close()
+    before = await memory_report(url, token)
+    prev_rss = server_rss(before, pid)
+    prev_sessions = 0
+
+    sessions, first_runs, results = [], [], []
+    for target in args.sessions:
+        added = await open_sessions(url, target - len(sessions))
+        sessions += [s for s, _ in added]
+        first_runs += [r for _, r in added]
+        latencies, rerun_bytes = [], []
+        for _ in range(args.reruns):
+            runs = await asyncio.gather(*(s.rerun() for s in sessions))
+            latencies += [r.finished for r in runs]
+            rerun_bytes += [r.nbytes for r in runs]
+
+        live = await asyncio.gather(*(s.drain(args.drain) for s in sessions))
+        after = await memory_report(url, token)
+        rss = server_rss(after, pid)
+        results.append({
+            "sessions": len(sessions),
+            "rss_mib": rss / MIB,
+            "rss_per_session_kib": (rss - prev_rss) / (len(sessions) - prev_sessions) / 1024,
+            "first_p50": percentile([r.finished for r in first_runs], 0.5),
+            "first_p95": percentile([r.finished for r in first_runs], 0.95),
+            "rerun_p50": percentile(latencies, 0.5),
+            "rerun_p95": percentile(latencies, 0.95),
+            "rerun_p99": percentile(latencies, 0.99),
+            "first_kib": sum(r.nbytes for r in first_runs) / len(first_runs) / 1024,
+            "rerun_kib": sum(rerun_bytes) / len(rerun_bytes) / 1024,
+            "live_kib_s": sum(live) / len(sessions) / args.drain / 1024,
+            "large": after["large"] if after else [],
+            "per_session_types": per_session_types(before, after, len(sessions)),
+            "session_state_bytes": [s["bytes"] for s in after["sessions"]] if after else [],
+        })
+        prev_rss, prev_sessions = rss, len(sessions)
+    for session in sessions:
+        session.close()
+    return results
+
+
+def print_results(results):
+    print(f"{'Sessions':>9}{'RSS MiB':>9}{'KiB/Sess':>10}{'1. Lauf p50':>12}{'p95':>7}"
+          f"{'Rerun p50':>10}{'p95':>7}{'p99':>7}{'KiB 1.':>8}{'KiB Rerun':>10}{'Live KiB/s':>11}")
+    for r in results:
+        print(f"{r['sessions']:>9}{r['rss_mib']:>9.1f}{r['rss_per_session_kib']:>10.0f}"
+              f"{r['first_p50']:>11.2f}s{r['first_p95']:>6.2f}s{r['rerun_p50']:>9.2f}s{r['rerun_p95']:>6.2f}s"
+              f"{r['rerun_p99']:>6.2f}s{r['first_kib']:>8.1f}{r['rerun_kib']:>10.1f}{r['live_kib_s']:>11.2f}")
+    last = results[-1]
+    print(f"\nGroße Objekte bei {last['sessions']} Sessions (Kopien > 1 = nicht geteilt):")
+    if not last["large"]:
+        print("  keine (≥ 64 KiB)")
+    for obj in last["large"][:10]:
+        print(f"  {obj['type']:<6}{obj['bytes'] / 1024:>9.0f} KiB  ×{obj['copies']:<4}{obj['preview']}")
+    print("Zusätzliche Objekte je Session:", last["per_session_types"] or "–")
+    if last["session_state_bytes"]:
+        print(f"Session-State je Session: max {max(last['session_state_bytes']) / 1024:.1f} KiB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 25, 50])
+    parser.add_argument("--reruns", type=int, default=3, help="Reruns aller Sessions je Stufe")
+    parser.add_argument("--drain", type=float, default=4.0, help="Sekunden Live-Demo-Verkehr je Stufe")
+    parser.add_argument("--url", help="laufende App statt eigenem Server")
+    parser.add_argument("--pid", type=int, help="PID des Servers bei --url (für RSS)")
+    parser.add_argument("--token", default=os.environ.get("SMARTAG_DIAG_TOKEN", ""),
+                        help="Diagnose-Token des Servers bei --url")
+    parser.add_argument("--json", help="Ergebnisse als JSON schreiben")
+    args = parser.parse_args(argv)
+
+    if args.url:
+        if not args.pid and not args.token:
+            parser.error("--url braucht --pid oder --token (RSS des Servers)")
+        wait_healthy(args.url)
+        results = asyncio.run(load_test(args, args.url, args.pid, args.token))
+    else:
+        token = secrets.token_urlsafe(16)
+        with local_server(SCRIPT, env={"SMARTAG_DIAG_TOKEN": token}) as (url, proc, _):
+            wait_healthy(url)
+            results = asyncio.run(load_test(args, url, proc.pid, token))
+    print_results(results)
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Bounding-Box-Komposite für einen Tag Kamerabilder: naiv vs. Batch mit Cache.
+
+    python benchmarks/bench_overlay.py --cameras 20 --per-day 48 --width 1280
+
+Erzeugt einen Tag synthetischer Bilder mit Detektionen (Standard: 960 Bilder,
+1280×960) und misst:
+
+* naiv: Original voll dekodieren, jede Box mit PIL auf das Original zeichnen,
+  verkleinern, kodieren – Bild für Bild
+* ``OverlayRenderer`` kalt: verkleinert dekodieren (Thread-Pool), Rahmen je
+  Batch per NumPy, Beschriftung als wiederverwendete Bildstücke
+* warm (alles aus dem LRU-Cache) und nach neu gerechneten Detektionen für
+  10 % der Bilder (nur deren Komposite entstehen neu)
+* Bytes zum Browser je Bild: Komposit gegen Originaldatei
+"""
+
+import argparse
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from smartag import overlay  # noqa: E402
+from smartag.gallery import SnapshotIndex, write_demo  # noqa: E402
+from smartag.rollups import RIPENESS_CLASSES  # noqa: E402
+
+
+def render_naive(path, size=overlay.PREVIEW_SIZE):
+    with Image.open(path) as im:
+        im = im.convert("RGB")
+    det = overlay.parse(overlay.read_sidecar(path)[1])
+    draw = ImageDraw.Draw(im)
+    scale = max(im.size) / size
+    font = overlay._font().font_variant(size=int(overlay.FONT_SIZE * scale))
+    for box, label, ripeness, confidence in zip(det["box"], det["label"], det["ripeness"], det["confidence"]):
+        x0, y0, x1, y1 = box * np.array([im.width, im.height, im.width, im.height])
+        color = tuple(overlay.RIPENESS_COLORS[ripeness].tolist())
+        draw.rectangle((x0, y0, x1, y1), outline=color, width=int(overlay.LINE_WIDTH * scale))
+        draw.text((x0, y0 - font.size - 2), f"{label} {RIPENESS_CLASSES[ripeness]} {confidence:.0%}",
+                  fill=(0, 0, 0), font=font)
+    im.thumbnail((size, size))
+    out = io.BytesIO()
+    im.save(out, "JPEG", quality=80)
+    return out.getvalue()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cameras", type=int, default=20)
+    parser.add_argument("--per-day", type=int, default=48)
+    parser.add_argument("--width", type=int, default=1280, help="Bildbreite (4:3)")
+    parser.add_argument("--naive", type=int, default=100, help="Bilder für die naive Messung (hochgerechnet)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "snapshots"
+        start = time.perf_counter()
+        n = write_demo(root, args.cameras, days=1, per_day=args.per_day,
+                       width=args.width, height=args.width * 3 // 4)
+        print(f"{n} Bilder {args.width}×{args.width * 3 // 4} erzeugt in {time.perf_counter() - start:.1f} s")
+        index = SnapshotIndex(root, index_path=Path(tmp) / "index.db")
+        index.scan()
+        rows = index.page(0, n)
+        items = [(row["hash"], index.absolute(row)) for row in rows]
+
+        sample = items[:args.naive]
+        start = time.perf_counter()
+        for _, path in sample:
+            render_naive(path)
+        naive = (time.perf_counter() - start) / len(sample)
+        print(f"naiv (Bild für Bild, volle Auflösung): {naive * 1000:.1f} ms/Bild, "
+              f"Tag hochgerechnet {naive * n:.1f} s")
+
+        renderer = overlay.OverlayRenderer(max_bytes=256 * 1024 * 1024)
+        start = time.perf_counter()
+        composites = renderer.render_many(items)
+        cold = time.perf_counter() - start
+        print(f"OverlayRenderer kalt: {cold:.2f} s für {n} Bilder ({cold / n * 1000:.1f} ms/Bild, "
+              f"{naive * n / cold:.1f}× schneller)")
+        start = time.perf_counter()
+        renderer.render_many(items)
+        print(f"OverlayRenderer warm: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        # Modell rechnet 10 % der Bilder neu: andere Konfidenzen, neue Version
+        rng = np.random.default_rng(1)
+        redo = rng.choice(n, n // 10, replace=False)
+        for i in redo:
+            path = items[i][1]
+            det = overlay.parse(overlay.read_sidecar(path)[1])
+            overlay.write_detections(path, [
+                {"box": box.tolist(), "label": label, "ripeness": int(r), "confidence": float(rng.uniform(0.6, 0.99))}
+                for box, label, r in zip(det["box"], det["label"], det["ripeness"])
+            ], model="fruitnet-demo-v2")
+        before = renderer.stats()["misses"]
+        start = time.perf_counter()
+        renderer.render_many(items)
+        print(f"nach neuen Detektionen für {len(redo)} Bilder: {time.perf_counter() - start:.2f} s, "
+              f"{renderer.stats()['misses'] - before} Komposite neu")
+
+        original = sum(row["size"] for row in rows) / n
+        preview = sum(map(len, composites)) / n
+        print(f"zum Browser je Bild: {preview / 1024:.1f} KiB Komposit statt {original / 1024:.1f} KiB Original")
+        index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""Render-Kosten und Payload eines Durchlaufs von ``PraesentationSmartAg.py``.
+
+    python benchmarks/bench_render.py -n 20 --mode static -o bench.json
+    python benchmarks/bench_render.py -n 20 --baseline bench.json
+
+Führt das Skript headless über ``streamlit.testing.v1.AppTest`` aus und misst
+je Rerun Wall-Clock-Zeit, Peak-RSS, per ``tracemalloc`` allokierte Bytes und
+die Größe der an den Client gesendeten Deltas – insgesamt und je Abschnitt
+(über ``smartag.profiling.section``). Mit ``--baseline`` wird gegen eine
+gespeicherte Ergebnisdatei verglichen; bei Regressionen über ``--tolerance``
+endet das Skript mit Exit-Code 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from smartag import profiling  # noqa: E402
+from smartag.profiling import percentile  # noqa: E402
+
+SCRIPT = ROOT / "PraesentationSmartAg.py"
+
+
+def summarize(values):
+    return {
+        "mean": statistics.fmean(values),
+        "p50": percentile(values, 0.5),
+        "p95": percentile(values, 0.95),
+        "min": min(values),
+        "max": max(values),
+    }
+
+
+def delta_bytes(node):
+    """Summe der Element-Protos im Baum (entspricht den gesendeten Deltas)."""
+    total = 0
+    proto = getattr(node, "proto", None)
+    if proto is not None and hasattr(proto, "ByteSize"):
+        total += proto.ByteSize()
+    children = getattr(node, "children", None)
+    if isinstance(children, dict):
+        total += sum(delta_bytes(c) for c in children.values())
+    return total
+
+
+def run(n, warmup, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    sections = defaultdict(lambda: {"seconds": [], "bytes": [], "markdown_calls": []})
+
+    def record(name, seconds, nbytes, calls):
+        sections[name]["seconds"].append(seconds)
+        sections[name]["bytes"].append(nbytes)
+        sections[name]["markdown_calls"].append(calls)
+
+    at = AppTest.from_file(str(SCRIPT), default_timeout=timeout)
+    for _ in range(warmup):
+        at.run()
+
+    runs = []
+    profiling.set_recorder(record)
+    tracemalloc.start()
+    try:
+        for _ in range(n):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            start = time.perf_counter()
+            at.run()
+            wall = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            if at.exception:
+                raise RuntimeError(at.exception[0].message)
+            runs.append({
+                "wall_s": wall,
+                "alloc_peak_bytes": peak - before,
+                "peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                "delta_bytes": delta_bytes(at._tree),
+            })
+    finally:
+        tracemalloc.stop()
+        profiling.set_recorder(None)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "asset_mode": os.environ.get("SMARTAG_ASSET_MODE", "auto"),
+            "reruns": n,
+            "warmup": warmup,
+        },
+        "summary": {key: summarize([r[key] for r in runs]) for key in runs[0]},
+        "sections": {
+            name: {key: summarize(values) for key, values in data.items()}
+            for name, data in sections.items()
+        },
+    }
+
+
+def compare(result, baseline, tolerance):
+    """Liste der Kennzahlen, die mehr als ``tolerance`` über der Baseline liegen."""
+    checks = [("summary", "wall_s", "p50"), ("summary", "delta_bytes", "mean"),
+              ("summary", "alloc_peak_bytes", "mean")]
+    checks += [("sections", name, "bytes") for name in result["sections"]]
+    regressions = []
+    for group, key, stat in checks:
+        if group == "sections":
+            new = result["sections"][key]["bytes"]["mean"]
+            old = baseline.get("sections", {}).get(key, {}).get("bytes", {}).get("mean")
+            label = f"sections.{key}.bytes"
+        else:
+            new = result[group][key][stat]
+            old = baseline.get(group, {}).get(key, {}).get(stat)
+            label = f"{group}.{key}.{stat}"
+        if old and new > old * (1 + tolerance):
+            regressions.append(f"{label}: {old:.4g} -> {new:.4g} (+{(new / old - 1) * 100:.0f} %)")
+    return regressions
+
+
+def print_table(result):
+    s = result["summary"]
+    print(f"Reruns: {result['meta']['reruns']}  Modus: {result['meta']['asset_mode']}")
+    print(f"Wall p50 {s['wall_s']['p50'] * 1000:.1f} ms  p95 {s['wall_s']['p95'] * 1000:.1f} ms  "
+          f"Peak-RSS {s['peak_rss_kib']['max'] / 1024:.1f} MiB  "
+          f"Alloc {s['alloc_peak_bytes']['mean'] / 1024:.0f} KiB  "
+          f"Deltas {s['delta_bytes']['mean'] / 1024:.1f} KiB")
+    print(f"{'Abschnitt':<14}{'p50 ms':>9}{'p95 ms':>9}{'Bytes':>10}{'Markdown':>10}")
+    for name, data in result["sections"].items():
+        print(f"{name:<14}{data['seconds']['p50'] * 1000:>9.2f}{data['seconds']['p95'] * 1000:>9.2f}"
+              f"{data['bytes']['mean']:>10.0f}{data['markdown_calls']['mean']:>10.0f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--reruns", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--mode", choices=["auto", "static", "inline"], default=None,
+                        help="SMARTAG_ASSET_MODE für den Lauf")
+    parser.add_argument("-o", "--output", help="Ergebnis als JSON speichern")
+    parser.add_argument("--baseline", help="gespeichertes Ergebnis zum Vergleich")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args(argv)
+
+    if args.mode:
+        os.environ["SMARTAG_ASSET_MODE"] = args.mode
+    os.chdir(ROOT)  # .streamlit/config.toml wird relativ zum Arbeitsverzeichnis gelesen
+    result = run(args.reruns, args.warmup, args.timeout)
+    print_table(result)
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2))
+    if args.baseline:
+        regressions = compare(result, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""Vektorisierte Regelauswertung gegen den skalaren Pfad.
+
+    python benchmarks/bench_rules.py --plants 1000 10000 100000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from smartag.rules import RuleEngine  # noqa: E402
+
+
+def synthetic_field(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "bodenfeuchte": rng.uniform(0, 100, n),
+        "temperatur": rng.normal(24, 8, n),
+        "licht": rng.uniform(0, 100000, n),
+    }
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--plants", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    engine = RuleEngine()
+    print(f"{'Pflanzen':>10}{'skalar ms':>12}{'vektor ms':>12}{'Faktor':>9}")
+    for n in args.plants:
+        field = synthetic_field(n)
+        rows = [dict(zip(field, values)) for values in zip(*field.values())]
+        t_scalar, scalar = best_of(lambda: [engine.evaluate_one(r).name for r in rows], max(1, args.repeat // 2))
+        t_vector, decisions = best_of(lambda: engine.evaluate(field), args.repeat)
+        vector = [s.name for s in np.array(decisions.states, dtype=object)[decisions.codes]]
+        if vector != scalar:
+            print("FEHLER: Ergebnisse weichen ab", file=sys.stderr)
+            return 1
+        print(f"{n:>10}{t_scalar * 1000:>12.2f}{t_vector * 1000:>12.3f}{t_scalar / t_vector:>9.0f}x")
+    print("Verteilung (letzter Lauf):", decisions.counts())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Kaltstart: Zeit vom Prozessstart bis zum ersten gerenderten Abschnitt.
+
+    python benchmarks/bench_startup.py --runs 3 [--warmup] [--cold] [--json startup.json]
+
+Startet pro Lauf einen frischen ``streamlit run``-Prozess und misst über den
+Websocket (wie ein Browser):
+
+* ``ready``     – Prozessstart bis ``/_stcore/health`` antwortet
+* ``first``     – Prozessstart bis zum Header-Abschnitt der ersten Session
+* ``complete``  – Prozessstart bis ``script_finished`` der ersten Session
+* ``warm_*``    – dasselbe für eine zweite Session im selben Prozess
+
+Mit ``--warmup`` läuft vor der ersten Session ``smartag.warmup`` (wie nach dem
+Aufwachen per Wake-on-WLAN); gemessen wird dann ab Ende des Warm-ups.
+Mit ``--cold`` werden vor jedem Lauf die Einträge der Energiesimulation aus
+Streamlits Disk-Cache (``~/.streamlit/cache``) gelöscht; Einträge anderer
+Funktionen und Apps bleiben liegen.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from smartag.warmup import warm_up  # noqa: E402
+from smartag.wsclient import Session, local_server, wait_healthy  # noqa: E402
+
+SCRIPT = ROOT / "PraesentationSmartAg.py"
+FIRST_SECTION = 'class="title"'
+DISK_CACHE = Path.home() / ".streamlit" / "cache"
+
+
+async def first_session(url):
+    session = await Session.connect(url)
+    try:
+        run = await session.rerun()
+    finally:
+        session.close()
+    return run.first(FIRST_SECTION), run.finished
+
+
+def clear_energy_cache():
+    """Disk-Cache-Einträge von ``energy_tab.sweep`` löschen; Anzahl gelöschter Dateien."""
+    from smartag.energy_tab import sweep
+
+    # Dateiname: <function_key>-<value_key>.memo; _function_key ist privat (Streamlit 1.49)
+    stale = list(DISK_CACHE.glob(f"{sweep._function_key}-*.memo"))
+    for path in stale:
+        path.unlink(missing_ok=True)
+    return len(stale)
+
+
+def one_run(args):
+    if args.cold:
+        clear_energy_cache()
+    with local_server(SCRIPT) as (url, _, start):
+        wait_healthy(url)
+        ready = time.perf_counter() - start
+        result = {"ready": ready}
+        if args.warmup:
+            asyncio.run(warm_up(url))
+            result["warmup"] = time.perf_counter() - start - ready
+        base = 0.0 if args.warmup else time.perf_counter() - start
+        first, complete = asyncio.run(first_session(url))
+        result["first"], result["complete"] = base + first, base + complete
+        warm_first, warm_complete = asyncio.run(first_session(url))
+        result["warm_first"], result["warm_complete"] = warm_first, warm_complete
+        return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--warmup", action="store_true", help="smartag.warmup vor der ersten Session")
+    parser.add_argument("--cold", action="store_true", help="Disk-Cache der Energiesimulation vor jedem Lauf löschen")
+    parser.add_argument("--json", help="Ergebnisse als JSON schreiben")
+    args = parser.parse_args(argv)
+
+    runs = [one_run(args) for _ in range(args.runs)]
+    keys = list(runs[0])
+    print(f"{'Messgröße':<16}{'Median':>10}{'Min':>10}{'Max':>10}")
+    summary = {}
+    for key in keys:
+        values = [r[key] for r in runs]
+        summary[key] = statistics.median(values)
+        print(f"{key:<16}{summary[key]:>9.3f}s{min(values):>9.3f}s{max(values):>9.3f}s")
+    if args.json:
+        Path(args.json).write_text(json.dumps({"runs": runs, "median": summary}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
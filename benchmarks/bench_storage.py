@@ -0,0 +1,106 @@
+"""Ingest- und Abfragedurchsatz des eingebetteten Detektionsspeichers.
+
+    python benchmarks/bench_storage.py --cameras 300 --days 180 --per-day 24
+
+Schreibt eine Saison synthetischer Detektionen in eine temporäre SQLite-Datei
+und misst anschließend typische Dashboard-Abfragen (eine Kamera über eine
+Woche, eine Art an einem Ort über die Saison, alle Kameras über einen Tag).
+Zum Vergleich dieselbe Tageskurve einmal aus den Rohdaten und einmal aus den
+Rollups.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from smartag.rollups import Rollups, bucket  # noqa: E402
+from smartag.storage import DAY, DetectionStore  # noqa: E402
+
+SPECIES = ["Tomate", "Gurke", "Paprika", "Erdbeere", "Apfel"]
+LOCATIONS = [f"Feld {i}" for i in range(1, 13)]
+SEASON_START = 1743465600  # 2025-04-01
+
+
+def synthetic_batch(rng, t0, cameras, per_day):
+    n_cams = len(cameras["id"])
+    ts = t0 + np.repeat(np.arange(per_day) * (DAY // per_day), n_cams)
+    idx = np.tile(np.arange(n_cams), per_day)
+    n = len(ts)
+    return {
+        "ts": ts + rng.integers(0, 60, n),
+        "camera": cameras["id"][idx],
+        "species": cameras["species"][idx],
+        "location": cameras["location"][idx],
+        "fruit_count": rng.poisson(12, n),
+        "ripeness": rng.integers(0, 4, n),
+        "confidence": rng.uniform(0.5, 1.0, n),
+        "stress": (rng.random(n) < 0.05).astype(np.uint8),
+        "battery": rng.uniform(20, 100, n),
+    }
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cameras", type=int, default=300)
+    parser.add_argument("--days", type=int, default=180)
+    parser.add_argument("--per-day", type=int, default=24)
+    parser.add_argument("--db", help="Datenbankdatei (Standard: temporär)")
+    parser.add_argument("--no-rollups", action="store_true", help="Rollups beim Ingest nicht pflegen")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = DetectionStore(args.db or Path(tmp) / "bench.db")
+        rollups = None if args.no_rollups else Rollups(store)
+        cameras = {
+            "id": np.arange(1, args.cameras + 1),
+            "species": np.array([SPECIES[i % len(SPECIES)] for i in range(args.cameras)]),
+            "location": np.array([LOCATIONS[i % len(LOCATIONS)] for i in range(args.cameras)]),
+        }
+        start = time.perf_counter()
+        rows = 0
+        for day in range(args.days):
+            rows += store.ingest(synthetic_batch(rng, SEASON_START + day * DAY, cameras, args.per_day))
+        elapsed = time.perf_counter() - start
+        print(f"Ingest: {rows:,} Zeilen in {elapsed:.1f} s ({rows / elapsed:,.0f} Zeilen/s), "
+              f"{len(store.chunk_starts())} Chunks")
+
+        end = SEASON_START + args.days * DAY
+        queries = {
+            "Kamera 7, letzte Woche": lambda: store.query(end - 7 * DAY, end, camera=7),
+            "Tomate/Feld 1, Saison": lambda: store.query(SEASON_START, end, species="Tomate", location="Feld 1"),
+            "alle Kameras, ein Tag": lambda: store.query(end - DAY, end, columns=("ts", "camera_id", "fruit_count")),
+        }
+        if rollups is not None:
+            def daily_from_raw():
+                cols = store.query(SEASON_START, end, species="Tomate", columns=("ts", "fruit_count"))
+                days, inverse = np.unique(bucket(cols["ts"], "day"), return_inverse=True)
+                return {"ts": days, "fruit": np.bincount(inverse, weights=cols["fruit_count"])}
+
+            queries["Tomate täglich (roh)"] = daily_from_raw
+            queries["Tomate täglich (Rollup)"] = lambda: rollups.query(
+                "day", SEASON_START, end, species="Tomate", by=("species",))
+        for label, fn in queries.items():
+            t, cols = timed(fn)
+            rows = len(next(iter(cols.values())))
+            print(f"{label:<26}{rows:>10,} Zeilen{t * 1000:>10.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
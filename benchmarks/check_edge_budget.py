@@ -0,0 +1,131 @@
+"""Prüft das Lite-Profil gegen das Budget in ``smartag.edge.BUDGET``.
+
+    python benchmarks/check_edge_budget.py
+    python benchmarks/check_edge_budget.py --profile full   # Vergleich, ohne Exit-Code
+    python benchmarks/check_edge_budget.py --without plotly # wie auf dem Gateway
+
+Startet einen eigenen Server mit ``SMARTAG_PROFILE``, öffnet eine Session und
+misst den ersten Lauf und ``--reruns`` Reruns: Websocket-Bytes, gesendete
+Elementtypen, CPU-Zeit des Serverprozesses (``utime + stime`` aus
+``/proc/<pid>/stat``) und die RSS danach. ``?diag=memory`` meldet zur Info,
+welche schweren Module geladen sind. Streamlit importiert Plotly selbst, wenn
+es installiert ist; ``--without plotly`` lässt den Server so starten, als
+fehle das Paket (wie auf dem Gateway). Exit-Code 1, wenn das Lite-Profil ein
+Budget überschreitet (nur Linux).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import secrets
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from smartag.edge import BUDGET, PROFILES  # noqa: E402
+from smartag.memory import rss_bytes  # noqa: E402
+from smartag.wsclient import Session, local_server, wait_healthy  # noqa: E402
+
+SCRIPT = ROOT / "PraesentationSmartAg.py"
+MIB = 1024 * 1024
+
+# sitecustomize.py für den Server: diese Pakete gelten als nicht installiert
+MISSING = '''import sys
+
+
+class _Missing:
+    def find_spec(self, name, path=None, target=None):
+        if name.split(".")[0] in {modules!r}:
+            raise ModuleNotFoundError(f"No module named {{name!r}}", name=name)
+
+
+sys.meta_path.insert(0, _Missing())
+'''
+
+
+def cpu_seconds(pid):
+    with open(f"/proc/{pid}/stat") as stat:
+        # Feld 2 (comm) kann Leerzeichen enthalten: hinter der letzten Klammer weiterzählen
+        fields = stat.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+async def measure(url, pid, reruns, token):
+    session = await Session.connect(url)
+    try:
+        cpu = cpu_seconds(pid)
+        first = await session.rerun()
+        cpu_first = cpu_seconds(pid) - cpu
+        cpu = cpu_seconds(pid)
+        runs = [await session.rerun() for _ in range(reruns)]
+        cpu_reruns = cpu_seconds(pid) - cpu
+    finally:
+        session.close()
+    # RSS vor ?diag=memory: das Diagnose-Panel lädt selbst pandas für die Tabelle
+    rss = rss_bytes(pid)
+
+    session = await Session.connect(url)
+    try:
+        report = json.loads((await session.rerun(query_string=f"diag=memory&token={token}")).body('"rss"') or "null")
+    finally:
+        session.close()
+    return {
+        "rss_mib": rss / MIB,
+        "cpu_ms_first": cpu_first * 1000,
+        "cpu_ms_rerun": cpu_reruns / reruns * 1000,
+        "first_run_kib": first.nbytes / 1024,
+        "rerun_kib": sum(r.nbytes for r in runs) / len(runs) / 1024,
+        "elements": set(first.elements).union(*(r.elements for r in runs)),
+        "modules": report["modules"] if report else [],
+    }
+
+
+def check(result):
+    """Liste ``(name, gemessen, budget, ok)``."""
+    rows = [(key, result[key], BUDGET[key], result[key] <= BUDGET[key])
+            for key in ("rss_mib", "cpu_ms_first", "cpu_ms_rerun", "first_run_kib", "rerun_kib")]
+    forbidden = [e for e in BUDGET["forbidden_elements"] if e in result["elements"]]
+    rows.append(("forbidden_elements", ", ".join(forbidden) or "–",
+                 ", ".join(BUDGET["forbidden_elements"]), not forbidden))
+    return rows
+
+
+def run(profile="lite", reruns=10, without=()):
+    """Eigenen Server starten und messen; ``without``: Pakete, die dem Server fehlen sollen."""
+    token = secrets.token_urlsafe(16)
+    env = {"SMARTAG_PROFILE": profile, "SMARTAG_DIAG_TOKEN": token}
+    with tempfile.TemporaryDirectory() as site:
+        if without:
+            Path(site, "sitecustomize.py").write_text(MISSING.format(modules=tuple(without)))
+            env["PYTHONPATH"] = site
+        with local_server(SCRIPT, env=env) as (url, proc, _):
+            wait_healthy(url)
+            return asyncio.run(measure(url, proc.pid, reruns, token))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", choices=PROFILES, default="lite")
+    parser.add_argument("--reruns", type=int, default=10)
+    parser.add_argument("--without", action="append", default=[], metavar="PAKET",
+                        help="Paket für den Server als nicht installiert behandeln (mehrfach möglich)")
+    args = parser.parse_args(argv)
+
+    result = run(args.profile, args.reruns, args.without)
+
+    print(f"Profil {args.profile}, geladene Module: {', '.join(result['modules']) or '–'}")
+    print(f"{'':2}{'Messgröße':<20}{'gemessen':>12}{'Budget':>14}")
+    ok = True
+    for name, value, budget, passed in check(result):
+        ok &= passed
+        value = f"{value:.1f}" if isinstance(value, float) else value
+        print(f"{'✓' if passed else '✗':<2}{name:<20}{value:>12}{budget:>14}")
+    return 0 if ok or args.profile != "lite" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Hilfsmodule für die Präsentation ``PraesentationSmartAg.py``."""
@@ -0,0 +1,115 @@
+"""Tab „Funkbudget“: Airtime, Duty Cycle und Kollisionen der LoRaWAN-Flotte.
+
+Das Raster aus ``smartag.lora.plan`` wird bei jeder Eingabe neu berechnet –
+für ein SF und eine Nutzlast sind das nur einige tausend Zellen, also wenige
+Millisekunden. Das Fragment sorgt dafür, dass nur dieser Tab neu läuft.
+"""
+
+import json
+
+import numpy as np
+import streamlit as st
+
+from smartag import codec, lora
+
+INTERVALS = np.geomspace(60, 86400, 48)
+FLEET_SIZES = np.unique(np.geomspace(1, 100_000, 60).round())
+
+# Tagesbatch stündlicher Messungen: dt < 4096 s (12 Bit), erste Fruchtdifferenz ZigZag bis 31 (5 Bit)
+BATCH_READINGS = 24
+BATCH_BYTES = codec.batch_size(BATCH_READINGS, dt_bits=12, fruit_bits=5)
+# dieselbe Messung als kompaktes JSON (wie in benchmarks/bench_codec.py)
+JSON_BYTES = len(json.dumps(
+    {"ts": 1750000000, "fruits": 12, "ripeness": 2, "conf": 0.87, "bat": 84, "stress": 0}, separators=(",", ":")))
+# Foto-Vorschau: so groß, wie der schnellste Spreading Factor erlaubt
+PREVIEW_BYTES = max(lora.MAX_PAYLOAD.values())
+
+PAYLOADS = {
+    f"{label} ({size} B)": size for label, size in (
+        ("Einzelnachricht", codec.SINGLE_BYTES),
+        (f"Batch {BATCH_READINGS} Messungen", BATCH_BYTES),
+        ("JSON", JSON_BYTES),
+        ("Foto-Vorschau", PREVIEW_BYTES),
+    )
+}
+
+METRICS = {
+    "collision": ("Kollisionswahrscheinlichkeit", ".0%", "RdYlGn_r"),
+    "utilization": ("Kanalauslastung (Erlang)", ".2f", "Viridis"),
+    "device_duty": ("Duty Cycle je Gerät", ".2%", "Cividis"),
+}
+
+INTERVAL_TICKS = {60: "1 min", 300: "5 min", 900: "15 min", 3600: "1 h", 4 * 3600: "4 h", 86400: "24 h"}
+
+
+def heatmap_figure(grid, metric, interval):
+    import plotly.graph_objects as go
+
+    title, fmt, colorscale = METRICS[metric]
+    z = grid[metric][0, 0]
+    feasible = grid["feasible"][0, 0]
+    fig = go.Figure(go.Heatmap(
+        x=FLEET_SIZES, y=INTERVALS, z=np.where(feasible, z, np.nan),
+        colorscale=colorscale, zmin=0, zmax=1 if metric == "collision" else None,
+        colorbar={"title": title, "tickformat": fmt},
+        hovertemplate=f"%{{x:,.0f}} Kameras · alle %{{y:,.0f}} s<br>{title}: %{{z:{fmt}}}<extra></extra>",
+    ))
+    # Zellen, die gegen Duty Cycle oder Nutzlastgrenze verstoßen
+    fig.add_trace(go.Heatmap(
+        x=FLEET_SIZES, y=INTERVALS, z=np.where(feasible, np.nan, 1.0),
+        colorscale=[[0, "#bdbdbd"], [1, "#bdbdbd"]], showscale=False,
+        hovertemplate="%{x:,.0f} Kameras · alle %{y:,.0f} s<br>unzulässig (Duty Cycle/Nutzlast)<extra></extra>",
+    ))
+    fig.add_hline(y=interval, line={"color": "#212121", "dash": "dot", "width": 1})
+    fig.update_xaxes(type="log", title="Kameras pro Gateway")
+    fig.update_yaxes(type="log", title="Sendeintervall",
+                     tickvals=list(INTERVAL_TICKS), ticktext=list(INTERVAL_TICKS.values()))
+    fig.update_layout(height=450, margin=dict(t=10, b=0, l=0, r=0))
+    return fig
+
+
+def sf_table(payload, interval, max_collision):
+    sfs = np.array(lora.SPREADING_FACTORS)
+    toa = lora.airtime(payload, sfs)
+    fits = payload <= np.array([lora.MAX_PAYLOAD[sf] for sf in sfs])
+    fleet = lora.max_fleet(payload, sfs, interval, max_collision)
+    return {
+        "SF": sfs,
+        "Airtime (ms)": np.round(toa * 1000, 1),
+        "Duty Cycle je Gerät": [f"{d:.3%}" for d in toa / interval],
+        "max. Uplinks/h (1 %)": lora.max_messages_per_hour(payload, sfs).astype(int),
+        f"max. Kameras (≤ {max_collision:.0%} Kollision)": np.where(fits & (toa / interval <= lora.DUTY_CYCLE), fleet, 0).astype(int),
+    }
+
+
+@st.fragment
+def render_planner():
+    col_sf, col_payload, col_metric = st.columns(3)
+    with col_sf:
+        sf = st.select_slider("Spreading Factor", options=list(lora.SPREADING_FACTORS), value=9, key="airtime_sf")
+    with col_payload:
+        payload = PAYLOADS[st.selectbox("Nutzlast", list(PAYLOADS), key="airtime_payload")]
+    with col_metric:
+        metric = st.radio("Kennzahl", list(METRICS), format_func=lambda m: METRICS[m][0], key="airtime_metric")
+    col_interval, col_collision = st.columns(2)
+    with col_interval:
+        interval = st.select_slider(
+            "Sendeintervall", options=list(INTERVAL_TICKS), value=3600,
+            format_func=INTERVAL_TICKS.get, key="airtime_interval",
+        )
+    with col_collision:
+        max_collision = st.slider("Max. Kollisionswahrscheinlichkeit", 0.01, 0.5, 0.1, key="airtime_collision")
+
+    grid = lora.plan([sf], [payload], INTERVALS, FLEET_SIZES)
+    st.plotly_chart(heatmap_figure(grid, metric, interval), width="stretch")
+    st.dataframe(sf_table(payload, interval, max_collision), hide_index=True, width="stretch")
+    st.caption(
+        f"EU868, {lora.CHANNELS} Kanäle, 125 kHz, CR 4/5, {lora.DUTY_CYCLE:.0%} Duty Cycle; "
+        "Kollisionen nach Pure ALOHA bei gleichem SF. Grau: Duty Cycle oder Nutzlastgrenze überschritten."
+    )
+
+
+def render_tab():
+    st.markdown('<div class="section-header">Funkbudget planen</div>', unsafe_allow_html=True)
+    st.info("👉 *Wie oft dürfen wie viele Kameras senden, bevor sich die Uplinks gegenseitig stören?*")
+    render_planner()
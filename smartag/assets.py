@@ -0,0 +1,138 @@
+"""Prozessweiter Asset-Cache für Bilder und PDF.
+
+Jede Datei wird pro Prozess genau einmal gelesen und Base64-kodiert; alle
+Streamlit-Sessions und Reruns teilen sich dieselben Strings. Ein Eintrag wird
+neu geladen, sobald sich mtime/Größe der Datei ändern *und* der SHA-256 ein
+anderer ist. Der Speicher ist über ``max_bytes`` begrenzt (LRU-Verdrängung).
+"""
+
+import base64
+import hashlib
+import mimetypes
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Assets liegen neben PraesentationSmartAg.py – unabhängig vom Arbeitsverzeichnis
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+@dataclass
+class Asset:
+    path: Path
+    mime: str
+    raw: bytes
+    sha256: str
+    mtime_ns: int
+    size: int
+    _b64: str = field(default=None, repr=False)
+
+    @property
+    def b64(self):
+        # Kodierung erst bei Bedarf (z. B. nicht im Static-Modus)
+        if self._b64 is None:
+            self._b64 = base64.b64encode(self.raw).decode("ascii")
+        return self._b64
+
+    @property
+    def data_uri(self):
+        return f"data:{self.mime};base64,{self.b64}"
+
+    @property
+    def nbytes(self):
+        # Rohdaten + ggf. Base64-String (1 Byte pro Zeichen bei ASCII)
+        return len(self.raw) + (len(self._b64) if self._b64 is not None else 0)
+
+
+class AssetCache:
+    """Thread-sicherer LRU-Cache mit Invalidierung über mtime und Hash."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, base_dir=BASE_DIR):
+        self.max_bytes = max_bytes
+        self.base_dir = Path(base_dir)
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def resolve(self, path):
+        path = Path(path)
+        return path if path.is_absolute() else self.base_dir / path
+
+    def get(self, path):
+        """Liefert das ``Asset`` zu ``path``; ``FileNotFoundError`` wenn es fehlt."""
+        path = self.resolve(path)
+        st = os.stat(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and (entry.mtime_ns, entry.size) == (st.st_mtime_ns, st.st_size):
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry
+
+            raw = path.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            if entry is not None and entry.sha256 == digest:
+                # Nur der Zeitstempel hat sich geändert (z. B. touch/Deploy) – Kodierung behalten
+                entry.mtime_ns, entry.size = st.st_mtime_ns, st.st_size
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry
+
+            mime = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            entry = Asset(path, mime, raw, digest, st.st_mtime_ns, st.st_size)
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            self.misses += 1
+            self._evict()
+            return entry
+
+    def data_uri(self, path):
+        entry = self.get(path)
+        with self._lock:
+            had_b64 = entry._b64 is not None
+            uri = entry.data_uri
+            if not had_b64:
+                self._evict()
+            return uri
+
+    def _evict(self):
+        # Älteste Einträge verdrängen, den zuletzt genutzten aber immer behalten
+        while len(self._entries) > 1 and self.total_bytes() > self.max_bytes:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def total_bytes(self):
+        return sum(e.nbytes for e in self._entries.values())
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.total_bytes(),
+                "max_bytes": self.max_bytes,
+            }
+
+
+# Eine Instanz für den ganzen Prozess (Module werden von Streamlit nur einmal importiert)
+cache = AssetCache(max_bytes=int(os.environ.get("SMARTAG_ASSET_CACHE_BYTES", DEFAULT_MAX_BYTES)))
+
+
+def get_base64_image(image_path):
+    """Data-URI für ``image_path`` oder ``""``, falls die Datei fehlt."""
+    try:
+        return cache.data_uri(image_path)
+    except OSError:
+        return ""
@@ -0,0 +1,177 @@
+"""Offline-Build der responsiven Bildvarianten.
+
+    python -m smartag.build_assets [--compare alter-report.json]
+
+Erzeugt für jedes Bild in ``SOURCES`` verkleinerte, neu komprimierte
+Varianten (AVIF, WebP und ein JPEG/PNG-Fallback) unter ``static/derived/``,
+dazu ``manifest.json`` für die Seite und ``size-report.json`` mit den
+Payload-Bytes je Asset, um sie über Releases hinweg vergleichen zu können.
+
+Die Originale (Bilder und PDF) werden außerdem schon hier gehasht nach
+``static/`` kopiert; ``fingerprints.json`` hält sha256, Größe und mtime fest,
+sodass die Seite beim Kaltstart keine Originale lesen muss.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import sys
+
+from PIL import Image, features
+
+from smartag.assets import BASE_DIR, cache
+from smartag.static_assets import FINGERPRINTS_PATH, publish
+
+DERIVED_DIR = BASE_DIR / "static" / "derived"
+MANIFEST_PATH = DERIVED_DIR / "manifest.json"
+REPORT_PATH = DERIVED_DIR / "size-report.json"
+
+# Breiten orientieren sich an der Darstellung: Diagramm bis 1300 px, Hintergründe
+# liegen unter einem 75–85 % deckenden Overlay und vertragen stärkere Kompression.
+SOURCES = {
+    # "lite": eine einzelne Variante für das Lite-Profil (smartag.edge); das flächige Diagramm
+    # wird auf wenige Farben reduziert und verlustfrei als WebP gespeichert (~9 KB bei 1000 px)
+    "TechnologieAufbauErweitert3.png": {"widths": [480, 800, 1300, 2000], "fallback": "png", "quality": 70,
+                                        "lite": {"width": 1000, "colors": 32}},
+    "smartgreenhouse.png": {"widths": [480, 960], "fallback": "jpeg", "quality": 55},
+    "DryPlants.jpeg": {"widths": [480, 960, 1600], "fallback": "jpeg", "quality": 55},
+}
+
+# zusätzlich veröffentlichte Originale (Download in der Fußzeile)
+ORIGINALS = ["Smarte und resiliente Landwirtschaft.pdf"]
+
+MIME = {"avif": "image/avif", "webp": "image/webp", "jpeg": "image/jpeg", "png": "image/png"}
+EXT = {"avif": "avif", "webp": "webp", "jpeg": "jpg", "png": "png"}
+
+
+def available_formats(fallback):
+    formats = [f for f in ("avif", "webp") if features.check(f)]
+    return formats + [fallback]
+
+
+def encode(img, fmt, quality):
+    if fmt == "jpeg" and img.mode != "RGB":
+        # Transparenz auf Weiß legen, JPEG kennt keinen Alphakanal
+        flat = Image.new("RGB", img.size, (255, 255, 255))
+        flat.paste(img, mask=img.getchannel("A") if "A" in img.getbands() else None)
+        img = flat
+    buf = io.BytesIO()
+    if fmt == "png":
+        img = img.quantize(colors=256, method=Image.Quantize.FASTOCTREE) if img.mode == "RGBA" else img.quantize(colors=256)
+        img.save(buf, "PNG", optimize=True)
+    elif fmt == "jpeg":
+        img.save(buf, "JPEG", quality=quality, optimize=True, progressive=True)
+    elif fmt == "webp":
+        img.save(buf, "WEBP", quality=quality, method=6)
+    else:
+        img.save(buf, "AVIF", quality=quality)
+    return buf.getvalue()
+
+
+def build_source(name, spec):
+    entry = cache.get(name)
+    src = Image.open(io.BytesIO(entry.raw))
+    src.load()
+    widths = sorted({min(w, src.width) for w in spec["widths"]})
+    variants = []
+    for width in widths:
+        height = round(src.height * width / src.width)
+        img = src if width == src.width else src.resize((width, height), Image.Resampling.LANCZOS)
+        for fmt in available_formats(spec["fallback"]):
+            data = encode(img, fmt, spec["quality"])
+            digest = hashlib.sha256(data).hexdigest()[:12]
+            filename = f"{entry.path.stem}-{width}w.{digest}.{EXT[fmt]}"
+            target = DERIVED_DIR / filename
+            if not target.exists():
+                target.write_bytes(data)
+            variants.append({
+                "width": width, "height": height, "format": fmt, "mime": MIME[fmt],
+                "file": filename, "bytes": len(data),
+            })
+    item = {
+        "source_sha256": entry.sha256,
+        "source_bytes": entry.size,
+        "width": src.width,
+        "height": src.height,
+        "fallback": spec["fallback"],
+        "variants": variants,
+    }
+    if "lite" in spec and features.check("webp"):
+        width = min(spec["lite"]["width"], src.width)
+        height = round(src.height * width / src.width)
+        img = src.resize((width, height), Image.Resampling.LANCZOS).convert("RGBA")
+        img = img.quantize(colors=spec["lite"]["colors"], method=Image.Quantize.FASTOCTREE).convert("RGBA")
+        buf = io.BytesIO()
+        img.save(buf, "WEBP", lossless=True, quality=100, method=6)
+        data = buf.getvalue()
+        filename = f"{entry.path.stem}-{width}w-lite.{hashlib.sha256(data).hexdigest()[:12]}.webp"
+        if not (DERIVED_DIR / filename).exists():
+            (DERIVED_DIR / filename).write_bytes(data)
+        item["lite"] = {"width": width, "height": height, "format": "webp", "mime": MIME["webp"],
+                        "file": filename, "bytes": len(data)}
+    return item
+
+
+def fingerprints(names):
+    """Originale veröffentlichen und ihren Fingerabdruck festhalten; fehlende überspringen."""
+    result = {}
+    for name in names:
+        try:
+            entry = cache.get(name)
+            publish(name)
+        except OSError:
+            continue
+        result[name] = {"sha256": entry.sha256, "bytes": entry.size, "mtime_ns": entry.mtime_ns}
+    return result
+
+
+def size_report(manifest):
+    report = {}
+    for name, item in manifest.items():
+        by_format = {}
+        for v in item["variants"]:
+            by_format.setdefault(v["format"], {})[str(v["width"])] = v["bytes"]
+        if "lite" in item:
+            by_format["lite"] = {str(item["lite"]["width"]): item["lite"]["bytes"]}
+        report[name] = {"source_bytes": item["source_bytes"], "variants": by_format}
+    return report
+
+
+def print_report(report, previous=None):
+    print(f"{'Asset':<34}{'Format':<7}{'Breite':>7}{'Bytes':>10}{'Δ':>9}")
+    for name, item in report.items():
+        print(f"{name:<34}{'orig':<7}{'':>7}{item['source_bytes']:>10}")
+        for fmt, widths in item["variants"].items():
+            for width, nbytes in widths.items():
+                old = (previous or {}).get(name, {}).get("variants", {}).get(fmt, {}).get(width)
+                delta = f"{nbytes - old:+d}" if old is not None else ""
+                print(f"{'':<34}{fmt:<7}{width:>7}{nbytes:>10}{delta:>9}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--compare", help="früheren size-report.json zum Vergleich")
+    args = parser.parse_args(argv)
+
+    DERIVED_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {name: build_source(name, spec) for name, spec in SOURCES.items()}
+    keep = {v["file"] for item in manifest.values() for v in item["variants"] + [item.get("lite", {})] if v}
+    for stale in DERIVED_DIR.iterdir():
+        if stale.suffix[1:] in EXT.values() and stale.name not in keep:
+            stale.unlink()
+
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2))
+    FINGERPRINTS_PATH.write_text(json.dumps(fingerprints(list(SOURCES) + ORIGINALS), indent=2))
+    report = size_report(manifest)
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+    REPORT_PATH.write_text(json.dumps(report, indent=2))
+    print_report(report, previous)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
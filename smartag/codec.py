@@ -0,0 +1,199 @@
+"""Binäres Nutzlastformat für Detektionsergebnisse der Kameras (LoRaWAN-Uplink).
+
+LoRaWAN erlaubt je nach Spreading Factor nur wenige Dutzend Byte, und jede
+Millisekunde Airtime kostet Energie. Statt JSON wird deshalb ein festes,
+versioniertes Bitlayout verwendet (MSB zuerst):
+
+Einzelnachricht, Version 1 (9 Byte)::
+
+    version 4 | kind=0 4 | ts 32 | fruit_count 12 | ripeness 2 | confidence 7 | battery 7 | stress 4
+
+Batch, Version 1 (8 Byte Kopf + n × (dt_bits + fruit_bits + 13) Bit, auf Byte aufgerundet)::
+
+    version 4 | kind=1 4 | count 8 | ts0 32 | battery 7 | dt_bits 5 | fruit_bits 4
+    je Messung: dt dt_bits | Δfruit fruit_bits (ZigZag) | ripeness 2 | confidence 7 | stress 4
+
+Im Batch werden Zeitstempel und Fruchtanzahl als Differenz zur vorherigen
+Messung übertragen; die Bitbreiten wählt der Encoder je Batch minimal. Der
+Batteriestand wird nur einmal (beim Senden) übertragen.
+
+Alle Funktionen arbeiten auf Spalten (dict von NumPy-Arrays, wie
+``DetectionStore.ingest`` sie erwartet) und packen die Bits vektorisiert.
+"""
+
+import numpy as np
+
+VERSION = 1
+KIND_SINGLE = 0
+KIND_BATCH = 1
+
+CONFIDENCE_SCALE = 127
+MAX_BATCH = 255
+
+# (Feld, Bitbreite) der Einzelnachricht
+SINGLE_LAYOUT = (
+    ("version", 4), ("kind", 4), ("ts", 32), ("fruit_count", 12),
+    ("ripeness", 2), ("confidence", 7), ("battery", 7), ("stress", 4),
+)
+SINGLE_BYTES = sum(w for _, w in SINGLE_LAYOUT) // 8
+
+BATCH_HEADER = (
+    ("version", 4), ("kind", 4), ("count", 8), ("ts", 32),
+    ("battery", 7), ("dt_bits", 5), ("fruit_bits", 4),
+)
+BATCH_HEADER_BITS = sum(w for _, w in BATCH_HEADER)
+# feste Felder je Batch-Messung; dt und Δfruit kommen mit variabler Breite dazu
+BATCH_FIXED = (("ripeness", 2), ("confidence", 7), ("stress", 4))
+
+FIELDS = ("ts", "fruit_count", "ripeness", "confidence", "battery", "stress")
+
+
+class CodecError(ValueError):
+    pass
+
+
+# --- Bitpacking ---
+
+def _bits(values, width):
+    """Werte (n,) → Bitmatrix (n, width), MSB zuerst."""
+    shifts = np.arange(width - 1, -1, -1, dtype=np.uint64)
+    return ((np.asarray(values, dtype=np.uint64)[:, None] >> shifts) & 1).astype(np.uint8)
+
+
+def _value(bits):
+    """Bitmatrix (n, width) → Werte (n,)."""
+    width = bits.shape[1]
+    weights = np.uint64(1) << np.arange(width - 1, -1, -1, dtype=np.uint64)
+    return (bits.astype(np.uint64) * weights).sum(axis=1).astype(np.int64)
+
+
+def _split(bits, widths):
+    out, pos = [], 0
+    for width in widths:
+        out.append(_value(bits[:, pos:pos + width]))
+        pos += width
+    return out
+
+
+def _zigzag(v):
+    return np.where(v < 0, -2 * v - 1, 2 * v)
+
+
+def _unzigzag(z):
+    return np.where(z & 1, -(z + 1) // 2, z // 2)
+
+
+def _bit_length(max_value):
+    return int(max_value).bit_length()
+
+
+# --- Quantisierung ---
+
+def quantize(columns):
+    """Spalten auf die Wertebereiche des Layouts bringen (int64)."""
+    n = len(columns["ts"])
+
+    def col(name, default=0):
+        value = columns.get(name)
+        return np.full(n, default) if value is None else np.asarray(value)
+
+    return {
+        "ts": col("ts").astype(np.int64),
+        "fruit_count": np.clip(col("fruit_count"), 0, 4095).astype(np.int64),
+        "ripeness": np.clip(col("ripeness"), 0, 3).astype(np.int64),
+        "confidence": np.clip(np.rint(col("confidence") * CONFIDENCE_SCALE), 0, CONFIDENCE_SCALE).astype(np.int64),
+        "battery": np.clip(np.rint(col("battery")), 0, 100).astype(np.int64),
+        "stress": np.clip(col("stress"), 0, 15).astype(np.int64),
+    }
+
+
+def _dequantize(fields):
+    fields["confidence"] = fields["confidence"] / CONFIDENCE_SCALE
+    return fields
+
+
+# --- Einzelnachrichten ---
+
+def encode(columns):
+    """n Messungen → Array (n, 9) uint8, eine Nachricht pro Zeile."""
+    q = quantize(columns)
+    n = len(q["ts"])
+    q["version"] = np.full(n, VERSION)
+    q["kind"] = np.full(n, KIND_SINGLE)
+    bits = np.hstack([_bits(q[name], width) for name, width in SINGLE_LAYOUT])
+    return np.packbits(bits, axis=1)
+
+
+def decode(messages):
+    """Array (n, 9) uint8 oder Liste von ``bytes`` → dict von Arrays."""
+    if not isinstance(messages, np.ndarray):
+        messages = np.frombuffer(b"".join(messages), dtype=np.uint8)
+    if messages.size % SINGLE_BYTES:
+        raise CodecError(f"Nutzlast ist kein Vielfaches von {SINGLE_BYTES} Byte")
+    messages = messages.reshape(-1, SINGLE_BYTES)
+    bits = np.unpackbits(messages, axis=1)
+    values = dict(zip((name for name, _ in SINGLE_LAYOUT), _split(bits, (w for _, w in SINGLE_LAYOUT))))
+    if np.any(values["version"] != VERSION) or np.any(values["kind"] != KIND_SINGLE):
+        raise CodecError("Unbekannte Version oder kein Einzelnachrichten-Format")
+    return _dequantize({name: values[name] for name in FIELDS})
+
+
+# --- Batches (Delta-Kodierung) ---
+
+def encode_batch(columns):
+    """Bis zu 255 Messungen einer Kamera als ein Delta-kodierter Uplink (``bytes``)."""
+    q = quantize(columns)
+    n = len(q["ts"])
+    if not 0 < n <= MAX_BATCH:
+        raise CodecError(f"Batch muss 1..{MAX_BATCH} Messungen enthalten, nicht {n}")
+    order = np.argsort(q["ts"], kind="stable")
+    q = {k: v[order] for k, v in q.items()}
+
+    dt = np.diff(q["ts"], prepend=q["ts"][0])
+    dfruit = _zigzag(np.diff(q["fruit_count"], prepend=0))
+    dt_bits, fruit_bits = _bit_length(dt.max()), max(_bit_length(dfruit.max()), 1)
+    if dt_bits > 31 or fruit_bits > 15:
+        raise CodecError("Differenzen passen nicht in das Batch-Layout")
+
+    header = {
+        "version": VERSION, "kind": KIND_BATCH, "count": n, "ts": q["ts"][0],
+        "battery": q["battery"][-1], "dt_bits": dt_bits, "fruit_bits": fruit_bits,
+    }
+    head = np.concatenate([_bits([header[name]], width)[0] for name, width in BATCH_HEADER])
+    rows = [_bits(dfruit, fruit_bits)] + [_bits(q[name], width) for name, width in BATCH_FIXED]
+    if dt_bits:
+        rows.insert(0, _bits(dt, dt_bits))
+    return np.packbits(np.concatenate([head, np.hstack(rows).ravel()])).tobytes()
+
+
+def decode_batch(payload):
+    """Delta-kodierten Uplink → dict von Arrays (nach Zeit sortiert)."""
+    bits = np.unpackbits(np.frombuffer(payload, dtype=np.uint8))
+    if len(bits) < BATCH_HEADER_BITS:
+        raise CodecError("Nutzlast kürzer als der Batch-Kopf")
+    header = dict(zip(
+        (name for name, _ in BATCH_HEADER),
+        (int(v[0]) for v in _split(bits[None, :BATCH_HEADER_BITS], (w for _, w in BATCH_HEADER))),
+    ))
+    if header["version"] != VERSION or header["kind"] != KIND_BATCH:
+        raise CodecError("Unbekannte Version oder kein Batch-Format")
+    n = header["count"]
+    widths = (header["dt_bits"], header["fruit_bits"]) + tuple(w for _, w in BATCH_FIXED)
+    record_bits = sum(widths)
+    body = bits[BATCH_HEADER_BITS:BATCH_HEADER_BITS + n * record_bits]
+    if len(body) < n * record_bits:
+        raise CodecError("Nutzlast abgeschnitten")
+    dt, dfruit, ripeness, confidence, stress = _split(body.reshape(n, record_bits), widths)
+    return _dequantize({
+        "ts": header["ts"] + np.cumsum(dt),
+        "fruit_count": np.cumsum(_unzigzag(dfruit)),
+        "ripeness": ripeness,
+        "confidence": confidence,
+        "battery": np.full(n, header["battery"]),
+        "stress": stress,
+    })
+
+
+def batch_size(count, dt_bits, fruit_bits):
+    """Größe eines Batch-Uplinks in Byte."""
+    return -(-(BATCH_HEADER_BITS + count * (dt_bits + fruit_bits + sum(w for _, w in BATCH_FIXED))) // 8)
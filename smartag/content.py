@@ -0,0 +1,194 @@
+"""Inhalte aus ``smartag/content/<locale>.toml`` und deren HTML-Templates.
+
+Jeder Abschnitt wird zu genau einem HTML-Block kompiliert (ein
+``st.markdown``-Aufruf statt eines Aufrufs pro Zeile). Kompilierte Blöcke
+werden über den Hash aus Abschnittsdaten und Kontext (z. B. Bild-Markup)
+gecacht – ändert sich in der TOML-Datei nur ein Abschnitt, wird auch nur
+dieser neu gebaut.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import tomllib
+from pathlib import Path
+
+CONTENT_DIR = Path(__file__).with_name("content")
+DEFAULT_LOCALE = os.environ.get("SMARTAG_LOCALE", "de")
+
+# Farbige Zusatzboxen in den Technologie-Spalten
+OPTION_STYLES = {
+    "energie": "background-color:#B61C7B; color:white;",
+    "internet": "background-color:#C8E3FB; color:black;",
+}
+
+_lock = threading.Lock()
+_files = {}
+_compiled = {}
+
+
+def load(locale=DEFAULT_LOCALE):
+    """Inhalte einer Sprache; neu gelesen nur, wenn sich die Datei ändert."""
+    path = CONTENT_DIR / f"{locale}.toml"
+    mtime_ns = path.stat().st_mtime_ns
+    with _lock:
+        cached = _files.get(locale)
+        if cached is None or cached[0] != mtime_ns:
+            with open(path, "rb") as f:
+                cached = _files[locale] = (mtime_ns, tomllib.load(f))
+        return cached[1]
+
+
+# --- Templates (ein Block je Abschnitt) ---
+
+def _header(c):
+    return (
+        f'<div class="title"><a href="{c["url"]}" style="color: inherit; text-decoration: none;">'
+        f'{c["title"]}</a></div>'
+        f'<div class="subtitle">{c["subtitle"]} </div>'
+    )
+
+
+def _hintergrund(c):
+    a, lf = c["ausgangszustand"], c["leitfragen"]
+    items = "".join(f"<li>{i}</li>" for i in a["items"])
+    fragen = "".join(
+        f'<li style="font-size: 1.35rem; color: darkgreen;"><strong>{q}</strong></li>' for q in lf["items"]
+    )
+    return f"""
+<div class="section">{c["title"]}</div>
+<div class="table-container">
+    <div class="column">
+        <div class="column-with-bg2">
+            <div class="column-content">
+                <h4 style="text-align: center;">{a["heading"]}</h4>
+                <p><strong><span style="font-size: 1.25rem;">{a["intro"]}</span></strong></p>
+                <ul style="font-size: 1.25rem;">{items}</ul>
+                <p><span style="font-size: 1.25rem;">{a["outro"]}</span></p>
+            </div>
+        </div>
+    </div>
+    <div class="column">
+        <div class="column-with-bg">
+            <div class="column-content">
+                <h4 style="text-align: center;">{lf["heading"]}</h4>
+                <ul>{fragen}</ul>
+            </div>
+        </div>
+    </div>
+</div>"""
+
+
+def _list_items(punkte):
+    out = []
+    for p in punkte:
+        if isinstance(p, dict):
+            sub = "".join(f"<li>{s}</li>" for s in p.get("unterpunkte", []))
+            out.append(f"<li>{p['text']}<ul>{sub}</ul></li>")
+        else:
+            out.append(f"<li>{p}</li>")
+    return "".join(out)
+
+
+def _technologie(c, diagram=""):
+    spalten = []
+    for sp in c["spalten"]:
+        optionen = "".join(
+            f'<div style="{OPTION_STYLES[o["art"]]} padding:10px; border-radius:5px; margin-top:10px; '
+            f'font-size: 1.25rem;"><ul><li>{o["text"]}</li></ul></div>'
+            for o in sp.get("optionen", [])
+        )
+        fussnoten = "".join(f"<i>{f}</i><br>" for f in sp.get("fussnoten", []))
+        spalten.append(
+            '<div class="tech-col">'
+            f'<div style="background-color:#f0f0f0; padding:10px; border-radius:5px;"><h4>{sp["titel"]}</h4></div>'
+            '<div style="background-color:#EDF3DB; color:black; padding:10px; border-radius:5px; '
+            f'margin-top:10px; font-size: 1.25rem;"><ul>{_list_items(sp["punkte"])}</ul></div>'
+            f'{optionen}{"<br>" + fussnoten if fussnoten else ""}</div>'
+        )
+    return f"""
+<div class="section-header">{c["header"]}</div>
+<div style="display: flex; justify-content: center; align-items: center; flex-direction: column;">
+    {diagram}
+    <p style="text-align: center; color: gray; margin-top: 10px;">{c["caption"]}</p>
+</div>
+<div class="tech-cols">{"".join(spalten)}</div>"""
+
+
+def _ablauf(c):
+    schritte = "".join(f"<li>{s}</li>" for s in c["schritte"])
+    return f"""
+<div class="section-header">{c["header"]}</div>
+<div class="highlight-box">
+    <ol style="font-size:1.5rem; line-height:2;">{schritte}</ol>
+</div>
+<br><br><br><br><br><br>"""
+
+
+def _abwaegung_box(box, background, color):
+    rows = "".join(
+        '<div style="display:flex;align-items:center;padding:0.5rem 0;">'
+        f'<div style="font-size:1.5rem;width:2.5rem;text-align:center;">{icon}</div>'
+        f'<div><span style="font-weight:600;">{label}:</span>'
+        f'<span style="margin-left:0.5rem;">{value}</span></div></div>'
+        for icon, label, value in box["punkte"]
+    )
+    return (
+        f'<div style="background-color:{background}; border-radius:12px; padding:0.5rem 1rem 0rem 1rem; '
+        f'margin-bottom:0.5rem;"><h4 style="color:{color}; margin-top:0;">{box["titel"]}</h4>{rows}</div>'
+    )
+
+
+def _abwaegungen(c):
+    return f"""
+<br><br>
+<div class="section">{c["title"]}</div>
+<div class="tradeoff-cols">
+    {_abwaegung_box(c["vorteile"], "#e8f5e9", "#2e7d32")}
+    {_abwaegung_box(c["herausforderungen"], "#ffebee", "#b71c1c")}
+</div>"""
+
+
+def _footer(c, pdf_url=None, pdf_name=""):
+    pdf = ""
+    if pdf_url:
+        pdf = (
+            f'| <a href="{pdf_url}" download="{pdf_name}" '
+            f'style="text-decoration: none; color: #4CAF50; font-weight: 400;">{c["pdf_link"]}</a>'
+        )
+    return f"""
+<div class="footer">
+    {c["text"]} <a href="{c["partner_url"]}">{c["partner"]}</a> {pdf}<br>
+    {c["copyright"]} | Kontakt: <a href="mailto: {c["kontakt"]}">{c["kontakt"]}</a>
+</div>"""
+
+
+TEMPLATES = {
+    "header": _header,
+    "hintergrund": _hintergrund,
+    "technologie": _technologie,
+    "ablauf": _ablauf,
+    "abwaegungen": _abwaegungen,
+    "footer": _footer,
+}
+
+
+def section_html(name, locale=DEFAULT_LOCALE, **context):
+    """Kompilierter HTML-Block für Abschnitt ``name``, gecacht über den Inhalts-Hash."""
+    data = load(locale)[name]
+    key = hashlib.sha256(
+        json.dumps([name, data, context], sort_keys=True, ensure_ascii=False).encode()
+    ).hexdigest()
+    cached = _compiled.get((locale, name))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    html = TEMPLATES[name](data, **context)
+    with _lock:
+        # Pro Abschnitt nur die aktuelle Fassung behalten
+        _compiled[(locale, name)] = (key, html)
+    return html
+
+
+def text(name, key, locale=DEFAULT_LOCALE):
+    return load(locale)[name][key]
@@ -0,0 +1,83 @@
+"""Downsampling langer Zeitreihen vor der Übergabe an Plotly.
+
+Zwei Verfahren:
+
+* ``lttb`` – Largest-Triangle-Three-Buckets: erhält die Form der Kurve, ein
+  Punkt pro Bucket (Schleife über Buckets, Flächenberechnung je Bucket
+  vektorisiert).
+* ``minmax`` – je Bucket Minimum und Maximum: erhält Spitzen exakt, komplett
+  vektorisiert und damit am schnellsten.
+
+``decimate`` schneidet zuerst auf den sichtbaren Bereich (``x_range``) zu und
+wählt die Punktzahl aus der Chartbreite – bei einem kleineren Zeitfenster
+("Zoom") wird also neu und feiner dezimiert.
+"""
+
+import numpy as np
+
+DEFAULT_WIDTH_PX = 1200
+POINTS_PER_PX = 2
+
+
+def target_points(width_px=DEFAULT_WIDTH_PX, points_per_px=POINTS_PER_PX):
+    return max(8, int(width_px * points_per_px))
+
+
+def minmax(x, y, n_out):
+    """Min/Max je Bucket, zeitlich sortiert; ``n_out`` ist die maximale Punktzahl."""
+    x, y = np.asarray(x), np.asarray(y, dtype=np.float64)
+    n = len(y)
+    buckets = max(1, n_out // 2)
+    if n <= n_out:
+        return x, y
+    size = -(-n // buckets)  # aufrunden
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    grid = padded.reshape(buckets, size)
+    valid = ~np.all(np.isnan(grid), axis=1)
+    offsets = np.arange(buckets)[valid] * size
+    grid = grid[valid]
+    lo = offsets + np.nanargmin(grid, axis=1)
+    hi = offsets + np.nanargmax(grid, axis=1)
+    idx = np.unique(np.concatenate([lo, hi]))  # sortiert, doppelte bei flachen Buckets raus
+    return x[idx], y[idx]
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets (Steinarsson 2013)."""
+    x, y = np.asarray(x), np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return x, y
+    xf = x.astype(np.float64)  # auch für datetime64
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)  # Buckets ohne ersten/letzten Punkt
+    # Mittelwerte aller Buckets vorab (für den jeweils nächsten Bucket benötigt)
+    sums_x = np.add.reduceat(xf[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    avg_x = np.append(sums_x / counts, xf[-1])
+    avg_y = np.append(sums_y / counts, y[-1])
+
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        bx, by = xf[start:stop], y[start:stop]
+        area = np.abs((xf[a] - avg_x[i + 1]) * (by - y[a]) - (xf[a] - bx) * (avg_y[i + 1] - y[a]))
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+    return x[idx], y[idx]
+
+
+METHODS = {"lttb": lttb, "minmax": minmax}
+
+
+def decimate(x, y, width_px=DEFAULT_WIDTH_PX, method="lttb", x_range=None):
+    """Auf ``x_range`` zuschneiden und auf die zur Chartbreite passende Punktzahl reduzieren."""
+    x, y = np.asarray(x), np.asarray(y)
+    if x_range is not None:
+        lo = np.searchsorted(x, x_range[0], side="left") if x_range[0] is not None else 0
+        hi = np.searchsorted(x, x_range[1], side="right") if x_range[1] is not None else len(x)
+        x, y = x[lo:hi], y[lo:hi]
+    return METHODS[method](x, y, target_points(width_px))
@@ -0,0 +1,174 @@
+"""Unterdrückung fast gleicher Kamerabilder per Perceptual Hash.
+
+Zwischen zwei Aufnahmen ändert sich an einer Pflanze meist kaum etwas; jedes
+Bild kostet trotzdem Übertragung (WLAN, bei LoRaWAN gar nicht machbar) und
+Speicher. ``NearDuplicateFilter`` vergleicht jedes Bild mit dem zuletzt
+*behaltenen* Bild derselben Kamera – nicht mit dem Vorgänger, sonst könnte
+eine langsame Veränderung in lauter kleinen Schritten unbemerkt bleiben.
+
+Hash: 64-Bit-pHash. JPEGs werden per ``draft`` direkt als Graustufen in
+1/4…1/8 Auflösung dekodiert und auf 32×32 gemittelt; die 2D-DCT läuft für den
+ganzen Batch als eine Matrixmultiplikation, die 8×8 niedrigsten Frequenzen
+werden am Median binarisiert. Helligkeitsschwankungen und Sensorrauschen
+ändern nur wenige Bits, neue oder gereifte Früchte viele.
+
+Ist der Hamming-Abstand ≤ ``threshold``, wird das Bild je nach ``mode``
+verworfen (``drop``) oder durch eine Delta-Markierung ersetzt (``delta``,
+``DELTA_BYTES`` Byte: Hash des behaltenen Referenzbildes und Abstand – der
+Empfänger weiß, dass die Kamera noch dasselbe sieht wie in diesem Bild).
+Nach ``max_skipped`` unterdrückten Bildern in Folge wird trotzdem eines
+behalten – der pHash übersieht kleine örtliche Änderungen (eine einzelne
+Frucht, die die Farbe wechselt), ``max_skipped`` begrenzt, wie lange so etwas
+unbemerkt bleibt (Standard 23: bei stündlichen Aufnahmen ein Bild pro Tag;
+``None`` nur für Messungen). ``report()`` zählt Bilder und Bytes; was nicht
+übertragen wird, wird auch nicht gespeichert, ``saved_bytes`` gilt also für
+Bandbreite und Speicher.
+
+Läuft als Stufe in ``FleetSimulator.run`` (auf der Kamera, spart Funk) und
+im ``IngestService`` (auf dem Gateway, spart Speicher).
+"""
+
+import io
+import struct
+
+import numpy as np
+from PIL import Image
+
+MODES = ("drop", "delta")
+DEFAULT_THRESHOLD = 4
+DEFAULT_MAX_SKIPPED = 23
+HASH_BITS = 64
+
+_DCT_SIZE = 32
+_LOW = 8
+_DELTA = struct.Struct(">2sQB")   # Kennung, Referenz-Hash, Abstand
+DELTA_MAGIC = b"DM"
+DELTA_BYTES = _DELTA.size
+
+
+def _dct_matrix(n=_DCT_SIZE):
+    k = np.arange(n)[:, None]
+    m = np.sqrt(2.0 / n) * np.cos(np.pi * (2 * np.arange(n)[None, :] + 1) * k / (2 * n))
+    m[0] /= np.sqrt(2.0)
+    return m.astype(np.float32)
+
+
+_DCT = _dct_matrix()
+
+
+def grayscale(frame, size=_DCT_SIZE):
+    """JPEG-Bytes (oder Pfad) → ``(size, size)`` float32 Graustufen."""
+    with Image.open(io.BytesIO(frame) if isinstance(frame, (bytes, bytearray)) else frame) as im:
+        # JPEG: nur die Luminanz, gleich verkleinert dekodieren
+        im.draft("L", (size, size))
+        return np.asarray(im.convert("L").resize((size, size), Image.Resampling.BOX), np.float32)
+
+
+def phash(pixels):
+    """64-Bit-pHashes (uint64) für einen Stapel ``(B, 32, 32)`` Graustufenbilder."""
+    pixels = np.asarray(pixels, np.float32).reshape(-1, _DCT_SIZE, _DCT_SIZE)
+    coeffs = (_DCT @ pixels @ _DCT.T)[:, :_LOW, :_LOW].reshape(len(pixels), -1)
+    # Gleichanteil (Helligkeit) nicht in den Median einrechnen
+    bits = coeffs > np.median(coeffs[:, 1:], axis=1, keepdims=True)
+    return np.packbits(bits, axis=1).view(">u8").ravel().astype(np.uint64)
+
+
+def hash_frames(frames):
+    """pHashes für eine Liste JPEG-Bytes."""
+    if not frames:
+        return np.zeros(0, np.uint64)
+    return phash(np.stack([grayscale(f) for f in frames]))
+
+
+def hamming(a, b):
+    """Hamming-Abstände zwischen uint64-Hashes (elementweise, mit Broadcasting)."""
+    return np.bitwise_count(np.bitwise_xor(np.asarray(a, np.uint64), np.asarray(b, np.uint64)))
+
+
+def delta_marker(reference, distance):
+    """Markierung „wie Referenzbild ``reference`` (pHash), Abstand ``distance``“."""
+    return _DELTA.pack(DELTA_MAGIC, int(reference), int(distance))
+
+
+def is_delta(payload):
+    return len(payload) == DELTA_BYTES and payload[:2] == DELTA_MAGIC
+
+
+class NearDuplicateFilter:
+    """Entscheidet je Kamera, welche Bilder weitergegeben werden."""
+
+    COUNTERS = ("frames", "kept", "suppressed", "forced", "bytes_in", "bytes_kept", "bytes_marker")
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, mode="drop", max_skipped=DEFAULT_MAX_SKIPPED):
+        if mode not in MODES:
+            raise ValueError(f"mode muss einer von {MODES} sein, nicht {mode!r}")
+        self.threshold = threshold
+        self.mode = mode
+        self.max_skipped = max_skipped
+        self._reference = {}
+        self._skipped = {}
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+
+    def decide(self, cameras, hashes):
+        """Maske der zu behaltenden Bilder, Referenz-Hash und Abstand dazu; aktualisiert die Referenzen.
+
+        Innerhalb eines Batches zählt die Reihenfolge: ein behaltenes Bild ist
+        Referenz für die folgenden derselben Kamera.
+        """
+        keep = np.ones(len(hashes), bool)
+        references = np.asarray(hashes, np.uint64).copy()
+        distance = np.full(len(hashes), HASH_BITS, np.int64)
+        for i, (camera, h) in enumerate(zip(np.asarray(cameras).tolist(), np.asarray(hashes).tolist())):
+            reference = self._reference.get(camera)
+            if reference is not None:
+                references[i] = reference
+                distance[i] = d = (reference ^ h).bit_count()
+                skipped = self._skipped.get(camera, 0)
+                if d <= self.threshold:
+                    if self.max_skipped is None or skipped < self.max_skipped:
+                        keep[i] = False
+                        self._skipped[camera] = skipped + 1
+                        continue
+                    self.forced += 1
+            self._reference[camera] = h
+            self._skipped[camera] = 0
+        return keep, references, distance
+
+    def filter(self, cameras, frames, hashes=None):
+        """Ausgehende Nutzlast je Bild: das Bild selbst, eine Delta-Markierung oder ``None``."""
+        if hashes is None:
+            hashes = hash_frames(frames)
+        keep, references, distance = self.decide(cameras, hashes)
+        out = []
+        for frame, reference, kept, d in zip(frames, references.tolist(), keep.tolist(), distance.tolist()):
+            self.frames += 1
+            self.bytes_in += len(frame)
+            if kept:
+                self.kept += 1
+                self.bytes_kept += len(frame)
+                out.append(frame)
+                continue
+            self.suppressed += 1
+            if self.mode == "delta":
+                marker = delta_marker(reference, d)
+                self.bytes_marker += len(marker)
+                out.append(marker)
+            else:
+                out.append(None)
+        return out
+
+    def report(self):
+        """Zähler sowie eingesparte Bytes (Bandbreite und Speicher) und deren Anteil."""
+        counts = {name: getattr(self, name) for name in self.COUNTERS}
+        # Markierungen werden übertragen und als Zeile protokolliert, Bilder nur, wenn behalten
+        out = self.bytes_kept + self.bytes_marker
+        counts.update({
+            "threshold": self.threshold,
+            "mode": self.mode,
+            "max_skipped": self.max_skipped,
+            "bytes_out": out,
+            "saved_bytes": self.bytes_in - out,
+            "saved_share": (self.bytes_in - out) / self.bytes_in if self.bytes_in else 0.0,
+        })
+        return counts
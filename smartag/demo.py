@@ -0,0 +1,118 @@
+"""Live-Demo (Tab 3): Messwerte des simulierten Feeds als Gauges und Verlauf.
+
+Die Anzeige ist ein eigenes Fragment mit ``run_every`` – sie aktualisiert sich
+im eingestellten Takt, ohne dass der Rest der Seite neu ausgeführt wird.
+"""
+
+import os
+import time
+
+import streamlit as st
+
+from smartag import decimate, rules
+from smartag.sensors import start_demo_feed
+
+REFRESH_SECONDS = float(os.environ.get("SMARTAG_DEMO_REFRESH", "2"))
+
+# Zeitfenster des Verlaufs ("Zoom"); jedes Fenster wird neu auf Chartbreite dezimiert
+TREND_WINDOWS = {"5 min": 300, "15 min": 900, "1 h": 3600}
+
+GAUGES = [
+    # Kanal, Titel, Skalierung, Achse, Balkenfarbe, Bereiche
+    ("bodenfeuchte", "Bodenfeuchte", 1, [0, 100], "#4caf50",
+     [([0, 30], "#ef9a9a"), ([30, 70], "#a5d6a7"), ([70, 100], "#fff59d")]),
+    ("temperatur", "Temperatur °C", 1, [0, 45], "#ff7043",
+     [([0, 20], "#bbdefb"), ([20, 35], "#e1f5fe"), ([35, 45], "#ffcdd2")]),
+    ("licht", "Licht (kLux)", 1000, [0, 100], "#ffb300",
+     [([0, 30], "#e0e0e0"), ([30, 80], "#fff9c4"), ([80, 100], "#ffecb3")]),
+]
+
+
+@st.cache_resource
+def sensor_store():
+    # Ein Feed für alle Sessions; der Ringpuffer hält den Speicher konstant
+    _, store, _ = start_demo_feed()
+    return store
+
+
+def decide(latest):
+    """Simulierte TinyML-Entscheidung für den aktuellen Messwert."""
+    state = rules.engine.evaluate({k: [v] for k, v in latest.items()})[0]
+    return state.label, state.color
+
+
+def gauge_figure(latest):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    # WICHTIG: 'type="domain"' für alle Subplots, da wir go.Indicator/Gauge nutzen!
+    fig = make_subplots(rows=1, cols=3, specs=[[{"type": "domain"}] * 3])
+    for col, (channel, title, scale, axis, color, steps) in enumerate(GAUGES, start=1):
+        fig.add_trace(go.Indicator(
+            mode="gauge+number",
+            value=latest[channel] / scale,
+            title={"text": title},
+            gauge={
+                "axis": {"range": axis},
+                "bar": {"color": color},
+                "steps": [{"range": r, "color": c} for r, c in steps],
+            },
+        ), row=1, col=col)
+    fig.update_layout(height=300, margin=dict(t=50, b=0, l=0, r=0))
+    return fig
+
+
+def trend_figure(store, since, width_px=decimate.DEFAULT_WIDTH_PX):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    fig = make_subplots(rows=3, cols=1, shared_xaxes=True, vertical_spacing=0.04)
+    for row, (channel, title, scale, _, color, _) in enumerate(GAUGES, start=1):
+        times, values = store.buffers[channel].snapshot(since=since)
+        times, values = decimate.decimate(times, values, width_px)
+        fig.add_trace(go.Scattergl(
+            x=(times * 1000).astype("datetime64[ms]"), y=values / scale,
+            mode="lines", name=title, line={"color": color, "width": 1.5},
+        ), row=row, col=1)
+        fig.update_yaxes(title_text=title, range=GAUGES[row - 1][3], row=row, col=1)
+    fig.update_layout(height=420, showlegend=False, margin=dict(t=10, b=0, l=0, r=0))
+    return fig
+
+
+@st.fragment(run_every=REFRESH_SECONDS)
+def render_live(charts=True):
+    store = sensor_store()
+    latest = store.latest()
+    if any(v != v for v in latest.values()):  # NaN: noch keine Messung
+        st.info("Warte auf erste Messwerte …")
+        return
+
+    decision, color = decide(latest)
+    col_werte, col_entscheidung = st.columns(2)
+    with col_werte:
+        for channel, title, scale, *_ in GAUGES:
+            st.metric(title, f"{latest[channel] / scale:.1f}".replace(".", ","))
+    with col_entscheidung:
+        st.markdown(f"""
+        <div style="padding: 2rem; border-radius: 15px; background-color: {color}20; border: 2px solid {color}; text-align: center;">
+            <h2>🤖 TinyML Entscheidung:</h2>
+            <h1 style="color:{color};">{decision}</h1>
+        </div>
+        """, unsafe_allow_html=True)
+
+    if not charts:
+        # Lite-Profil: kein Plotly auf dem Gateway
+        return
+
+    st.markdown("### 📈 Feldzustand Visualisierung")
+    st.plotly_chart(gauge_figure(latest), width="stretch")
+    window = st.radio(
+        "Zeitfenster", list(TREND_WINDOWS), index=1, horizontal=True, key="demo_trend_window"
+    )
+    st.plotly_chart(trend_figure(store, time.time() - TREND_WINDOWS[window]), width="stretch")
+
+
+def render_tab(charts=True):
+    st.markdown('<div class="section-header">Live Demo Simulation</div>', unsafe_allow_html=True)
+    st.info("👉 *Stellen Sie sich vor: Sie sind Bauer und überwachen Ihr Feld in Echtzeit.*")
+    render_live(charts)
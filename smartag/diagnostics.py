@@ -0,0 +1,63 @@
+"""Verstecktes Diagnose-Panel (``?diag=1&token=…``) für Abschnittszeiten und Asset-Cache.
+
+``?diag=memory&token=…`` zeigt zusätzlich die Speicherbilanz des
+Serverprozesses (``smartag.memory``); ``benchmarks/bench_load.py`` liest sie
+darüber aus. Beides nur mit dem Token aus ``SMARTAG_DIAG_TOKEN`` – ohne
+gesetzte Variable bleibt das Panel aus. Die Speicherbilanz kostet auf dem Pi
+Hunderte Millisekunden und zeigt Ausschnitte von Strings im Speicher.
+
+Ein- und ausgeschaltet (``?diag=off``) wird nur für die eigene Session.
+"""
+
+import hmac
+import json
+import os
+
+import streamlit as st
+
+from smartag import edge, profiling
+from smartag.assets import cache
+
+TOKEN = os.environ.get("SMARTAG_DIAG_TOKEN", "")
+MODES = ("1", "memory")
+
+
+def _authorized():
+    token = st.query_params.get("token", "")
+    return bool(TOKEN) and hmac.compare_digest(token.encode(), TOKEN.encode())
+
+
+def requested():
+    """Panel-Modus der Session (``"1"``, ``"memory"``) oder ``None``; schaltet die Messung für diesen Lauf."""
+    flag = st.query_params.get("diag")
+    if flag == "off":
+        st.session_state.pop("diag", None)
+    elif flag in MODES and _authorized():
+        st.session_state["diag"] = flag
+    mode = st.session_state.get("diag")
+    profiling.activate(mode is not None)
+    return mode
+
+
+def render_panel(mode):
+    with st.sidebar:
+        st.markdown("### 🩺 Diagnose")
+        rows = profiling.stats.summary()
+        if rows:
+            st.caption(f"Rollierende Perzentile über die letzten {profiling.stats.window} Läufe je Abschnitt")
+            st.dataframe(rows, hide_index=True, width="stretch")
+        else:
+            st.caption("Noch keine Messwerte – Seite einmal neu laden.")
+        asset_stats = cache.stats()
+        st.caption(
+            f"Asset-Cache: {asset_stats['hits']} Treffer, {asset_stats['misses']} Fehlzugriffe, "
+            f"{asset_stats['evictions']} verdrängt, {asset_stats['bytes'] / 1024 / 1024:.1f} MiB"
+        )
+        st.caption(f"Profil: {edge.describe()}")
+        if st.button("Messwerte zurücksetzen"):
+            profiling.stats.clear()
+        if mode == "memory":
+            from smartag import memory
+
+            with st.expander("Speicher", expanded=True):
+                st.json(json.dumps(memory.report()), expanded=False)
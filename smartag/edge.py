@@ -0,0 +1,93 @@
+"""Darstellungsprofil ``full`` oder ``lite`` für das Gateway.
+
+Auf dem Raspberry Pi laufen neben der Seite ChirpStack, MQTT, die Datenbank
+und Grafana. Das Lite-Profil hält die Seite deshalb klein:
+
+* Hintergrundbilder der Spalten werden durch CSS-Verläufe ersetzt
+* das Architekturdiagramm kommt als eine stark komprimierte WebP-Variante
+  (``python -m smartag.build_assets``) statt als ``<picture>`` mit Srcset
+* keine Plotly-Diagramme: die Live-Demo zeigt nur Messwerte und
+  Entscheidung, die Tabs Energieautarkie, Funkbudget (samt NumPy-Sweeps) und
+  Schnappschüsse werden weder importiert noch ausgeführt. Streamlit selbst importiert Plotly,
+  sobald es installiert ist – auf dem Gateway also nicht installieren.
+
+Auswahl pro Session, in dieser Reihenfolge: ``?profile=lite|full``,
+Umgebungsvariable ``SMARTAG_PROFILE`` (``auto`` | ``full`` | ``lite``), sonst
+automatisch – ``lite``, wenn beim Serverstart weniger als
+``SMARTAG_LITE_BELOW_MB`` (Standard 1024) MiB RAM verfügbar sind.
+
+Budget des Lite-Profils (``BUDGET``), geprüft von
+``benchmarks/check_edge_budget.py`` gegen einen frisch gestarteten Server
+(``tests/test_edge_budget.py`` startet ihn ohne Plotly, wie auf dem Gateway):
+
+=====================  =======  ===========================================
+``rss_mib``            160      RSS des Serverprozesses nach allen Läufen
+``cpu_ms_first``       800      Server-CPU-Zeit des ersten Laufs (mit Importen)
+``cpu_ms_rerun``       120      Server-CPU-Zeit je Rerun (Mittel)
+``first_run_kib``      40       Websocket-Bytes des ersten Laufs einer Session
+``rerun_kib``          16       Websocket-Bytes eines Reruns
+``forbidden_elements``  –       kein ``plotly_chart`` im Seitenaufbau
+=====================  =======  ===========================================
+"""
+
+import os
+
+PROFILES = ("full", "lite")
+LITE_BELOW_MB = int(os.environ.get("SMARTAG_LITE_BELOW_MB", "1024"))
+
+BUDGET = {
+    "rss_mib": 160,
+    "cpu_ms_first": 800,
+    "cpu_ms_rerun": 120,
+    "first_run_kib": 40,
+    "rerun_kib": 16,
+    "forbidden_elements": ("plotly_chart",),
+}
+
+_auto = {}
+
+
+def available_mb():
+    """``MemAvailable`` aus ``/proc/meminfo`` in MiB; ``None`` außerhalb von Linux."""
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return None
+
+
+def auto_profile():
+    """Einmal pro Prozess nach verfügbarem RAM entschieden."""
+    if "profile" not in _auto:
+        free = available_mb()
+        _auto["available_mb"] = free
+        _auto["profile"] = "lite" if free is not None and free < LITE_BELOW_MB else "full"
+    return _auto["profile"]
+
+
+def current():
+    """Profil der laufenden Session: Query-Parameter, dann Umgebung, dann automatisch."""
+    import streamlit as st
+
+    flag = st.query_params.get("profile")
+    if flag in PROFILES:
+        return flag
+    env = os.environ.get("SMARTAG_PROFILE", "auto").lower()
+    if env in PROFILES:
+        return env
+    return auto_profile()
+
+
+def is_lite():
+    return current() == "lite"
+
+
+def describe():
+    """Kurzbeschreibung für das Diagnose-Panel."""
+    profile = current()
+    if "available_mb" in _auto and os.environ.get("SMARTAG_PROFILE", "auto") == "auto":
+        return f"{profile} (automatisch, {_auto['available_mb']} MiB frei beim Start)"
+    return profile
@@ -0,0 +1,172 @@
+"""Energieautarkie: Jahressimulation des Batterie-Ladezustands für viele Konfigurationen.
+
+Für jede Kombination aus Solarmodul (Wp), Batterie (Wh) und Duty Cycle des
+Verbrauchers (Anteil der Stunden im Wachzustand, „Sleepy Server“) wird der
+Ladezustand Stunde für Stunde über ein Jahr fortgeschrieben. Die Schleife
+läuft über die 8760 Stunden, jeder Schritt rechnet mit NumPy über alle
+Konfigurationen gleichzeitig – 10 000 Konfigurationen dauern unter einer
+Sekunde.
+
+Die Einstrahlung ist entweder synthetisch (Sonnenstand für den Breitengrad,
+Bewölkung als autokorrelierter Tagesfaktor) oder wird aus einer lokalen CSV
+mit Stundenwerten in W/m² gelesen (stündlicher PVGIS-Export oder eigene CSV,
+siehe ``load_irradiance``; Umgebungsvariable ``SMARTAG_IRRADIANCE_CSV``).
+"""
+
+import os
+from dataclasses import dataclass
+
+import numpy as np
+
+HOURS = 8760
+LATITUDE = 51.0             # Mitte Deutschlands
+PERFORMANCE_RATIO = 0.8     # Verluste Modul, Verschattung, Laderegler
+CHARGE_EFFICIENCY = 0.9
+DEPTH_OF_DISCHARGE = 0.8    # nutzbarer Anteil der Nennkapazität (LiFePO4)
+
+# Kosten in Euro (Richtwerte für Kleinanlagen)
+COSTS = {"panel_per_wp": 1.2, "battery_per_wh": 0.5, "fixed": 40.0}
+
+IRRADIANCE_CSV = os.environ.get("SMARTAG_IRRADIANCE_CSV")
+
+
+@dataclass(frozen=True)
+class Profile:
+    """Leistungsaufnahme eines Verbrauchers in W."""
+    label: str
+    awake_w: float
+    sleep_w: float
+
+
+PROFILES = {
+    "gateway": Profile("Gateway/Server (Raspberry Pi)", awake_w=5.0, sleep_w=0.3),
+    "kamera": Profile("WiFi-Kamera", awake_w=2.5, sleep_w=0.05),
+}
+
+
+def synthetic_irradiance(latitude=LATITUDE, seed=0):
+    """Stündliche Globalstrahlung (W/m²) eines synthetischen Jahres."""
+    rng = np.random.default_rng(seed)
+    hours = np.arange(HOURS)
+    doy = hours // 24 + 1
+    declination = np.radians(23.44) * np.sin(2 * np.pi * (284 + doy) / 365)
+    hour_angle = np.radians(15 * (hours % 24 + 0.5 - 12))
+    lat = np.radians(latitude)
+    sin_elevation = np.sin(lat) * np.sin(declination) + np.cos(lat) * np.cos(declination) * np.cos(hour_angle)
+    clear_sky = 1000 * np.clip(sin_elevation, 0, None) ** 1.15
+
+    # Bewölkung: AR(1)-Prozess über Tage, im Winter im Mittel trüber
+    days = HOURS // 24
+    season = 0.6 + 0.15 * np.cos(2 * np.pi * (np.arange(days) - 172) / 365)
+    noise = np.empty(days)
+    noise[0] = 0.0
+    shocks = rng.normal(0, 0.18, days)
+    for d in range(1, days):
+        noise[d] = 0.6 * noise[d - 1] + shocks[d]
+    clearness = np.clip(season + noise, 0.08, 1.0)
+    return clear_sky * np.repeat(clearness, 24)
+
+
+def load_irradiance(path, column="G(i)"):
+    """Stundenwerte (W/m²) aus einer CSV-Datei; die ersten 8760 Werte werden verwendet.
+
+    Unterstützt werden eine einfache CSV mit Kopfzeile in Zeile 1 und der
+    stündliche PVGIS-Export (``seriescalc``, ``outputformat=csv``): dort stehen
+    Metadaten vor der Kopfzeile und eine Legende nach einer Leerzeile am Ende.
+    Kopfzeile ist die erste Zeile mit der Spalte ``column``; die Daten enden an
+    der ersten Leerzeile oder nicht numerischen Zeile.
+    """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        lines = f.read().splitlines()
+    for header, line in enumerate(lines):
+        names = [name.strip() for name in line.split(",")]
+        if column in names:
+            break
+    else:
+        raise ValueError(f"{path}: keine Kopfzeile mit Spalte {column!r}")
+    index = names.index(column)
+    values = []
+    for line in lines[header + 1:]:
+        fields = line.split(",")
+        if not line.strip() or len(fields) <= index:
+            break
+        try:
+            values.append(float(fields[index].strip() or "nan"))
+        except ValueError:
+            break
+    values = np.nan_to_num(np.array(values, dtype=float))
+    if len(values) < HOURS:
+        raise ValueError(f"{path}: {len(values)} Stundenwerte, benötigt {HOURS}")
+    return values[:HOURS]
+
+
+def irradiance():
+    return load_irradiance(IRRADIANCE_CSV) if IRRADIANCE_CSV else synthetic_irradiance()
+
+
+def grid(panels_wp, batteries_wh, duty_cycles):
+    """Alle Kombinationen als flache Arrays."""
+    p, b, d = np.meshgrid(panels_wp, batteries_wh, duty_cycles, indexing="ij")
+    return {"panel_wp": p.ravel().astype(float), "battery_wh": b.ravel().astype(float), "duty": d.ravel().astype(float)}
+
+
+def simulate(configs, profile, ghi=None):
+    """Ladezustand über ein Jahr für alle ``configs``; gibt Kennzahlen pro Konfiguration zurück."""
+    ghi = irradiance() if ghi is None else np.asarray(ghi, dtype=float)
+    panel_kw = configs["panel_wp"] / 1000
+    capacity = configs["battery_wh"] * DEPTH_OF_DISCHARGE
+    load = configs["duty"] * profile.awake_w + (1 - configs["duty"]) * profile.sleep_w
+    # Ertrag in Wh pro Stunde je kWp
+    harvest = ghi / 1000 * PERFORMANCE_RATIO * CHARGE_EFFICIENCY
+
+    soc = capacity.copy()
+    min_soc = capacity.copy()
+    unmet_wh = np.zeros_like(soc)
+    outage_hours = np.zeros_like(soc)
+    gain = np.empty_like(soc)
+    for h in range(len(ghi)):
+        np.multiply(panel_kw, harvest[h] * 1000, out=gain)
+        soc += gain
+        soc -= load
+        short = soc < 0
+        if short.any():
+            unmet_wh -= np.where(short, soc, 0)
+            outage_hours += short
+            np.maximum(soc, 0, out=soc)
+        np.minimum(soc, capacity, out=soc)
+        np.minimum(min_soc, soc, out=min_soc)
+
+    return {
+        **configs,
+        "load_w": load,
+        "autonomy_days": capacity / (load * 24),
+        "availability": 1 - outage_hours / len(ghi),
+        "unmet_wh": unmet_wh,
+        "min_soc": np.divide(min_soc, capacity, out=np.zeros_like(min_soc), where=capacity > 0),
+        "cost": cost(configs),
+    }
+
+
+def cost(configs):
+    return (COSTS["fixed"] + COSTS["panel_per_wp"] * configs["panel_wp"]
+            + COSTS["battery_per_wh"] * configs["battery_wh"])
+
+
+def pareto_front(cost, value, feasible=None):
+    """Indizes der Pareto-Front (minimale Kosten, maximaler Wert), nach Kosten sortiert."""
+    idx = np.arange(len(cost)) if feasible is None else np.flatnonzero(feasible)
+    if not len(idx):
+        return idx
+    order = idx[np.lexsort((-value[idx], cost[idx]))]
+    best_before = np.maximum.accumulate(np.concatenate([[-np.inf], value[order][:-1]]))
+    return order[value[order] > best_before]
+
+
+def sweep(profile, n_panels=25, n_batteries=20, n_duty=20, ghi=None):
+    """Standardraster (25 × 20 × 20 = 10 000 Konfigurationen)."""
+    configs = grid(
+        np.linspace(5, 120, n_panels),
+        np.linspace(20, 1000, n_batteries),
+        np.linspace(0.05, 1.0, n_duty),
+    )
+    return simulate(configs, profile, ghi)
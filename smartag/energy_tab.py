@@ -0,0 +1,92 @@
+"""Tab „Energieautarkie“: Pareto-Front Kosten vs. Autonomietage.
+
+Die Simulation (``smartag.energy``) läuft einmal pro Verbraucherprofil und
+wird mit ``st.cache_data`` für alle Sessions geteilt und auf der Platte
+abgelegt, damit sie auch nach einem Neustart des Servers nicht neu läuft; die
+Auswahl von Duty Cycle und Mindestverfügbarkeit filtert nur noch das Ergebnis.
+"""
+
+import time
+
+import numpy as np
+import streamlit as st
+
+from smartag import energy
+
+DEFAULT_DUTY = 0.2  # Wachanteil beim Öffnen des Tabs
+
+
+@st.cache_data(show_spinner="Simuliere 10 000 Konfigurationen …", persist="disk")
+def sweep(profile_key):
+    start = time.perf_counter()
+    result = energy.sweep(energy.PROFILES[profile_key])
+    return result, time.perf_counter() - start
+
+
+def pareto_figure(result, duty, min_availability):
+    import plotly.graph_objects as go
+
+    feasible = result["availability"] >= min_availability
+    selected = feasible & np.isclose(result["duty"], duty)
+    front = energy.pareto_front(result["cost"], result["autonomy_days"], selected)
+    hover = ("Modul %{customdata[0]:.0f} Wp<br>Batterie %{customdata[1]:.0f} Wh<br>"
+             "Wachanteil %{customdata[2]:.0%}<br>Verfügbarkeit %{customdata[3]:.2%}<br>"
+             "%{x:.0f} € · %{y:.1f} Tage<extra></extra>")
+    customdata = np.stack([result["panel_wp"], result["battery_wh"], result["duty"], result["availability"]], axis=1)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=result["cost"][feasible], y=result["autonomy_days"][feasible], customdata=customdata[feasible],
+        mode="markers", name="erfüllt Verfügbarkeit", hovertemplate=hover,
+        marker={"size": 4, "color": result["duty"][feasible], "colorscale": "Viridis", "opacity": 0.35,
+                "colorbar": {"title": "Wachanteil", "tickformat": ".0%"}},
+    ))
+    fig.add_trace(go.Scatter(
+        x=result["cost"][front], y=result["autonomy_days"][front], customdata=customdata[front],
+        mode="lines+markers", name=f"Pareto-Front ({duty:.0%} wach)", hovertemplate=hover,
+        line={"color": "#f44336", "width": 2}, marker={"size": 7},
+    ))
+    fig.update_layout(
+        height=450, margin=dict(t=30, b=0, l=0, r=0),
+        xaxis_title="Kosten (€)", yaxis_title="Autonomie (Tage ohne Sonne)",
+        legend={"orientation": "h", "y": 1.08},
+    )
+    return fig, front
+
+
+@st.fragment
+def render_simulation():
+    col_profil, col_duty, col_verf = st.columns(3)
+    with col_profil:
+        profile_key = st.radio(
+            "Verbraucher", list(energy.PROFILES), format_func=lambda k: energy.PROFILES[k].label,
+            key="energy_profile",
+        )
+    result, seconds = sweep(profile_key)
+    duties = np.unique(result["duty"])
+    # Startwert: der Rasterpunkt am nächsten an DEFAULT_DUTY, egal wie fein das Raster ist
+    start = float(duties[np.abs(duties - DEFAULT_DUTY).argmin()])
+    with col_duty:
+        duty = st.select_slider(
+            "Wachanteil (Sleepy Server)", options=duties.tolist(), value=start,
+            format_func=lambda d: f"{d:.0%}", key="energy_duty",
+        )
+    with col_verf:
+        min_availability = st.slider(
+            "Mindestverfügbarkeit", 0.90, 1.0, 0.99, step=0.005, format="%.3f", key="energy_availability",
+        )
+
+    fig, front = pareto_figure(result, duty, min_availability)
+    st.plotly_chart(fig, width="stretch")
+    n_configs = f"{len(result['cost']):,}".replace(",", ".")
+    duration = f"{seconds:.2f}".replace(".", ",")
+    st.caption(
+        f"{n_configs} Konfigurationen × {energy.HOURS} Stunden in {duration} s simuliert · "
+        f"{len(front)} Pareto-optimale Konfigurationen"
+    )
+
+
+def render_tab():
+    st.markdown('<div class="section-header">Energieautarkie simulieren</div>', unsafe_allow_html=True)
+    st.info("👉 *Welche Kombination aus Solarmodul und Batterie hält Gateway oder Kamera ein Jahr lang am Laufen?*")
+    render_simulation()
@@ -0,0 +1,264 @@
+"""Offline-Export der Präsentation als eine einzige, eigenständige HTML-Datei.
+
+    python -m smartag.export [-o dist/SmartAg.html]
+
+Das Skript wird einmal headless über Streamlits Test-API ausgeführt
+(Asset-Modus ``bundle``: optimierte Bildvarianten und PDF als Data-URIs) und
+der entstandene Elementbaum in statisches HTML übersetzt. Tabs werden ohne
+JavaScript über Radio-Buttons umgeschaltet, Spalten über Flexbox. Die Datei
+lässt sich von jedem Webserver (oder direkt vom USB-Stick) öffnen.
+
+Markdown wird in HTML übersetzt; Hinweise, Kennzahlen und Tabellen werden
+statisch übernommen, Eingabefelder als Zeile „Bezeichnung: Wert“ mit ihrem
+angezeigten Startwert. Was nur in der laufenden
+App funktioniert (Plotly-Diagramme, Bildergalerie, Schaltflächen), erscheint
+als Platzhalter; ``export()`` liefert die Liste dieser Elemente, und die
+Kommandozeile meldet sie.
+"""
+
+import argparse
+import html
+import os
+import re
+import sys
+from pathlib import Path
+
+from smartag.assets import BASE_DIR
+
+SCRIPT = BASE_DIR / "PraesentationSmartAg.py"
+DEFAULT_OUTPUT = BASE_DIR / "dist" / "SmartAg.html"
+
+# Grundlayout, das sonst Streamlits Frontend liefert (Schrift, Breite, Tabs, Spalten)
+BASE_CSS = """
+body { margin: 0; font-family: "Source Sans Pro", "Segoe UI", Roboto, sans-serif;
+       color: #31333F; line-height: 1.6; }
+.block-container { max-width: 1400px; margin: 0 auto; padding: 3rem 2rem 1rem; }
+.st-cols { display: flex; gap: 1rem; }
+.st-col { min-width: 0; }
+@media (max-width: 640px) { .st-cols { flex-direction: column; } }
+.st-tabs > input { display: none; }
+.st-tabs > label { display: inline-block; padding: 0.5rem 1rem; cursor: pointer;
+                   border-bottom: 2px solid transparent; }
+.st-tabs > .st-tab { display: none; padding-top: 1rem; border-top: 1px solid #e6e6e6; }
+img { max-width: 100%; }
+a { color: inherit; }
+.st-caption { font-size: 0.875rem; color: rgba(49, 51, 63, 0.6); }
+.st-alert { padding: 0.75rem 1rem; border-radius: 0.5rem; margin: 0.5rem 0; }
+.st-alert-info { background: rgba(28, 131, 225, 0.1); }
+.st-alert-warning { background: rgba(255, 193, 7, 0.15); }
+.st-alert-error { background: rgba(255, 43, 43, 0.09); }
+.st-alert-success { background: rgba(33, 195, 84, 0.1); }
+.st-metric .label { font-size: 0.875rem; }
+.st-metric .value { font-size: 2rem; }
+.st-widget { font-size: 0.875rem; margin: 0.25rem 0; }
+.st-placeholder { padding: 1.5rem; margin: 0.5rem 0; border: 1px dashed #c0c0c8; border-radius: 0.5rem;
+                  color: rgba(49, 51, 63, 0.6); text-align: center; }
+table { border-collapse: collapse; font-size: 0.875rem; }
+th, td { border: 1px solid #e6e6e6; padding: 0.25rem 0.5rem; }
+"""
+
+ALERTS = {"Info": "info", "Warning": "warning", "Error": "error", "Success": "success"}
+WIDGETS = ("Radio", "Selectbox", "SelectSlider", "Slider", "NumberInput", "Toggle", "Checkbox", "TextInput")
+# Nur in der laufenden App: Platzhalter mit diesem Text
+PLACEHOLDERS = {
+    "plotly_chart": "Interaktives Diagramm",
+    "imgs": "Bilder",
+    "button": "Schaltfläche",
+    "download_button": "Download",
+}
+
+
+_HEADING = re.compile(r"(#{1,6})\s+(.*?)\s*#*$")
+_LIST_ITEM = re.compile(r"\s*(?:[-*+]|(\d+)[.)])\s+(.*)")
+_INLINE = (
+    (re.compile(r"\*\*(.+?)\*\*|__(.+?)__"), lambda m: f"<strong>{m[1] or m[2]}</strong>"),
+    (re.compile(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*|(?<!\w)_(?!\s)(.+?)(?<!\s)_(?!\w)"),
+     lambda m: f"<em>{m[1] or m[2]}</em>"),
+    (re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)"), lambda m: f'<a href="{m[2].replace(chr(34), "&quot;")}">{m[1]}</a>'),
+)
+
+
+def _inline(text):
+    """Inline-Markdown (Code, fett, kursiv, Links) einer Zeile; Text wird escaped."""
+    parts = re.split(r"(`[^`]+`)", text)
+    out = []
+    for i, part in enumerate(parts):
+        if i % 2:
+            out.append(f"<code>{html.escape(part[1:-1])}</code>")
+            continue
+        part = html.escape(part, quote=False)
+        for pattern, repl in _INLINE:
+            part = pattern.sub(repl, part)
+        out.append(part)
+    return "".join(out)
+
+
+def markdown_html(text):
+    """Markdown-Teilmenge der Präsentation → HTML (Überschriften, Listen, Absätze); rohes HTML wird escaped."""
+    blocks = []
+    for block in re.split(r"\n\s*\n", text.strip()):
+        lines = block.splitlines()
+        heading = _HEADING.fullmatch(lines[0].strip())
+        if heading:
+            level = len(heading[1])
+            blocks.append(f"<h{level}>{_inline(heading[2])}</h{level}>")
+            lines = lines[1:]
+            if not lines:
+                continue
+        if re.fullmatch(r"\s*([-*_])(\s*\1){2,}\s*", block):
+            blocks.append("<hr>")
+        elif all(_LIST_ITEM.fullmatch(line) for line in lines):
+            tag = "ol" if _LIST_ITEM.fullmatch(lines[0])[1] else "ul"
+            items = "".join(f"<li>{_inline(_LIST_ITEM.fullmatch(line)[2])}</li>" for line in lines)
+            blocks.append(f"<{tag}>{items}</{tag}>")
+        else:
+            blocks.append(f"<p>{_inline(' '.join(line.strip() for line in lines))}</p>")
+    return "\n".join(blocks)
+
+
+class _Renderer:
+    def __init__(self):
+        self.tab_groups = 0
+        self.extra_css = []
+        self.skipped = []
+
+    def render(self, node):
+        kind = type(node).__name__
+        if kind == "Markdown":
+            return self.markdown(node)
+        if kind == "Caption":
+            return f'<div class="st-caption">{markdown_html(node.value)}</div>\n'
+        if kind in ALERTS:
+            return f'<div class="st-alert st-alert-{ALERTS[kind]}">{markdown_html(node.value)}</div>\n'
+        if kind == "Metric":
+            return (f'<div class="st-metric"><div class="label">{html.escape(node.label)}</div>'
+                    f'<div class="value">{html.escape(str(node.value))}</div></div>\n')
+        if kind in WIDGETS:
+            value = html.escape(self.widget_value(node))
+            return f'<div class="st-widget">{html.escape(node.label)}: <b>{value}</b></div>\n'
+        if kind == "Dataframe":
+            return node.value.to_html(index=False, border=0) + "\n"
+        if kind in ("Block", "SpecialBlock"):
+            if node.type == "tab_container":
+                return self.tabs(node)
+            if node.type == "flex_container" and any(
+                type(c).__name__ == "Column" for c in node.children.values()
+            ):
+                return self.columns(node)
+            return self.children(node)
+        if kind in ("Tab", "Column"):
+            return self.children(node)
+        return self.placeholder(node)
+
+    @staticmethod
+    def widget_value(node):
+        # Auswahlfelder: angezeigter Text (mit format_func), nicht den Rohwert
+        value = node.value
+        if type(node).__name__ in ("Radio", "Selectbox", "SelectSlider"):
+            if isinstance(value, (list, tuple)):
+                return " – ".join(str(node.format_func(v)) for v in value)
+            return str(node.format_func(value))
+        return str(value)
+
+    def placeholder(self, node):
+        element = getattr(node, "type", None) or type(node).__name__
+        if element == "empty":
+            return ""
+        self.skipped.append(element)
+        label = PLACEHOLDERS.get(element, "Interaktiver Inhalt")
+        return f'<div class="st-placeholder">{label} – nur in der laufenden App</div>\n'
+
+    def children(self, node):
+        parts = []
+        for child in node.children.values():
+            part = self.render(child)
+            # mehrere gleiche Platzhalter hintereinander (z. B. zwei Diagramme) nur einmal zeigen
+            if part and not (parts and part == parts[-1] and "st-placeholder" in part):
+                parts.append(part)
+        return "".join(parts)
+
+    def markdown(self, node):
+        body = node.proto.body
+        if not body.strip():
+            return ""
+        if not node.proto.allow_html:
+            body = markdown_html(body)
+        return f"<div class=\"st-md\">{body}</div>\n"
+
+    def columns(self, node):
+        cols = [c for c in node.children.values() if type(c).__name__ == "Column"]
+        inner = "".join(
+            f'<div class="st-col" style="flex: {c.weight:.4f} 1 0;">{self.render(c)}</div>'
+            for c in cols
+        )
+        return f'<div class="st-cols">{inner}</div>\n'
+
+    def tabs(self, node):
+        self.tab_groups += 1
+        group = f"tabs{self.tab_groups}"
+        tabs = list(node.children.values())
+        out = [f'<div class="st-tabs" id="{group}">']
+        for i, tab in enumerate(tabs):
+            checked = " checked" if i == 0 else ""
+            out.append(f'<input type="radio" name="{group}" id="{group}-{i}"{checked}>')
+            out.append(f'<label for="{group}-{i}">{html.escape(tab.label)}</label>')
+            self.extra_css.append(
+                f"#{group}-{i}:checked ~ #{group}-p{i} {{ display: block; }}\n"
+                f"#{group}-{i}:checked + label {{ border-bottom-color: #ff4b4b; color: #ff4b4b; }}"
+            )
+        for i, tab in enumerate(tabs):
+            out.append(f'<div class="st-tab" id="{group}-p{i}">{self.render(tab)}</div>')
+        out.append("</div>\n")
+        return "".join(out)
+
+
+def render_tree(main, title):
+    """HTML-Seite und Liste der nur als Platzhalter übernommenen Elemente."""
+    renderer = _Renderer()
+    body = renderer.render(main)
+    css = BASE_CSS + "\n".join(renderer.extra_css)
+    return renderer.skipped, (
+        "<!DOCTYPE html>\n<html lang=\"de\">\n<head>\n<meta charset=\"utf-8\">\n"
+        "<meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">\n"
+        f"<title>{html.escape(title)}</title>\n<style>{css}</style>\n</head>\n"
+        f"<body>\n<div class=\"block-container\">\n{body}</div>\n</body>\n</html>\n"
+    )
+
+
+def export(output=DEFAULT_OUTPUT, timeout=120):
+    """Schreibt die HTML-Datei; ``(pfad, bytes, platzhalter)``."""
+    from streamlit.testing.v1 import AppTest
+
+    previous = os.environ.get("SMARTAG_ASSET_MODE")
+    os.environ["SMARTAG_ASSET_MODE"] = "bundle"
+    try:
+        at = AppTest.from_file(str(SCRIPT), default_timeout=timeout).run()
+    finally:
+        if previous is None:
+            os.environ.pop("SMARTAG_ASSET_MODE", None)
+        else:
+            os.environ["SMARTAG_ASSET_MODE"] = previous
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    skipped, page = render_tree(at.main, "Smarte und resiliente Landwirtschaft mit Edge AI")
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(page, encoding="utf-8")
+    return output, len(page.encode("utf-8")), skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", default=str(DEFAULT_OUTPUT))
+    args = parser.parse_args(argv)
+    path, size, skipped = export(args.output)
+    print(f"{path}: {size / 1024:.0f} KiB")
+    if skipped:
+        counts = {name: skipped.count(name) for name in dict.fromkeys(skipped)}
+        print("Nur als Platzhalter (interaktiv): " + ", ".join(f"{n}× {name}" for name, n in counts.items()),
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
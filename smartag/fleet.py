@@ -0,0 +1,180 @@
+"""Flottensimulator: N Kameras senden Detektionen in festen Intervallen.
+
+Jede Kamera hat eine zufällige Phase innerhalb des Sendeintervalls; die
+simulierte Zeit läuft ``speedup``-mal schneller als die echte. In jedem Tick
+wird vektorisiert bestimmt, welche Kameras fällig sind, ihre Messwerte
+erzeugt und mit ``smartag.codec`` kodiert. Mit ``readings > 1`` trägt jeder
+Uplink mehrere Messungen als Delta-Batch.
+
+    fleet = FleetSimulator(1000, interval=3600, speedup=600)
+    await fleet.run(service.submit, duration=10)
+
+Wartet ``send`` (Backpressure), bleibt der Simulator hinter der Sollzeit
+zurück; ``stats()`` zeigt angebotene und tatsächlich gesendete Uplinks.
+
+Mit ``send_frame`` schickt jede fällige Kamera zusätzlich ein Bild (JPEG,
+``frame_size``) über WLAN. Jede Kamera sieht dieselbe Pflanze: Tageslicht und
+Sensorrauschen ändern jedes Bild ein wenig, gelegentlich reift eine Frucht
+(``ripen_rate`` je Frucht und Aufnahme). Ein ``NearDuplicateFilter`` als
+``dedup`` läuft dann als Stufe auf der Kamera, vor dem Senden.
+"""
+
+import asyncio
+import io
+import time
+
+import numpy as np
+from PIL import Image
+
+from smartag import codec, gallery
+
+SPECIES = ("Tomate", "Gurke", "Paprika", "Erdbeere", "Apfel")
+LOCATIONS = tuple(f"Feld {i}" for i in range(1, 13))
+EPOCH = 1743465600  # 2025-04-01, Saisonbeginn
+
+
+class FleetSimulator:
+    def __init__(self, n_cameras, interval=3600.0, speedup=1.0, readings=1, tick=0.05, seed=0,
+                 frame_size=(320, 240), ripen_rate=0.02):
+        self.n = n_cameras
+        self.interval = float(interval)
+        self.speedup = float(speedup)
+        self.readings = readings
+        self.tick = tick
+        self.rng = np.random.default_rng(seed)
+        self.ids = np.arange(1, n_cameras + 1)
+        self.phase = self.rng.uniform(0, self.interval, n_cameras)
+        self.fruit = self.rng.poisson(12, n_cameras).astype(np.int64)
+        self.battery = self.rng.uniform(60, 100, n_cameras)
+        self.offered = 0
+        self.sent = 0
+        self.elapsed = 0.0
+        # Bilder: eigener Zufallsstrom, damit Messwerte mit und ohne Bilder gleich bleiben
+        self.frame_size = frame_size
+        self.ripen_rate = ripen_rate
+        self.frame_rng = np.random.default_rng(seed + 1)
+        self._scenes = {}
+        self.frames_offered = 0
+        self.frames_sent = 0
+        self.frame_bytes = 0
+
+    def registry(self):
+        return {
+            int(cid): (SPECIES[i % len(SPECIES)], LOCATIONS[i % len(LOCATIONS)])
+            for i, cid in enumerate(self.ids)
+        }
+
+    @property
+    def offered_rate(self):
+        """Uplinks pro Sekunde Echtzeit."""
+        return self.n / self.interval * self.speedup
+
+    def due(self, t0, t1):
+        """Kamera-Indizes (mit Wiederholung), die in ``[t0, t1)`` Simulationszeit senden."""
+        counts = (np.floor((t1 - self.phase) / self.interval) - np.floor((t0 - self.phase) / self.interval)).astype(np.int64)
+        return np.repeat(np.arange(self.n), counts)
+
+    def readings_for(self, idx, t):
+        """Messwerte für die Kameras ``idx`` zum Simulationszeitpunkt ``t``."""
+        n = len(idx)
+        self.fruit[idx] = np.maximum(self.fruit[idx] + self.rng.integers(-2, 3, n), 0)
+        self.battery[idx] = np.maximum(self.battery[idx] - 0.01, 5)
+        return {
+            "ts": np.full(n, EPOCH + int(t)),
+            "fruit_count": self.fruit[idx],
+            "ripeness": self.rng.integers(0, 4, n),
+            "confidence": self.rng.uniform(0.5, 1.0, n),
+            "battery": self.battery[idx],
+            "stress": (self.rng.random(n) < 0.05).astype(np.int64),
+        }
+
+    def uplinks(self, idx, t):
+        """Liste ``(kamera_id, nutzlast)`` für die fälligen Kameras."""
+        if self.readings == 1:
+            payload = codec.encode(self.readings_for(idx, t)).tobytes()
+            size = codec.SINGLE_BYTES
+            return [(int(cid), payload[i * size:(i + 1) * size]) for i, cid in enumerate(self.ids[idx].tolist())]
+        step = self.interval / self.readings
+        series = [self.readings_for(idx, t - (self.readings - 1 - k) * step) for k in range(self.readings)]
+        return [
+            (int(self.ids[i]), codec.encode_batch({name: np.array([s[name][j] for s in series]) for name in codec.FIELDS}))
+            for j, i in enumerate(idx)
+        ]
+
+    def frames_for(self, idx, t):
+        """JPEG-Aufnahmen der Kameras ``idx`` zum Simulationszeitpunkt ``t`` und Maske „Szene verändert“."""
+        width, height = self.frame_size
+        rng = self.frame_rng
+        light = 1.0 + 0.1 * np.sin(2 * np.pi * t / 86400)
+        frames, changed = [], np.zeros(len(idx), bool)
+        for j, i in enumerate(idx.tolist()):
+            scene = self._scenes.get(i)
+            if scene is None:
+                background = gallery.leaves(rng, width, height)
+                fruits = gallery.random_fruits(rng, width, height)
+                scene = self._scenes[i] = [background, fruits, None]
+            ripe = [f for f in scene[1] if f[4] < len(gallery.RIPENESS_COLORS) - 1 and rng.random() < self.ripen_rate]
+            for fruit in ripe:
+                fruit[4] += 1
+            if ripe or scene[2] is None:
+                changed[j] = bool(ripe)
+                scene[2] = np.asarray(gallery.draw_fruits(scene[0], scene[1]), np.float32)
+            noise = rng.integers(-4, 5, scene[2].shape, dtype=np.int16)
+            pixels = np.clip(scene[2] * light + noise, 0, 255).astype(np.uint8)
+            out = io.BytesIO()
+            Image.fromarray(pixels).save(out, "JPEG", quality=80)
+            frames.append(out.getvalue())
+        return frames, changed
+
+    async def _send_frames(self, idx, t, send_frame, dedup):
+        frames, _ = self.frames_for(idx, t)
+        cameras = self.ids[idx]
+        payloads = dedup.filter(cameras, frames) if dedup is not None else frames
+        ts = EPOCH + int(t)
+        for camera_id, payload in zip(cameras.tolist(), payloads):
+            self.frames_offered += 1
+            if payload is None:
+                continue
+            await send_frame(camera_id, ts, payload)
+            self.frames_sent += 1
+            self.frame_bytes += len(payload)
+
+    async def run(self, send, duration, send_frame=None, dedup=None):
+        """``duration`` Sekunden Echtzeit lang Uplinks über ``await send(id, payload)`` abgeben.
+
+        Mit ``send_frame`` zusätzlich je Uplink ein Bild über ``await send_frame(id, ts, jpeg)``,
+        vorher gefiltert durch ``dedup`` (``smartag.dedup.NearDuplicateFilter``).
+        """
+        start = time.perf_counter()
+        sim_prev = 0.0
+        while True:
+            now = time.perf_counter() - start
+            if now >= duration:
+                break
+            sim_now = now * self.speedup
+            idx = self.due(sim_prev, sim_now)
+            sim_prev = sim_now
+            if len(idx):
+                batch = self.uplinks(idx, sim_now)
+                self.offered += len(batch)
+                for camera_id, payload in batch:
+                    await send(camera_id, payload)
+                    self.sent += 1
+                if send_frame is not None:
+                    await self._send_frames(idx, sim_now, send_frame, dedup)
+            await asyncio.sleep(self.tick)
+        self.elapsed = time.perf_counter() - start
+
+    def stats(self):
+        expected = len(self.due(0.0, self.elapsed * self.speedup))
+        return {
+            "cameras": self.n,
+            "offered_per_s": self.offered_rate,
+            "sent": self.sent,
+            "sent_per_s": self.sent / self.elapsed if self.elapsed else 0.0,
+            # Anteil der Sollmenge, die tatsächlich abgegeben werden konnte
+            "keep_up": self.sent / expected if expected else 1.0,
+            "frames_offered": self.frames_offered,
+            "frames_sent": self.frames_sent,
+            "frame_bytes": self.frame_bytes,
+        }
@@ -0,0 +1,432 @@
+"""Schnappschuss-Galerie: Index und Thumbnails der Kamerabilder.
+
+Die Kameras legen ihre Bilder in Ordnern nach Kamera, Ort und Tag ab::
+
+    <root>/<kamera>/<ort>/<YYYY-MM-DD>/<HHMMSS>.jpg
+    <root>/<kamera>/<ort>/<YYYY-MM-DD>/<HHMMSS>.json   # Detektionen, siehe smartag.overlay
+
+``SnapshotIndex`` hält je Bild Kamera, Ort, Tag, Größe, mtime, Inhalts-Hash
+(BLAKE2b) und Abmessungen in SQLite (Standard ``<root>/.index.db``). ``scan()``
+ist inkrementell: Tagesordner, deren mtime sich nicht geändert hat, werden
+nicht gelistet, und nur neue oder geänderte Dateien werden gelesen (Hash und
+Bildkopf, parallel im Thread-Pool). Dateien, die an Ort und Stelle
+überschrieben werden, ändern die Ordner-mtime nicht – dafür ``scan(full=True)``.
+Seiten kommen per ``LIMIT``/``OFFSET`` aus dem Index, ohne Verzeichnis-Scan.
+
+``ThumbnailCache`` erzeugt Thumbnails erst, wenn eine Seite sie braucht,
+parallel im Thread-Pool (PIL gibt beim Dekodieren die GIL frei; JPEGs werden
+per ``draft`` schon beim Dekodieren verkleinert), und hält sie als JPEG in
+einem nach Bytes begrenzten LRU-Cache. JPEG statt WebP, weil der WebP-Encoder
+bei Thumbnail-Größe ein Vielfaches der übrigen Arbeit kostet. Schlüssel ist der Inhalts-Hash –
+kopierte oder umbenannte Bilder teilen sich ein Thumbnail.
+
+Demo-Bilder erzeugen::
+
+    python -m smartag.gallery snapshots --cameras 6 --days 14 --per-day 24
+"""
+
+import argparse
+import hashlib
+import io
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageOps
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+FILTERS = ("camera", "location", "day")
+INDEX_NAME = ".index.db"
+
+THUMB_SIZE = 240
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS folders (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL)",
+    """CREATE TABLE IF NOT EXISTS snapshots (
+        path TEXT PRIMARY KEY, folder TEXT NOT NULL,
+        camera TEXT NOT NULL, location TEXT NOT NULL, day TEXT NOT NULL, name TEXT NOT NULL,
+        size INTEGER, mtime_ns INTEGER, hash TEXT, width INTEGER, height INTEGER)""",
+    # Seitenreihenfolge day, name, path: path macht sie eindeutig (gleiche Dateinamen je Kamera)
+    "CREATE INDEX IF NOT EXISTS snapshots_by_camera ON snapshots (camera, location, day, name, path)",
+    "CREATE INDEX IF NOT EXISTS snapshots_by_location ON snapshots (location, day, name, path)",
+    "CREATE INDEX IF NOT EXISTS snapshots_by_day ON snapshots (day, name, path)",
+    "CREATE INDEX IF NOT EXISTS snapshots_folder ON snapshots (folder)",
+)
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+)
+
+ROW_COLUMNS = ("path", "camera", "location", "day", "name", "size", "hash", "width", "height")
+
+
+def _subdirs(path):
+    with os.scandir(path) as entries:
+        return sorted((e for e in entries if e.is_dir() and not e.name.startswith(".")), key=lambda e: e.name)
+
+
+def probe(path):
+    """``(hash, breite, höhe)``; liest die Datei einmal, vom Bild nur den Kopf."""
+    raw = Path(path).read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=8).hexdigest()
+    try:
+        with Image.open(io.BytesIO(raw)) as im:
+            width, height = im.size
+    except OSError:
+        width = height = None
+    return digest, width, height
+
+
+class SnapshotIndex:
+    def __init__(self, root, index_path=None, workers=None):
+        self.root = Path(root)
+        self.path = str(index_path or self.root / INDEX_NAME)
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self.last_scan = None
+        db = self._conn()
+        with db:
+            for statement in SCHEMA:
+                db.execute(statement)
+
+    def _conn(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            for pragma in PRAGMAS:
+                db.execute(pragma)
+            self._local.db = db
+        return db
+
+    def close(self):
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+    # --- Scan ---
+
+    def _folders(self):
+        """``{"kamera/ort/tag": mtime_ns}`` aller Tagesordner (nur ``stat`` der Ordner)."""
+        folders = {}
+        if not self.root.is_dir():
+            return folders
+        for camera in _subdirs(self.root):
+            for location in _subdirs(camera.path):
+                for day in _subdirs(location.path):
+                    folders[f"{camera.name}/{location.name}/{day.name}"] = day.stat().st_mtime_ns
+        return folders
+
+    def scan(self, full=False):
+        """Index mit dem Dateisystem abgleichen; liefert Zähler und Dauer."""
+        start = time.perf_counter()
+        with self._write_lock:
+            db = self._conn()
+            folders = self._folders()
+            known = dict(db.execute("SELECT path, mtime_ns FROM folders"))
+            changed = [f for f, mtime in folders.items() if full or known.get(f) != mtime]
+            gone = [f for f in known if f not in folders]
+
+            pending, removed = [], 0
+            for folder in changed:
+                indexed = {
+                    path: (size, mtime)
+                    for path, size, mtime in db.execute(
+                        "SELECT path, size, mtime_ns FROM snapshots WHERE folder = ?", (folder,))
+                }
+                with os.scandir(self.root / folder) as entries:
+                    for entry in entries:
+                        if not entry.is_file() or Path(entry.name).suffix.lower() not in IMAGE_SUFFIXES:
+                            continue
+                        path = f"{folder}/{entry.name}"
+                        stat = entry.stat()
+                        if indexed.pop(path, None) != (stat.st_size, stat.st_mtime_ns):
+                            pending.append((path, folder, stat.st_size, stat.st_mtime_ns))
+                removed += len(indexed)
+                db.executemany("DELETE FROM snapshots WHERE path = ?", ((p,) for p in indexed))
+
+            # Hash und Abmessungen parallel: Lesen und BLAKE2b geben die GIL frei
+            with ThreadPoolExecutor(self.workers) as pool:
+                probed = pool.map(probe, (self.root / p[0] for p in pending), chunksize=64)
+                rows = [
+                    (path, folder, *folder.split("/"), path.rsplit("/", 1)[1], size, mtime, *info)
+                    for (path, folder, size, mtime), info in zip(pending, probed)
+                ]
+
+            with db:
+                db.executemany("INSERT OR REPLACE INTO snapshots VALUES (?,?,?,?,?,?,?,?,?,?,?)", rows)
+                for folder in gone:
+                    removed += db.execute("DELETE FROM snapshots WHERE folder = ?", (folder,)).rowcount
+                db.executemany("DELETE FROM folders WHERE path = ?", ((f,) for f in gone))
+                db.executemany("INSERT OR REPLACE INTO folders VALUES (?, ?)",
+                               ((f, folders[f]) for f in changed))
+            self.last_scan = time.monotonic()
+        return {
+            "folders": len(folders), "changed": len(changed), "indexed": len(rows),
+            "removed": removed, "seconds": time.perf_counter() - start,
+        }
+
+    def refresh(self, max_age=60.0):
+        """``scan()``, wenn der letzte Scan älter als ``max_age`` Sekunden ist; sonst ``None``."""
+        if self.last_scan is not None and time.monotonic() - self.last_scan < max_age:
+            return None
+        return self.scan()
+
+    # --- Abfragen ---
+
+    def _where(self, filters):
+        unknown = set(filters) - set(FILTERS)
+        if unknown:
+            raise ValueError(f"unbekannte Filter: {sorted(unknown)}")
+        items = [(k, v) for k, v in filters.items() if v is not None]
+        if not items:
+            return "", ()
+        return " WHERE " + " AND ".join(f"{k} = ?" for k, _ in items), tuple(v for _, v in items)
+
+    def count(self, **filters):
+        where, params = self._where(filters)
+        return self._conn().execute(f"SELECT COUNT(*) FROM snapshots{where}", params).fetchone()[0]
+
+    def facets(self, column, **filters):
+        """Werte von ``column`` mit Anzahl Bilder, unter den übrigen Filtern."""
+        if column not in FILTERS:
+            raise ValueError(f"unbekannte Spalte: {column}")
+        where, params = self._where(filters)
+        order = "DESC" if column == "day" else "ASC"
+        return self._conn().execute(
+            f"SELECT {column}, COUNT(*) FROM snapshots{where} GROUP BY {column} ORDER BY {column} {order}", params
+        ).fetchall()
+
+    def page(self, number, per_page, **filters):
+        """Seite ``number`` (ab 0), neueste Bilder zuerst; Liste von Dicts."""
+        where, params = self._where(filters)
+        rows = self._conn().execute(
+            f"SELECT {', '.join(ROW_COLUMNS)} FROM snapshots{where} ORDER BY day DESC, name DESC, path DESC "
+            "LIMIT ? OFFSET ?",
+            params + (per_page, number * per_page),
+        )
+        return [dict(zip(ROW_COLUMNS, row)) for row in rows]
+
+    def absolute(self, row):
+        return self.root / row["path"]
+
+
+def open_scaled(path, size, resample=Image.Resampling.BILINEAR):
+    """Bild als RGB, längste Kante höchstens ``size``.
+
+    JPEGs werden per ``draft`` schon beim Dekodieren um 1/2…1/8 verkleinert;
+    dafür braucht ``draft`` die Zielgröße im Seitenverhältnis des Bildes.
+    """
+    with Image.open(path) as im:
+        scale = size / max(im.size)
+        if scale < 1:
+            im.draft("RGB", (max(1, int(im.width * scale)), max(1, int(im.height * scale))))
+        im = ImageOps.exif_transpose(im).convert("RGB")
+    im.thumbnail((size, size), resample)
+    return im
+
+
+def make_thumbnail(path, size=THUMB_SIZE, quality=75):
+    """JPEG-Thumbnail (längste Kante ``size``) als Bytes."""
+    out = io.BytesIO()
+    open_scaled(path, size).save(out, "JPEG", quality=quality)
+    return out.getvalue()
+
+
+class ByteLRU:
+    """Thread-sicherer LRU-Cache für Bytes, begrenzt über ``max_bytes``."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _store(self, key, data):
+        # Aufrufer hält self._lock
+        if key not in self._entries:
+            self._entries[key] = data
+            self._bytes += len(data)
+
+    def _evict(self):
+        while len(self._entries) > 1 and self._bytes > self.max_bytes:
+            _, data = self._entries.popitem(last=False)
+            self._bytes -= len(data)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class ThumbnailCache(ByteLRU):
+    """Thumbnails im LRU-Cache; fehlende entstehen im Thread-Pool."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, size=THUMB_SIZE, workers=None):
+        super().__init__(max_bytes)
+        self.size = size
+        self._pending = {}
+        self._pool = ThreadPoolExecutor(workers or min(8, os.cpu_count() or 1), thread_name_prefix="thumbs")
+
+    def get_many(self, items):
+        """Thumbnails zu ``(hash, pfad)``-Paaren in gleicher Reihenfolge; ``None`` bei Fehlern."""
+        futures = {}
+        with self._lock:
+            for key, path in items:
+                if key in self._entries or key in futures:
+                    continue
+                # Gleiche Bilder, die eine andere Session gerade rechnet, nicht doppelt erzeugen
+                future = self._pending.get(key)
+                if future is None:
+                    future = self._pool.submit(make_thumbnail, path, self.size)
+                    self._pending[key] = future
+                futures[key] = future
+        for key, future in futures.items():
+            data = None
+            try:
+                data = future.result()
+            except Exception:
+                # kaputte Datei, Pillow-Fehler, Speicher: kein Thumbnail
+                pass
+            finally:
+                # nie einen fehlgeschlagenen Future stehen lassen, sonst erbt ihn jede Session
+                with self._lock:
+                    self._pending.pop(key, None)
+                    if data is not None:
+                        self._store(key, data)
+        result = []
+        with self._lock:
+            for key, _ in items:
+                data = self._entries.get(key)
+                if data is not None:
+                    self._entries.move_to_end(key)
+                if key in futures:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                result.append(data)
+            self._evict()
+        return result
+
+
+# --- Demo-Bilder ---
+
+RIPENESS_COLORS = ((70, 160, 60), (190, 200, 60), (235, 140, 40), (210, 40, 30))
+
+
+def leaves(rng, width=640, height=480):
+    """Blattwerk: grobes Rauschen mit Helligkeitsverlauf, bilinear auf Bildgröße gezogen."""
+    noise = rng.normal(0, 12, (height // 8 + 1, width // 8 + 1, 1)).astype(np.float32)
+    shade = np.linspace(0, 1, noise.shape[0], dtype=np.float32)[:, None, None]
+    pixels = np.array([40, 90, 35], np.float32) + shade * np.array([50, 40, 10], np.float32) + noise
+    return Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8)).resize((width, height), Image.Resampling.BILINEAR)
+
+
+def random_fruits(rng, width, height, n=12):
+    """``n`` Früchte als Boxen ``[x0, y0, x1, y1, reife]``."""
+    fruits = []
+    for _ in range(n):
+        r = int(rng.integers(height // 40, height // 14))
+        cx, cy = int(rng.integers(r, width - r)), int(rng.integers(r, height - r))
+        fruits.append([cx - r, cy - r, cx + r, cy + r, int(rng.integers(0, len(RIPENESS_COLORS)))])
+    return fruits
+
+
+def draw_fruits(background, fruits):
+    im = background.copy()
+    draw = ImageDraw.Draw(im)
+    for x0, y0, x1, y1, ripeness in fruits:
+        draw.ellipse((x0, y0, x1, y1), fill=RIPENESS_COLORS[ripeness])
+    return im
+
+
+def synthetic_frame(rng, width=640, height=480, fruits=12):
+    """Pflanzenbild mit Früchten; liefert ``(PIL.Image, boxen)`` mit Boxen ``(x0, y0, x1, y1, reife)``."""
+    background = leaves(rng, width, height)
+    boxes = random_fruits(rng, width, height, fruits)
+    return draw_fruits(background, boxes), [tuple(b) for b in boxes]
+
+
+def camera_folder(camera_id):
+    return f"kamera-{camera_id:03d}"
+
+
+def snapshot_path(root, camera_id, location, ts):
+    """Ablageort eines Bildes der Kamera ``camera_id`` zum Unix-Zeitpunkt ``ts`` (UTC)."""
+    moment = datetime.fromtimestamp(ts, timezone.utc)
+    return Path(root) / camera_folder(camera_id) / location / moment.date().isoformat() / f"{moment:%H%M%S}.jpg"
+
+
+def write_demo(root, cameras=6, days=14, per_day=24, width=640, height=480, seed=0, start=date(2025, 6, 1)):
+    """Demo-Ordnerbaum unter ``root`` anlegen, mit Detektionen je Bild; gibt die Anzahl Bilder zurück."""
+    from smartag import overlay
+    from smartag.fleet import LOCATIONS, SPECIES
+
+    rng = np.random.default_rng(seed)
+    root = Path(root)
+    jobs = []
+    for cam in range(1, cameras + 1):
+        location = LOCATIONS[(cam - 1) % len(LOCATIONS)]
+        for d in range(days):
+            folder = root / camera_folder(cam) / location / (start + timedelta(days=d)).isoformat()
+            folder.mkdir(parents=True, exist_ok=True)
+            for i in range(per_day):
+                seconds = 6 * 3600 + i * (14 * 3600 // per_day)
+                name = f"{seconds // 3600:02d}{seconds // 60 % 60:02d}{seconds % 60:02d}.jpg"
+                jobs.append((folder / name, SPECIES[(cam - 1) % len(SPECIES)], int(rng.integers(2**31))))
+
+    def write(job):
+        path, species, job_seed = job
+        frame_rng = np.random.default_rng(job_seed)
+        im, boxes = synthetic_frame(frame_rng, width, height)
+        im.save(path, "JPEG", quality=80)
+        overlay.write_detections(path, [
+            {"box": [x0 / width, y0 / height, x1 / width, y1 / height], "label": species,
+             "ripeness": ripeness, "confidence": float(frame_rng.uniform(0.6, 0.99))}
+            for x0, y0, x1, y1, ripeness in boxes
+        ], model="fruitnet-demo")
+
+    with ThreadPoolExecutor(min(8, os.cpu_count() or 1)) as pool:
+        list(pool.map(write, jobs, chunksize=32))
+    return len(jobs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Demo-Schnappschüsse für die Galerie erzeugen")
+    parser.add_argument("root")
+    parser.add_argument("--cameras", type=int, default=6)
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--per-day", type=int, default=24)
+    args = parser.parse_args(argv)
+    n = write_demo(args.root, args.cameras, args.days, args.per_day)
+    print(f"{n} Bilder unter {args.root}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
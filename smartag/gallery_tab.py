@@ -0,0 +1,112 @@
+"""Tab „Schnappschüsse“: Kamerabilder nach Kamera, Ort und Tag durchblättern.
+
+Index und Thumbnail-Cache (``smartag.gallery``) sind Ressourcen des Prozesses
+und werden von allen Sessions geteilt. Ein Rerun liest nur eine Seite aus dem
+Index; das Dateisystem wird höchstens alle ``RESCAN_SECONDS`` abgeglichen, und
+auch dann werden nur geänderte Tagesordner gelistet. Mit „Detektionen
+einblenden“ kommen statt der Thumbnails die Komposite aus ``smartag.overlay``.
+"""
+
+import math
+import os
+from pathlib import Path
+
+import streamlit as st
+
+from smartag import gallery, overlay
+from smartag.assets import BASE_DIR
+
+SNAPSHOT_DIR = os.environ.get("SMARTAG_SNAPSHOTS", str(BASE_DIR / "snapshots"))
+THUMB_CACHE_BYTES = int(os.environ.get("SMARTAG_THUMB_CACHE_BYTES", gallery.DEFAULT_MAX_BYTES))
+# Anzeige relativ zum Projekt: der Offline-Export soll keine Pfade des Build-Rechners enthalten
+try:
+    SHOWN_DIR = Path(SNAPSHOT_DIR).resolve().relative_to(BASE_DIR.resolve()).as_posix()
+except ValueError:
+    SHOWN_DIR = "$SMARTAG_SNAPSHOTS"
+RESCAN_SECONDS = 60
+PER_PAGE = 24
+ALL = "Alle"
+
+
+@st.cache_resource(show_spinner="Lese Schnappschuss-Index …")
+def snapshot_index():
+    return gallery.SnapshotIndex(SNAPSHOT_DIR)
+
+
+@st.cache_resource
+def thumbnail_cache():
+    return gallery.ThumbnailCache(max_bytes=THUMB_CACHE_BYTES)
+
+
+@st.cache_resource
+def overlay_renderer():
+    return overlay.OverlayRenderer(max_bytes=THUMB_CACHE_BYTES)
+
+
+def _choice(label, values, key):
+    options = [ALL] + [value for value, _ in values]
+    if st.session_state.get(key) not in options:
+        st.session_state[key] = ALL
+    choice = st.selectbox(label, options, key=key)
+    return None if choice == ALL else choice
+
+
+@st.fragment
+def render_gallery():
+    index = snapshot_index() if os.path.isdir(SNAPSHOT_DIR) else None
+    if index is not None:
+        index.refresh(RESCAN_SECONDS)
+    if index is None or index.count() == 0:
+        st.warning(
+            f"Noch keine Schnappschüsse unter `{SHOWN_DIR}` "
+            "(Ordner `<kamera>/<ort>/<YYYY-MM-DD>/`, Umgebungsvariable `SMARTAG_SNAPSHOTS`). "
+            f"Demo-Bilder: `python -m smartag.gallery {SHOWN_DIR}`"
+        )
+        return
+
+    col_camera, col_location, col_day = st.columns(3)
+    with col_camera:
+        camera = _choice("Kamera", index.facets("camera"), "gallery_camera")
+    with col_location:
+        location = _choice("Ort", index.facets("location", camera=camera), "gallery_location")
+    with col_day:
+        day = _choice("Tag", index.facets("day", camera=camera, location=location), "gallery_day")
+
+    filters = {"camera": camera, "location": location, "day": day}
+    total = index.count(**filters)
+    pages = max(1, math.ceil(total / PER_PAGE))
+    if st.session_state.get("gallery_page", 1) > pages:
+        st.session_state["gallery_page"] = 1
+    col_page, col_overlay = st.columns([1, 2], vertical_alignment="bottom")
+    with col_page:
+        page = st.number_input(f"Seite (von {pages})", 1, pages, key="gallery_page")
+    with col_overlay:
+        annotated = st.toggle("Detektionen einblenden", key="gallery_overlay")
+
+    rows = index.page(page - 1, PER_PAGE, **filters)
+    items = [(row["hash"], index.absolute(row)) for row in rows]
+    cache = overlay_renderer() if annotated else thumbnail_cache()
+    images = cache.render_many(items) if annotated else cache.get_many(items)
+    shown = [(image, row) for image, row in zip(images, rows) if image is not None]
+    if shown:
+        st.image(
+            [image for image, _ in shown],
+            caption=[f"{row['camera']} · {row['day']} {row['name'][:2]}:{row['name'][2:4]} · "
+                     f"{row['width']}×{row['height']}" for _, row in shown],
+            width=overlay.PREVIEW_SIZE if annotated else gallery.THUMB_SIZE,
+        )
+
+    stats = cache.stats()
+    n_images = f"{total:,}".replace(",", ".")
+    cache_mib = f"{stats['bytes'] / 1024 / 1024:.1f}".replace(".", ",")
+    st.caption(
+        f"{n_images} Bilder · {'Komposit' if annotated else 'Thumbnail'}-Cache: {stats['entries']} Einträge, "
+        f"{cache_mib} von {stats['max_bytes'] / 1024 / 1024:.0f} MiB, "
+        f"{stats['hits']} Treffer, {stats['misses']} erzeugt"
+    )
+
+
+def render_tab():
+    st.markdown('<div class="section-header">Schnappschüsse der Kameras</div>', unsafe_allow_html=True)
+    st.info("👉 *Was sehen die Kameras gerade? Bilder nach Kamera, Ort und Tag durchblättern.*")
+    render_gallery()
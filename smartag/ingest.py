@@ -0,0 +1,356 @@
+"""Asyncio-Ingest für Kamera-Uplinks: Quelle → Decoder → Speicher.
+
+Auf dem Raspberry Pi übernehmen ChirpStack und der MQTT-Broker die Uplinks;
+hier stehen ``BrokerSource`` (``LocalBroker`` mit ChirpStack-artigen Topics)
+und ``UdpSource`` (Datagramm = 4 Byte Kamera-ID + Nutzlast) dafür. Die
+Pipeline besteht aus zwei begrenzten Queues:
+
+    Quelle ─put→ [uplinks] → decode_worker ─put→ [batches] → writer → DetectionStore
+
+Der Decoder sammelt bis zu ``decode_batch`` Uplinks (oder wartet höchstens
+``max_wait`` Sekunden) und dekodiert sie gemeinsam mit ``smartag.codec``; der
+Writer fasst dekodierte Spalten bis ``commit_rows`` zusammen und schreibt sie
+in einem Thread per ``DetectionStore.ingest``. Sind die Queues voll, warten
+``submit`` und die Broker-Quelle (Backpressure); UDP kann den Sender nicht
+bremsen und verwirft stattdessen – wie ein volles Socket-Puffer – und zählt
+die Verluste.
+
+Kamerabilder (``submit_frame``) laufen getrennt davon durch eine eigene Queue:
+
+    Kamera ─put→ [frames] → frame_worker → NearDuplicateFilter → Schnappschuss-Ordner
+
+Delta-Markierungen der Kameras (``smartag.dedup``) werden nur gezählt; übrige
+Bilder prüft ein ``NearDuplicateFilter`` auf dem Gateway noch einmal im Batch,
+bevor sie unter ``frames_root`` im Ordnerbaum der Galerie landen.
+"""
+
+import asyncio
+import logging
+import socket
+import struct
+import time
+from collections import deque
+
+import numpy as np
+
+from smartag import codec, dedup, gallery
+from smartag.profiling import percentile
+
+log = logging.getLogger(__name__)
+
+UPLINK_TOPIC = "application/+/device/+/event/up"
+_CAMERA_ID = struct.Struct(">I")
+_SINGLE_HEAD = codec.VERSION << 4 | codec.KIND_SINGLE
+
+DEFAULT_QUEUE = 10_000
+DEFAULT_DECODE_BATCH = 2_000
+DEFAULT_COMMIT_ROWS = 20_000
+DEFAULT_MAX_WAIT = 0.05
+DEFAULT_FRAME_QUEUE = 256
+DEFAULT_FRAME_BATCH = 32
+
+
+def uplink_topic(camera_id, application="smartag"):
+    return f"application/{application}/device/{camera_id}/event/up"
+
+
+def udp_datagram(camera_id, payload):
+    return _CAMERA_ID.pack(camera_id) + payload
+
+
+class IngestMetrics:
+    """Zähler, Queue-Tiefen und Commit-Latenzen; ``snapshot()`` liefert Raten seit dem letzten Aufruf."""
+
+    COUNTERS = ("received", "dropped", "errors", "decoded", "stored", "commits",
+                "frames", "frames_marked", "frames_suppressed", "frames_stored")
+
+    def __init__(self, window=200):
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        self.max_depth = {"uplinks": 0, "batches": 0, "frames": 0}
+        self.commit_ms = deque(maxlen=window)
+        self.started = time.perf_counter()
+        self._last = (self.started, dict.fromkeys(self.COUNTERS, 0))
+
+    def depth(self, name, queue):
+        size = queue.qsize()
+        if size > self.max_depth[name]:
+            self.max_depth[name] = size
+
+    def snapshot(self, queues=None):
+        now = time.perf_counter()
+        last_time, last = self._last
+        counts = {name: getattr(self, name) for name in self.COUNTERS}
+        elapsed = max(now - last_time, 1e-9)
+        snap = dict(counts)
+        snap["received_per_s"] = (counts["received"] - last["received"]) / elapsed
+        snap["stored_per_s"] = (counts["stored"] - last["stored"]) / elapsed
+        snap["max_depth"] = dict(self.max_depth)
+        if queues:
+            snap["depth"] = {name: q.qsize() for name, q in queues.items()}
+        if self.commit_ms:
+            snap["commit_ms_p50"] = percentile(self.commit_ms, 0.5)
+            snap["commit_ms_p95"] = percentile(self.commit_ms, 0.95)
+        self._last = (now, counts)
+        return snap
+
+
+class IngestService:
+    """Begrenzte Queues zwischen Quelle, Decoder und Speicher.
+
+    ``registry`` ordnet einer Kamera-ID ``(art, ort)`` zu – im Betrieb aus der
+    Geräteverwaltung von ChirpStack. Ohne ``frames_root`` werden Bilder nur
+    gezählt, nicht gespeichert.
+    """
+
+    def __init__(self, store, registry, queue_size=DEFAULT_QUEUE, decode_batch=DEFAULT_DECODE_BATCH,
+                 commit_rows=DEFAULT_COMMIT_ROWS, max_wait=DEFAULT_MAX_WAIT, dedup=None, frames_root=None,
+                 frame_queue=DEFAULT_FRAME_QUEUE, frame_batch=DEFAULT_FRAME_BATCH):
+        self.store = store
+        self.registry = registry
+        self.decode_batch = decode_batch
+        self.commit_rows = commit_rows
+        self.max_wait = max_wait
+        self.metrics = IngestMetrics()
+        self.uplinks = asyncio.Queue(queue_size)
+        # dekodierte Batches; klein halten, damit sich Rückstau bis zur Quelle fortpflanzt
+        self.batches = asyncio.Queue(max(2, queue_size // decode_batch))
+        self.dedup = dedup
+        self.frames_root = frames_root
+        self.frame_batch = frame_batch
+        self.frames = asyncio.Queue(frame_queue)
+        self._tasks = []
+
+    @property
+    def queues(self):
+        return {"uplinks": self.uplinks, "batches": self.batches, "frames": self.frames}
+
+    async def start(self):
+        self._tasks = [
+            asyncio.create_task(self._decode_worker(), name="smartag-decode"),
+            asyncio.create_task(self._writer(), name="smartag-writer"),
+            asyncio.create_task(self._frame_worker(), name="smartag-frames"),
+        ]
+
+    async def _drain(self):
+        await self.uplinks.join()
+        await self.batches.join()
+        await self.frames.join()
+
+    async def stop(self):
+        """Queues leerlaufen lassen, dann Tasks beenden.
+
+        Endet ein Worker vorher mit einer Ausnahme, leert niemand mehr seine
+        Queue; statt ewig zu warten, wird die Ausnahme weitergereicht.
+        """
+        drain = asyncio.ensure_future(self._drain())
+        await asyncio.wait([drain, *self._tasks], return_when=asyncio.FIRST_COMPLETED)
+        failed = [task for task in self._tasks if task.done() and not task.cancelled() and task.exception()]
+        for task in [drain, *self._tasks]:
+            task.cancel()
+        await asyncio.gather(drain, *self._tasks, return_exceptions=True)
+        self._tasks = []
+        if failed:
+            raise failed[0].exception()
+
+    # --- Eingang ---
+
+    async def submit(self, camera_id, payload):
+        """Uplink einreihen; wartet, solange die Queue voll ist."""
+        self.metrics.received += 1
+        await self.uplinks.put((camera_id, payload))
+        self.metrics.depth("uplinks", self.uplinks)
+
+    def submit_nowait(self, camera_id, payload):
+        """Uplink einreihen oder verwerfen, wenn die Queue voll ist."""
+        self.metrics.received += 1
+        try:
+            self.uplinks.put_nowait((camera_id, payload))
+        except asyncio.QueueFull:
+            self.metrics.dropped += 1
+            return False
+        self.metrics.depth("uplinks", self.uplinks)
+        return True
+
+    async def submit_frame(self, camera_id, ts, payload):
+        """Kamerabild (JPEG) oder Delta-Markierung einreihen; wartet bei voller Queue."""
+        self.metrics.frames += 1
+        await self.frames.put((camera_id, ts, payload))
+        self.metrics.depth("frames", self.frames)
+
+    # --- Decoder ---
+
+    async def _collect(self, queue, limit, size=lambda item: 1):
+        """Erstes Element abwarten, dann bis ``limit`` oder ``max_wait`` weitere einsammeln."""
+        items = [await queue.get()]
+        total = size(items[0])
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+        while total < limit:
+            if queue.empty():
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = queue.get_nowait()
+            items.append(item)
+            total += size(item)
+        return items
+
+    def decode(self, uplinks):
+        """Uplinks (Kamera-ID, Nutzlast) → Spalten für ``DetectionStore.ingest``."""
+        single_ids, single_payloads, parts = [], [], []
+        for camera_id, payload in uplinks:
+            # Einzelnachrichten nur mit passender Version gesammelt dekodieren; alles andere einzeln
+            if len(payload) == codec.SINGLE_BYTES and payload[0] == _SINGLE_HEAD:
+                single_ids.append(camera_id)
+                single_payloads.append(payload)
+                continue
+            try:
+                columns = codec.decode_batch(payload)
+            except (codec.CodecError, ValueError):
+                self.metrics.errors += 1
+                continue
+            parts.append((np.full(len(columns["ts"]), camera_id), columns))
+        if single_payloads:
+            try:
+                parts.append((np.asarray(single_ids), codec.decode(single_payloads)))
+            except codec.CodecError:
+                # nur die fehlerhaften Uplinks verwerfen, nicht den ganzen Batch
+                for camera_id, payload in zip(single_ids, single_payloads):
+                    try:
+                        parts.append((np.asarray([camera_id]), codec.decode([payload])))
+                    except codec.CodecError:
+                        self.metrics.errors += 1
+        if not parts:
+            return None
+
+        cameras = np.concatenate([ids for ids, _ in parts])
+        columns = {name: np.concatenate([cols[name] for _, cols in parts]) for name in codec.FIELDS}
+        known = np.array([c in self.registry for c in cameras.tolist()], dtype=bool)
+        if not known.all():
+            self.metrics.errors += int((~known).sum())
+            cameras = cameras[known]
+            columns = {name: values[known] for name, values in columns.items()}
+        meta = [self.registry[c] for c in cameras.tolist()]
+        columns["camera"] = cameras
+        columns["species"] = np.array([m[0] for m in meta])
+        columns["location"] = np.array([m[1] for m in meta])
+        return columns
+
+    async def _decode_worker(self):
+        while True:
+            uplinks = await self._collect(self.uplinks, self.decode_batch)
+            try:
+                columns = self.decode(uplinks)
+                if columns is not None and len(columns["ts"]):
+                    self.metrics.decoded += len(columns["ts"])
+                    await self.batches.put(columns)
+                    self.metrics.depth("batches", self.batches)
+            except Exception:
+                self.metrics.errors += len(uplinks)
+                log.exception("Dekodieren von %d Uplinks fehlgeschlagen", len(uplinks))
+            finally:
+                for _ in uplinks:
+                    self.uplinks.task_done()
+
+    # --- Writer ---
+
+    async def _writer(self):
+        while True:
+            parts = await self._collect(self.batches, self.commit_rows, size=lambda c: len(c["ts"]))
+            try:
+                columns = {name: np.concatenate([p[name] for p in parts]) for name in parts[0]}
+                start = time.perf_counter()
+                stored = await asyncio.to_thread(self.store.ingest, columns)
+                self.metrics.commit_ms.append((time.perf_counter() - start) * 1000)
+                self.metrics.stored += stored
+                self.metrics.commits += 1
+            except Exception:
+                # z. B. Datenbank gesperrt oder Karte voll: Batch verloren, Writer läuft weiter
+                rows = sum(len(p["ts"]) for p in parts)
+                self.metrics.errors += rows
+                log.exception("Schreiben von %d Zeilen fehlgeschlagen", rows)
+            finally:
+                for _ in parts:
+                    self.batches.task_done()
+
+    # --- Bilder ---
+
+    def store_frames(self, items):
+        """Bilder ``(kamera, ts, nutzlast)`` filtern und ablegen; Anzahl gespeicherter Bilder."""
+        frames = []
+        for item in items:
+            if dedup.is_delta(item[2]):
+                self.metrics.frames_marked += 1
+            elif item[0] not in self.registry:
+                self.metrics.errors += 1
+            else:
+                frames.append(item)
+        if not frames:
+            return 0
+        if self.dedup is not None:
+            payloads = self.dedup.filter(np.array([f[0] for f in frames]), [f[2] for f in frames])
+            kept = [f for f, payload in zip(frames, payloads) if payload is not None and not dedup.is_delta(payload)]
+            self.metrics.frames_suppressed += len(frames) - len(kept)
+            frames = kept
+        if self.frames_root is not None:
+            for camera_id, ts, payload in frames:
+                path = gallery.snapshot_path(self.frames_root, camera_id, self.registry[camera_id][1], ts)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(payload)
+        return len(frames)
+
+    async def _frame_worker(self):
+        while True:
+            items = await self._collect(self.frames, self.frame_batch)
+            try:
+                # Hashen und Schreiben blockieren; nicht im Event-Loop
+                self.metrics.frames_stored += await asyncio.to_thread(self.store_frames, items)
+            except Exception:
+                self.metrics.errors += len(items)
+                log.exception("Ablegen von %d Bildern fehlgeschlagen", len(items))
+            finally:
+                for _ in items:
+                    self.frames.task_done()
+
+
+# --- Quellen ---
+
+class BrokerSource:
+    """Abonniert Uplinks auf einem ``LocalBroker``; der Publisher-Thread wartet bei vollem Puffer."""
+
+    def __init__(self, service, broker, loop, pattern=UPLINK_TOPIC):
+        self.service = service
+        self.loop = loop
+        broker.subscribe(pattern, self._on_message)
+
+    def _on_message(self, topic, payload):
+        camera_id = int(topic.split("/")[3])
+        future = asyncio.run_coroutine_threadsafe(self.service.submit(camera_id, payload), self.loop)
+        future.result()
+
+
+class UdpSource(asyncio.DatagramProtocol):
+    """UDP-Empfänger; verwirft bei voller Queue statt zu blockieren."""
+
+    def __init__(self, service):
+        self.service = service
+
+    def datagram_received(self, data, addr):
+        if len(data) <= _CAMERA_ID.size:
+            self.service.metrics.errors += 1
+            return
+        (camera_id,) = _CAMERA_ID.unpack_from(data)
+        self.service.submit_nowait(camera_id, data[_CAMERA_ID.size:])
+
+    @classmethod
+    async def listen(cls, service, host="127.0.0.1", port=1700, rcvbuf=4 << 20):
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(lambda: cls(service), local_addr=(host, port))
+        # größerer Empfangspuffer fängt Sendebursts ab (vom Kernel auf rmem_max begrenzt)
+        transport.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+        return transport
@@ -0,0 +1,78 @@
+"""LoRa/LoRaWAN-Kenngrößen: Time-on-Air, Nutzlastgrenzen und Kanalplanung (EU868).
+
+Die Airtime folgt der Formel aus Semtech AN1200.13 und ist über NumPy-Arrays
+vektorisiert (Nutzlast und Spreading Factor dürfen Arrays sein). ``plan``
+rechnet daraus für ein ganzes Raster aus SF × Nutzlast × Sendeintervall ×
+Flottengröße Duty Cycle je Gerät, Kanalauslastung und – nach dem Modell
+Pure ALOHA – die Kollisionswahrscheinlichkeit am Gateway.
+"""
+
+import numpy as np
+
+SPREADING_FACTORS = (7, 8, 9, 10, 11, 12)
+BANDWIDTH = 125e3
+CODING_RATE = 1          # 4/5
+PREAMBLE = 8
+# MHDR (1) + FHDR (7) + FPort (1) + MIC (4)
+LORAWAN_OVERHEAD = 13
+# maximale Anwendungsnutzlast in Byte je SF (EU868, ohne FOpts)
+MAX_PAYLOAD = {7: 222, 8: 222, 9: 115, 10: 51, 11: 51, 12: 51}
+DUTY_CYCLE = 0.01        # 1 % in den g1-Subbändern
+CHANNELS = 3             # Pflichtkanäle 868,1/868,3/868,5 MHz
+
+
+def airtime(payload, sf, bw=BANDWIDTH, cr=CODING_RATE, preamble=PREAMBLE, lorawan=True):
+    """Time-on-Air in Sekunden für ``payload`` Byte Anwendungsdaten."""
+    payload = np.asarray(payload, dtype=np.float64)
+    sf = np.asarray(sf, dtype=np.float64)
+    if lorawan:
+        payload = payload + LORAWAN_OVERHEAD
+    t_sym = 2.0 ** sf / bw
+    # Low Data Rate Optimization ab 16 ms Symboldauer (SF11/SF12 bei 125 kHz)
+    de = (t_sym >= 0.016).astype(np.float64)
+    n_payload = 8 + np.maximum(
+        np.ceil((8 * payload - 4 * sf + 28 + 16) / (4 * (sf - 2 * de))) * (cr + 4), 0
+    )
+    return (preamble + 4.25) * t_sym + n_payload * t_sym
+
+
+def max_messages_per_hour(payload, sf, duty_cycle=DUTY_CYCLE):
+    """Wie viele Uplinks pro Stunde der Duty Cycle erlaubt."""
+    return np.floor(3600 * duty_cycle / airtime(payload, sf))
+
+
+def collision_probability(load):
+    """Pure ALOHA: Wahrscheinlichkeit, dass ein Uplink mit einem anderen überlappt."""
+    return 1 - np.exp(-2 * np.asarray(load, dtype=np.float64))
+
+
+def plan(sfs, payloads, intervals, fleet_sizes, channels=CHANNELS, duty_cycle=DUTY_CYCLE):
+    """Raster über (SF, Nutzlast, Intervall, Flottengröße); alle Arrays mit Form (S, P, I, N).
+
+    Annahme: die ganze Flotte sendet mit demselben SF, gleichmäßig verteilt
+    über ``channels`` Kanäle und zufällig im Intervall.
+    """
+    sf = np.asarray(sfs, dtype=np.float64)[:, None, None, None]
+    payload = np.asarray(payloads, dtype=np.float64)[None, :, None, None]
+    interval = np.asarray(intervals, dtype=np.float64)[None, None, :, None]
+    fleet = np.asarray(fleet_sizes, dtype=np.float64)[None, None, None, :]
+
+    toa = airtime(payload, sf)
+    device_duty = toa / interval
+    # mittlere Anzahl gleichzeitiger Uplinks pro Kanal (Erlang)
+    utilization = fleet * toa / (interval * channels)
+    max_payload = np.vectorize(MAX_PAYLOAD.get)(np.asarray(sfs))[:, None, None, None]
+    shape = np.broadcast_shapes(sf.shape, payload.shape, interval.shape, fleet.shape)
+    return {
+        "airtime": np.broadcast_to(toa, shape),
+        "device_duty": np.broadcast_to(device_duty, shape),
+        "utilization": utilization,
+        "collision": collision_probability(utilization),
+        "feasible": np.broadcast_to((device_duty <= duty_cycle) & (payload <= max_payload), shape),
+    }
+
+
+def max_fleet(payload, sf, interval, max_collision=0.1, channels=CHANNELS):
+    """Größte Flotte, bei der die Kollisionswahrscheinlichkeit ``max_collision`` nicht übersteigt."""
+    load = -np.log1p(-max_collision) / 2
+    return np.floor(load * np.asarray(interval, dtype=np.float64) * channels / airtime(payload, sf))
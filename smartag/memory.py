@@ -0,0 +1,113 @@
+"""Speicherbilanz des Serverprozesses: RSS, große Objekte, Objekte je Session.
+
+Grundlage für ``?diag=memory`` und ``benchmarks/bench_load.py``. ``report()``
+sammelt:
+
+* ``rss`` – Resident Set Size des Prozesses (aus ``/proc``)
+* ``sessions`` – aktive Sessions mit Anzahl und Größe ihres Session-States
+* ``caches`` – Bytes in Streamlits ``st.cache_data``/``st.cache_resource``
+* ``large`` – große ``str``/``bytes``-Objekte (Data-URIs, HTML) mit der
+  Anzahl inhaltsgleicher Kopien; geteilte Daten haben genau eine Kopie
+* ``modules`` – welche der schweren Bibliotheken (``HEAVY_MODULES``) der
+  Prozess geladen hat; das Lite-Profil darf z. B. kein Plotly laden
+* ``types`` – Anzahl GC-verfolgter Objekte je Typ; die Differenz zweier
+  Berichte geteilt durch die Differenz der Sessions ergibt die je Session
+  zurückgehaltenen Objekte
+
+``str``/``bytes`` werden vom GC nicht verfolgt und deshalb über die
+Referenzen der Container gefunden. Ein Bericht kostet einige hundert
+Millisekunden und ist nur für Diagnose und Lasttests gedacht.
+"""
+
+import gc
+import hashlib
+import sys
+from collections import Counter
+
+LARGE_BYTES = 64 * 1024
+HEAVY_MODULES = ("numpy", "pandas", "pyarrow", "plotly", "PIL")
+
+
+def rss_bytes(pid="self"):
+    """Aktuelle RSS in Byte (Linux); 0, wenn ``/proc`` fehlt."""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def type_counts():
+    return Counter(type(o).__name__ for o in gc.get_objects())
+
+
+def large_objects(min_bytes=LARGE_BYTES):
+    """Große ``str``/``bytes`` nach Inhalt gruppiert: Größe, Kopien, Anfang."""
+    seen = {}
+    for container in gc.get_objects():
+        for ref in gc.get_referents(container):
+            if isinstance(ref, (str, bytes, bytearray)) and len(ref) >= min_bytes and id(ref) not in seen:
+                seen[id(ref)] = ref
+    groups = {}
+    for obj in seen.values():
+        raw = obj.encode("utf-8", "surrogatepass") if isinstance(obj, str) else bytes(obj)
+        key = (type(obj).__name__, len(obj), hashlib.sha1(raw).hexdigest())
+        group = groups.setdefault(key, {"type": key[0], "bytes": sys.getsizeof(obj), "copies": 0,
+                                        "preview": repr(obj[:48])})
+        group["copies"] += 1
+    return sorted(groups.values(), key=lambda g: g["bytes"] * g["copies"], reverse=True)
+
+
+def _deep_size(obj, depth=0, seen=None):
+    seen = set() if seen is None else seen
+    if id(obj) in seen or depth > 6:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(k, depth + 1, seen) + _deep_size(v, depth + 1, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_size(v, depth + 1, seen) for v in obj)
+    return size
+
+
+def sessions():
+    """Aktive Sessions mit Schlüsselanzahl und ungefährer Größe des Session-States."""
+    try:
+        from streamlit.runtime import Runtime
+        active = Runtime.instance()._session_mgr.list_active_sessions()
+    except Exception:
+        return []
+    result = []
+    for info in active:
+        state = info.session.session_state.filtered_state
+        result.append({"id": info.session.id[:8], "keys": len(state), "bytes": _deep_size(dict(state))})
+    return result
+
+
+def caches():
+    """Bytes je Streamlit-Cache (prozessweit, also von allen Sessions geteilt)."""
+    try:
+        from streamlit.runtime import Runtime
+        stats = Runtime.instance().stats_mgr.get_stats()
+    except Exception:
+        return {}
+    totals = Counter()
+    for stat in stats:
+        totals[f"{stat.category_name}:{stat.cache_name}"] += stat.byte_length
+    return dict(totals)
+
+
+def report(min_bytes=LARGE_BYTES):
+    gc.collect()
+    return {
+        "rss": rss_bytes(),
+        "sessions": sessions(),
+        "caches": caches(),
+        "large": large_objects(min_bytes),
+        "modules": [name for name in HEAVY_MODULES if name in sys.modules],
+        "types": dict(type_counts().most_common()),
+    }
@@ -0,0 +1,240 @@
+"""Detektionen als Boxen über den Kamerabildern (Tab „Schnappschüsse“).
+
+Die Kamera legt zu jedem Bild eine Datei gleichen Namens mit Endung ``.json``
+ab; Boxen in relativen Koordinaten (0…1), damit sie zu jeder Vorschaugröße
+passen::
+
+    {"model": "fruitnet-int8-v3",
+     "detections": [{"box": [x0, y0, x1, y1], "label": "Tomate", "ripeness": 2, "confidence": 0.91}]}
+
+Die Version eines Detektionssatzes ist der Hash dieser Datei. Rechnet das
+Modell ein Bild neu, ändert sich der Schlüssel (Bild-Hash, Version) und das
+Komposit wird neu gezeichnet; sonst kommt es aus dem LRU-Cache.
+
+Gezeichnet wird auf die verkleinerte Vorschau (längste Kante ``size``), nicht
+auf das Original: JPEGs werden per ``draft`` verkleinert dekodiert, die
+Rahmen aller Boxen eines Batches setzt ein einziger NumPy-Indexzugriff, nur
+die Beschriftungen zeichnet PIL. Dekodieren sowie Beschriften und Kodieren
+laufen im Thread-Pool.
+"""
+
+import functools
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from smartag.gallery import DEFAULT_MAX_BYTES, ByteLRU, open_scaled
+from smartag.rollups import RIPENESS_CLASSES
+
+PREVIEW_SIZE = 320
+LINE_WIDTH = 2
+FONT_SIZE = 10
+
+# Rahmenfarbe je Reifeklasse (unreif, halbreif, reif, überreif); bewusst keine Fruchtfarben
+RIPENESS_COLORS = np.array([(33, 150, 243), (255, 235, 59), (255, 152, 0), (233, 30, 99)], np.uint8)
+
+# halb geschriebene oder kaputte Sidecar-Dateien: Bild ohne Boxen zeigen
+SIDECAR_ERRORS = (OSError, ValueError, KeyError, TypeError, AttributeError)
+
+
+def sidecar(image_path):
+    return Path(image_path).with_suffix(".json")
+
+
+def write_detections(image_path, detections, model):
+    doc = {
+        "model": model,
+        "detections": [dict(d, box=[round(v, 4) for v in d["box"]]) for d in detections],
+    }
+    sidecar(image_path).write_text(json.dumps(doc, ensure_ascii=False, separators=(",", ":")))
+
+
+def read_sidecar(image_path):
+    """``(version, rohdaten)``; ``(None, None)`` ohne (lesbare) Detektionen."""
+    try:
+        raw = sidecar(image_path).read_bytes()
+    except OSError:
+        return None, None
+    return hashlib.blake2b(raw, digest_size=8).hexdigest(), raw
+
+
+def parse(raw):
+    """Rohdaten der Sidecar-Datei als Spalten: ``box`` (N, 4), ``ripeness``, ``confidence``, ``label``.
+
+    Unlesbare Rohdaten ergeben keine Detektionen.
+    """
+    try:
+        return _parse(raw)
+    except SIDECAR_ERRORS:
+        return _parse(None)
+
+
+def _parse(raw):
+    detections = json.loads(raw)["detections"] if raw else []
+    return {
+        "box": np.array([d["box"] for d in detections], np.float32).reshape(-1, 4),
+        "ripeness": np.clip(np.array([d.get("ripeness", 0) for d in detections], np.int64),
+                            0, len(RIPENESS_CLASSES) - 1),
+        "confidence": np.array([d.get("confidence", 1.0) for d in detections], np.float32),
+        "label": [d.get("label", "") for d in detections],
+    }
+
+
+def decode(path, size=PREVIEW_SIZE):
+    """Vorschau als beschreibbares ``(H, W, 3)``-Array, längste Kante ``size``."""
+    return np.array(open_scaled(path, size))
+
+
+def _ragged_arange(starts, lengths):
+    """Aneinandergehängte ``arange(s, s + n)`` für alle Paare, ohne Python-Schleife."""
+    offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return np.repeat(starts, lengths) + np.arange(lengths.sum()) - offsets
+
+
+def draw_boxes(frames, frame_idx, boxes, colors, width=LINE_WIDTH):
+    """Rahmen in den Stapel ``frames`` (B, H, W, 3) zeichnen.
+
+    ``boxes`` (N, 4) in Pixeln ``x0, y0, x1, y1`` (inklusive), ``frame_idx`` (N,)
+    ordnet jede Box einem Bild zu, ``colors`` (N, 3). Alle Kanten aller Boxen
+    werden in einem Indexzugriff gesetzt.
+    """
+    if not len(boxes):
+        return frames
+    _, h, w, _ = frames.shape
+    x0, y0, x1, y1 = (boxes[:, i].astype(np.int64) for i in range(4))
+    x0, x1 = np.clip(x0, 0, w - 1), np.clip(x1, 0, w - 1)
+    y0, y1 = np.clip(y0, 0, h - 1), np.clip(y1, 0, h - 1)
+    k = np.arange(width)
+    n = len(boxes)
+
+    # Waagerechte Kanten: je Box 2·width Zeilen, jede von x0 bis x1
+    rows = np.clip(np.concatenate([y0[:, None] + k, y1[:, None] - k], axis=1), 0, h - 1).ravel()
+    owner = np.repeat(np.arange(n), 2 * width)
+    lengths = (x1 - x0 + 1)[owner]
+    cols = _ragged_arange(x0[owner], lengths)
+    frames[np.repeat(frame_idx[owner], lengths), np.repeat(rows, lengths), cols] = np.repeat(colors[owner], lengths, axis=0)
+
+    # Senkrechte Kanten: je Box 2·width Spalten, jede von y0 bis y1
+    cols = np.clip(np.concatenate([x0[:, None] + k, x1[:, None] - k], axis=1), 0, w - 1).ravel()
+    lengths = (y1 - y0 + 1)[owner]
+    rows = _ragged_arange(y0[owner], lengths)
+    frames[np.repeat(frame_idx[owner], lengths), rows, np.repeat(cols, lengths)] = np.repeat(colors[owner], lengths, axis=0)
+    return frames
+
+
+@functools.cache
+def _font():
+    # DejaVu liegt auf Raspberry Pi OS bei; Pillows eingebaute Schrift kennt keine Umlaute
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", FONT_SIZE)
+    except OSError:
+        return ImageFont.load_default(size=FONT_SIZE)
+
+
+@functools.lru_cache(maxsize=4096)
+def label_patch(text, ripeness):
+    """Beschriftung als fertiges Bildstück; Texte wiederholen sich (Art × Reife × Prozent)."""
+    font = _font()
+    left, top, right, bottom = font.getbbox(text)
+    patch = Image.new("RGB", (right - left + 4, bottom - top + 3), tuple(RIPENESS_COLORS[ripeness].tolist()))
+    ImageDraw.Draw(patch).text((2 - left, 1 - top), text, fill=(0, 0, 0), font=font)
+    return patch
+
+
+def finish(frame, detections, pixel_boxes, quality=80):
+    """Beschriftungen ergänzen und als JPEG kodieren."""
+    im = Image.fromarray(frame)
+    for (x0, y0, _, _), label, ripeness, confidence in zip(
+            pixel_boxes.tolist(), detections["label"], detections["ripeness"].tolist(),
+            detections["confidence"].tolist()):
+        patch = label_patch(f"{label} {RIPENESS_CLASSES[ripeness]} {confidence:.0%}".strip(), ripeness)
+        # über der Box, sonst in ihr; nicht über den rechten Bildrand hinaus
+        y = y0 - patch.height if y0 >= patch.height else y0
+        im.paste(patch, (max(0, min(x0, im.width - patch.width)), y))
+    out = io.BytesIO()
+    im.save(out, "JPEG", quality=quality)
+    return out.getvalue()
+
+
+def render_batch(frames, detections, pool=None):
+    """Komposite (JPEG-Bytes) zu Vorschau-Arrays und geparsten Detektionen."""
+    pixel_boxes = []
+    by_shape = {}
+    for i, (frame, det) in enumerate(zip(frames, detections)):
+        h, w = frame.shape[:2]
+        pixel_boxes.append(np.rint(det["box"] * np.array([w - 1, h - 1, w - 1, h - 1], np.float32)).astype(np.int64))
+        by_shape.setdefault(frame.shape, []).append(i)
+
+    # Bilder gleicher Größe stapeln und alle Rahmen auf einmal zeichnen
+    for indices in by_shape.values():
+        stack = np.stack([frames[i] for i in indices])
+        counts = [len(pixel_boxes[i]) for i in indices]
+        draw_boxes(
+            stack,
+            np.repeat(np.arange(len(indices)), counts),
+            np.concatenate([pixel_boxes[i] for i in indices]),
+            RIPENESS_COLORS[np.concatenate([detections[i]["ripeness"] for i in indices])],
+        )
+        for j, i in enumerate(indices):
+            frames[i] = stack[j]
+
+    map_ = pool.map if pool is not None else map
+    return list(map_(finish, frames, detections, pixel_boxes))
+
+
+class OverlayRenderer(ByteLRU):
+    """Komposite im LRU-Cache, Schlüssel ``(Bild-Hash, Detektionsversion)``."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, size=PREVIEW_SIZE, batch=32, workers=None):
+        super().__init__(max_bytes)
+        self.size = size
+        self.batch = batch
+        self._pool = ThreadPoolExecutor(workers or min(8, os.cpu_count() or 1), thread_name_prefix="overlay")
+
+    def render_many(self, items):
+        """Komposite zu ``(hash, pfad)``-Paaren in gleicher Reihenfolge; ``None`` bei Fehlern."""
+        keys, missing = [], {}
+        for frame_hash, path in items:
+            version, raw = read_sidecar(path)
+            key = (frame_hash, version)
+            keys.append(key)
+            with self._lock:
+                if key not in self._entries and key not in missing:
+                    missing[key] = (path, raw)
+
+        pending = list(missing.items())
+        for start in range(0, len(pending), self.batch):
+            chunk = pending[start:start + self.batch]
+            decoded = list(self._pool.map(self._decode, (path for _, (path, _) in chunk)))
+            ok = [i for i, frame in enumerate(decoded) if frame is not None]
+            composites = render_batch(
+                [decoded[i] for i in ok], [parse(chunk[i][1][1]) for i in ok], self._pool)
+            with self._lock:
+                for i, data in zip(ok, composites):
+                    self._store(chunk[i][0], data)
+
+        result = []
+        with self._lock:
+            for key in keys:
+                data = self._entries.get(key)
+                if data is not None:
+                    self._entries.move_to_end(key)
+                if key in missing:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                result.append(data)
+            self._evict()
+        return result
+
+    def _decode(self, path):
+        try:
+            return decode(path, self.size)
+        except OSError:
+            return None
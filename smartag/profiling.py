@@ -0,0 +1,184 @@
+"""Messpunkte für die logischen Abschnitte von ``PraesentationSmartAg.py``.
+
+    with section("header"):
+        st.markdown(...)
+
+Solange kein Recorder gesetzt ist, liefert ``section`` einen geteilten
+``nullcontext`` – im Normalbetrieb kostet der Messpunkt also nur einen
+Funktionsaufruf. Mit Recorder werden je Abschnitt Laufzeit, Anzahl der an
+den Client gesendeten Elemente (``st.markdown``-Aufrufe) und deren Bytes
+erfasst.
+
+Die Werte landen in einem rollierenden Fenster (``stats``). ``enable()``
+misst alle Läufe des Prozesses (``SMARTAG_DIAGNOSTICS=1``); ``activate()``
+nur die laufende Session (Flag in ``st.session_state``, gilt damit auch für
+Fragment-Reruns) – so schaltet das Diagnose-Panel (``?diag=1``) die Messung
+für die eigene Session, nicht für alle Besucher.
+
+Zum Zählen der gesendeten Elemente ersetzt ``section`` vorübergehend
+``ScriptRunContext._enqueue`` – private Streamlit-API, mit Streamlit 1.49
+geprüft; bei einem Update als Erstes nachsehen.
+"""
+
+import functools
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+_NULL = nullcontext()
+_recorder = None
+# Schlüssel in st.session_state für die Messung einer Session
+SESSION_KEY = "smartag_profiling"
+# erst nachsehen, wenn überhaupt eine Session die Messung eingeschaltet hat
+_activated = False
+
+WINDOW = 200
+
+
+def set_recorder(recorder):
+    """``recorder(name, seconds, nbytes, markdown_calls)`` oder ``None`` zum Abschalten."""
+    global _recorder
+    _recorder = recorder
+
+
+def _session_recorder():
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is not None and SESSION_KEY in ctx.session_state:
+        return stats.record
+    return None
+
+
+def section(name):
+    recorder = _recorder or (_activated and _session_recorder())
+    if not recorder:
+        return _NULL
+    return _Section(name, recorder)
+
+
+def profiled(name):
+    """Decorator-Variante von ``section`` für ganze Render-Funktionen."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with section(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class _Section:
+    __slots__ = ("name", "recorder", "ctx", "enqueue", "nbytes", "calls", "start")
+
+    def __init__(self, name, recorder):
+        self.name = name
+        self.recorder = recorder
+
+    def __enter__(self):
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        self.nbytes = self.calls = 0
+        self.ctx = get_script_run_ctx(suppress_warning=True)
+        if not hasattr(self.ctx, "_enqueue"):
+            self.ctx = None
+        if self.ctx is not None:
+            # Ausgehende ForwardMsgs mitzählen, solange der Abschnitt läuft.
+            # _enqueue ist privat (Streamlit 1.49); fehlt es, bleibt es beim Zeitmessen.
+            self.enqueue = self.ctx._enqueue
+            self.ctx._enqueue = self._count
+        self.start = time.perf_counter()
+        return self
+
+    def _count(self, msg):
+        if msg.WhichOneof("type") == "delta":
+            self.nbytes += msg.ByteSize()
+            if msg.delta.new_element.WhichOneof("type") == "markdown":
+                self.calls += 1
+        self.enqueue(msg)
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        if self.ctx is not None:
+            self.ctx._enqueue = self.enqueue
+        self.recorder(self.name, elapsed, self.nbytes, self.calls)
+        return False
+
+
+def percentile(values, q):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    k = (len(values) - 1) * q
+    lo, hi = int(k), min(int(k) + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+class SectionStats:
+    """Rollierendes Fenster der letzten ``window`` Messungen je Abschnitt."""
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds, nbytes, calls):
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+            samples.append((seconds, nbytes, calls))
+
+    def summary(self):
+        with self._lock:
+            snapshot = {name: list(samples) for name, samples in self._samples.items()}
+        rows = []
+        for name, samples in snapshot.items():
+            seconds = [s[0] for s in samples]
+            rows.append({
+                "Abschnitt": name,
+                "n": len(samples),
+                "p50 ms": round(percentile(seconds, 0.50) * 1000, 2),
+                "p95 ms": round(percentile(seconds, 0.95) * 1000, 2),
+                "p99 ms": round(percentile(seconds, 0.99) * 1000, 2),
+                "Bytes": samples[-1][1],
+                "st.markdown": samples[-1][2],
+            })
+        return rows
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+
+stats = SectionStats()
+
+
+def enable():
+    set_recorder(stats.record)
+
+
+def disable():
+    set_recorder(None)
+
+
+def activate(on):
+    """Messung nur für die laufende Session ein- oder ausschalten."""
+    global _activated
+    import streamlit as st
+
+    if on:
+        _activated = True
+        st.session_state[SESSION_KEY] = True
+    else:
+        st.session_state.pop(SESSION_KEY, None)
+
+
+def enabled():
+    return _recorder is not None or bool(_activated and _session_recorder())
+
+
+if os.environ.get("SMARTAG_DIAGNOSTICS") == "1":
+    enable()
@@ -0,0 +1,66 @@
+"""Ringpuffer fester Größe auf Basis von NumPy-Arrays.
+
+Der Speicherbedarf steht beim Anlegen fest (``capacity`` Zeitstempel + Werte)
+und wächst danach nicht mehr, egal wie lange geschrieben wird.
+"""
+
+import threading
+
+import numpy as np
+
+
+class RingBuffer:
+    def __init__(self, capacity, dtype=np.float64):
+        self.capacity = int(capacity)
+        self._times = np.zeros(self.capacity, dtype=np.float64)
+        self._values = np.zeros(self.capacity, dtype=dtype)
+        self._head = 0  # nächster Schreibindex
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def nbytes(self):
+        return self._times.nbytes + self._values.nbytes
+
+    def append(self, timestamp, value):
+        with self._lock:
+            self._times[self._head] = timestamp
+            self._values[self._head] = value
+            self._head = (self._head + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+
+    def extend(self, timestamps, values):
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        values = np.asarray(values, dtype=self._values.dtype)
+        n = len(values)
+        if n == 0:
+            return
+        if n >= self.capacity:
+            timestamps, values, n = timestamps[-self.capacity:], values[-self.capacity:], self.capacity
+        with self._lock:
+            idx = (self._head + np.arange(n)) % self.capacity
+            self._times[idx] = timestamps
+            self._values[idx] = values
+            self._head = (self._head + n) % self.capacity
+            self._count = min(self._count + n, self.capacity)
+
+    def latest(self, default=np.nan):
+        with self._lock:
+            if not self._count:
+                return None, default
+            i = (self._head - 1) % self.capacity
+            return float(self._times[i]), self._values[i].item()
+
+    def snapshot(self, since=None):
+        """Chronologisch sortierte Kopie ``(zeiten, werte)``, optional ab ``since``."""
+        with self._lock:
+            start = (self._head - self._count) % self.capacity
+            idx = (start + np.arange(self._count)) % self.capacity
+            times, values = self._times[idx], self._values[idx]
+        if since is not None:
+            keep = np.searchsorted(times, since, side="left")
+            times, values = times[keep:], values[keep:]
+        return times, values
@@ -0,0 +1,156 @@
+"""Inkrementell gepflegte Aggregate (Rollups) über den Detektionsspeicher.
+
+Für das Dashboard („nach Art, Ort und im Zeitverlauf“) werden pro Stunde, Tag
+und Woche sowie pro Art und Ort Fruchtanzahl, Reifeverteilung und
+Stressmeldungen vorgehalten. Die Rollups hängen sich an
+``DetectionStore.ingest`` und werden in derselben Transaktion fortgeschrieben:
+jeder Batch wird in NumPy gruppiert und per UPSERT auf die betroffenen Buckets
+addiert. Da alle Kennzahlen Summen sind, aktualisieren verspätete oder
+ungeordnete LoRaWAN-Uplinks nur ihre eigenen Buckets, ohne Neuberechnung.
+
+    store = DetectionStore("smartag.db")
+    rollups = Rollups(store)
+    rollups.query("day", start, end, species="Tomate")
+
+Die Rollups bleiben erhalten, wenn Rohdaten per ``drop_before`` verworfen werden.
+"""
+
+import numpy as np
+
+from smartag.storage import DAY
+
+HOUR = 3600
+WEEK = 7 * DAY
+# 1970-01-01 war ein Donnerstag; Wochen beginnen montags
+WEEK_OFFSET = 3 * DAY
+
+GRAINS = ("hour", "day", "week")
+RIPENESS_CLASSES = ("unreif", "halbreif", "reif", "überreif")
+
+_RIPENESS_COLS = tuple(f"ripe_{i}" for i in range(len(RIPENESS_CLASSES)))
+SUMS = ("n", "fruit_sum", "confidence_sum", "stress_count") + _RIPENESS_COLS
+
+
+def bucket(ts, grain):
+    """Beginn des Buckets (Unix-Sekunden, UTC) für ``grain``."""
+    ts = np.asarray(ts, dtype=np.int64)
+    if grain == "hour":
+        return ts // HOUR * HOUR
+    if grain == "day":
+        return ts // DAY * DAY
+    if grain == "week":
+        return (ts + WEEK_OFFSET) // WEEK * WEEK - WEEK_OFFSET
+    raise ValueError(f"Unbekannte Granularität: {grain!r}")
+
+
+def aggregate(data, grain):
+    """Batch (strukturiertes Array aus dem Speicher) nach (Bucket, Art, Ort) summieren."""
+    # (Bucket, Art, Ort) zu einem int64-Schlüssel packen; np.unique über Zeilen ist deutlich langsamer
+    buckets = bucket(data["ts"], grain)
+    species = data["species_id"].astype(np.int64)
+    location = data["location_id"].astype(np.int64)
+    b0 = buckets.min()
+    n_species, n_location = species.max() + 1, location.max() + 1
+    keys = ((buckets - b0) * n_species + species) * n_location + location
+    uniq, inverse = np.unique(keys, return_inverse=True)
+    groups = np.stack([
+        uniq // (n_species * n_location) + b0,
+        uniq // n_location % n_species,
+        uniq % n_location,
+    ], axis=1)
+    size = len(uniq)
+
+    def total(weights=None):
+        return np.bincount(inverse, weights=weights, minlength=size)
+
+    ripeness = np.clip(data["ripeness"], 0, len(RIPENESS_CLASSES) - 1)
+    sums = {
+        "n": total(),
+        "fruit_sum": total(data["fruit_count"]),
+        "confidence_sum": total(data["confidence"]),
+        "stress_count": total(data["stress"] != 0),
+    }
+    for i, col in enumerate(_RIPENESS_COLS):
+        sums[col] = total(ripeness == i)
+    return groups, sums
+
+
+class Rollups:
+    def __init__(self, store, grains=GRAINS):
+        self.store = store
+        self.grains = tuple(grains)
+        db = store._conn()
+        with db:
+            for grain in self.grains:
+                cols = ", ".join(f"{c} {'REAL' if c == 'confidence_sum' else 'INTEGER'} NOT NULL DEFAULT 0" for c in SUMS)
+                db.execute(
+                    f"CREATE TABLE IF NOT EXISTS rollup_{grain} (bucket INTEGER, species_id INTEGER, "
+                    f"location_id INTEGER, {cols}, PRIMARY KEY (bucket, species_id, location_id)) WITHOUT ROWID"
+                )
+        store.subscribe(self._apply)
+
+    def _apply(self, db, data):
+        columns = ", ".join(SUMS)
+        placeholders = ", ".join("?" * (3 + len(SUMS)))
+        update = ", ".join(f"{c} = {c} + excluded.{c}" for c in SUMS)
+        for grain in self.grains:
+            groups, sums = aggregate(data, grain)
+            rows = zip(
+                *groups.T.tolist(),
+                *(sums[c].tolist() if c == "confidence_sum" else sums[c].astype(np.int64).tolist() for c in SUMS),
+            )
+            db.executemany(
+                f"INSERT INTO rollup_{grain} (bucket, species_id, location_id, {columns}) VALUES ({placeholders}) "
+                f"ON CONFLICT (bucket, species_id, location_id) DO UPDATE SET {update}",
+                rows,
+            )
+
+    def rebuild(self):
+        """Rollups vollständig aus den vorhandenen Rohdaten neu berechnen."""
+        db = self.store._conn()
+        with self.store._write_lock, db:
+            for grain in self.grains:
+                db.execute(f"DELETE FROM rollup_{grain}")
+            for chunk in self.store.chunk_starts():
+                cols = self.store.query(chunk, chunk + self.store.chunk_seconds)
+                data = np.empty(len(cols["ts"]), dtype=[(c, a.dtype) for c, a in cols.items()])
+                for c, a in cols.items():
+                    data[c] = a
+                self._apply(db, data)
+
+    def query(self, grain, start, end, by=("species", "location"), **filters):
+        """Rollups in ``[start, end)`` als dict von NumPy-Arrays, gruppiert nach Bucket und ``by``.
+
+        Das Fenster ist auf ganze Buckets ausgerichtet: geliefert wird jeder
+        Bucket, der ``[start, end)`` berührt. Beginnt ``start`` mitten in einem
+        Bucket, zählen dessen Messungen vor ``start`` mit (ebenso nach ``end``
+        im letzten Bucket) – Summen lassen sich nicht nachträglich
+        beschneiden. Für exakte Grenzen ``DetectionStore.query`` verwenden.
+
+        Zusätzlich zu den Summen: ``fruit_mean``, ``confidence_mean``,
+        ``stress_rate`` und ``ripeness`` (Anteile, Form ``(n, Klassen)``).
+        """
+        if grain not in self.grains:
+            raise ValueError(f"Unbekannte Granularität: {grain!r}")
+        if filters.get("camera") is not None or "camera" in by:
+            raise ValueError("Rollups sind nur nach Art und Ort gruppiert")
+        where, params = self.store._where(bucket(start, grain), end, filters, time_column="bucket")
+        dims = tuple(f"{d}_id" for d in by)
+        group = ", ".join(("bucket",) + dims)
+        select = ", ".join(f"sum({c})" for c in SUMS)
+        rows = self.store._conn().execute(
+            f"SELECT {group}, {select} FROM rollup_{grain} WHERE {where} GROUP BY {group} ORDER BY {group}",
+            params,
+        ).fetchall()
+        names = ("bucket",) + dims + SUMS
+        table = np.array(rows, dtype=np.float64).reshape(-1, len(names))
+        result = {name: table[:, i] for i, name in enumerate(names)}
+        for name in ("bucket",) + dims + ("n", "fruit_sum", "stress_count") + _RIPENESS_COLS:
+            result[name] = result[name].astype(np.int64)
+
+        n = np.maximum(result["n"], 1)
+        result["fruit_mean"] = result["fruit_sum"] / n
+        result["confidence_mean"] = result["confidence_sum"] / n
+        result["stress_rate"] = result["stress_count"] / n
+        result["ripeness"] = np.stack([result[c] for c in _RIPENESS_COLS], axis=-1) / n[:, None]
+        return result
@@ -0,0 +1,116 @@
+"""Regelbasierte TinyML-Entscheidungen, vektorisiert über viele Pflanzen/Sensoren.
+
+    engine = RuleEngine()                       # oder RuleEngine.from_toml(pfad)
+    result = engine.evaluate({"bodenfeuchte": arr, "temperatur": arr, "licht": arr})
+    result.labels()[:5], result.counts()
+
+Regeln werden nach Priorität geprüft (erste passende gewinnt); trifft keine
+zu, gilt der Standardzustand "Optimal". Ausgewertet wird je Regel eine
+NumPy-Maske über alle Pflanzen – die Schleife läuft also über die (wenigen)
+Regeln, nicht über die (vielen) Messwerte.
+"""
+
+import tomllib
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    label: str
+    color: str
+    channel: str
+    below: float = None
+    above: float = None
+
+    def mask(self, values):
+        m = np.zeros(values.shape, dtype=bool)
+        if self.below is not None:
+            m |= values < self.below
+        if self.above is not None:
+            m |= values > self.above
+        return m
+
+    def matches(self, value):
+        return (self.below is not None and value < self.below) or (
+            self.above is not None and value > self.above
+        )
+
+
+DEFAULT_STATE = Rule("optimal", "🟢 OPTIMALER ZUSTAND", "#43a047", channel="")
+
+# Reihenfolge = Priorität
+DEFAULT_RULES = (
+    Rule("bewaesserung", "🔴 BEWÄSSERUNG AKTIVIEREN", "#e53935", "bodenfeuchte", below=30),
+    Rule("ueberflutung", "🟡 ÜBERFLUTUNGSWARNUNG", "#fb8c00", "bodenfeuchte", above=70),
+    Rule("hitzestress", "🌡️ HITZESTRESS", "#d84315", "temperatur", above=35),
+    Rule("frost", "❄️ FROSTGEFAHR", "#1e88e5", "temperatur", below=3),
+    Rule("einstrahlung", "☀️ STARKE EINSTRAHLUNG – BESCHATTEN", "#f9a825", "licht", above=85000),
+)
+
+
+class Decisions:
+    """Ergebnis einer Auswertung: ein Code pro Pflanze (Index in ``states``)."""
+
+    def __init__(self, codes, states):
+        self.codes = codes
+        self.states = states
+
+    def __len__(self):
+        return len(self.codes)
+
+    def labels(self):
+        names = np.array([s.label for s in self.states], dtype=object)
+        return names[self.codes]
+
+    def counts(self):
+        counts = np.bincount(self.codes, minlength=len(self.states))
+        return {s.name: int(c) for s, c in zip(self.states, counts)}
+
+    def __getitem__(self, i):
+        return self.states[self.codes[i]]
+
+
+class RuleEngine:
+    def __init__(self, rules=DEFAULT_RULES, default=DEFAULT_STATE):
+        self.rules = tuple(rules)
+        self.default = default
+        # Code 0 = Standardzustand, 1..n = Regeln in Prioritätsreihenfolge
+        self.states = (default,) + self.rules
+        self.channels = sorted({r.channel for r in self.rules})
+
+    @classmethod
+    def from_toml(cls, path):
+        """Regeln aus einer TOML-Datei mit ``[[rule]]``-Tabellen (Felder wie ``Rule``)."""
+        with open(path, "rb") as f:
+            config = tomllib.load(f)
+        default = Rule(**config["default"]) if "default" in config else DEFAULT_STATE
+        return cls([Rule(**r) for r in config["rule"]], default)
+
+    def evaluate(self, readings):
+        """``readings``: Kanal -> Array gleicher Länge (fehlende Kanäle werden ignoriert)."""
+        arrays = {c: np.asarray(v, dtype=np.float64) for c, v in readings.items()}
+        if not arrays:
+            raise ValueError("readings enthält keinen Kanal")
+        n = len(next(iter(arrays.values())))
+        codes = np.zeros(n, dtype=np.uint8)
+        # Niedrigste Priorität zuerst schreiben, höhere überschreiben sie
+        for code in range(len(self.rules), 0, -1):
+            rule = self.rules[code - 1]
+            values = arrays.get(rule.channel)
+            if values is not None:
+                codes[rule.mask(values)] = code
+        return Decisions(codes, self.states)
+
+    def evaluate_one(self, reading):
+        """Skalarer Pfad für einen einzelnen Messwert (Referenz für den Benchmark)."""
+        for rule in self.rules:
+            value = reading.get(rule.channel)
+            if value is not None and rule.matches(value):
+                return rule
+        return self.default
+
+
+engine = RuleEngine()
@@ -0,0 +1,136 @@
+"""Simulierter Sensor-Feed als lokaler Ersatz für Kamera/MQTT.
+
+``LocalBroker`` ist ein minimaler In-Process-Publish/Subscribe-Broker mit
+MQTT-artigen Topics; ``SimulatedSensorFeed`` veröffentlicht in einem
+Hintergrund-Thread Messwerte für Bodenfeuchte, Temperatur und Licht (mit
+Tagesgang und Rauschen), und ``SensorStore`` schreibt jede Messung in einen
+Ringpuffer pro Kanal.
+"""
+
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from smartag.ringbuffer import RingBuffer
+
+TOPIC_PREFIX = "smartag/sensor/"
+
+# Kanal -> (Einheit, Wertebereich)
+CHANNELS = {
+    "bodenfeuchte": ("%", (0.0, 100.0)),
+    "temperatur": ("°C", (0.0, 45.0)),
+    "licht": ("lx", (0.0, 100000.0)),
+}
+
+DEFAULT_RATE_HZ = float(os.environ.get("SMARTAG_SENSOR_HZ", "1"))
+DEFAULT_CAPACITY = int(os.environ.get("SMARTAG_SENSOR_CAPACITY", "3600"))
+
+
+class LocalBroker:
+    """Publish/Subscribe im Prozess, Topics wie bei MQTT (``+``/``#`` als Platzhalter)."""
+
+    def __init__(self):
+        self._subscribers = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def subscribe(self, pattern, callback):
+        with self._lock:
+            self._subscribers[pattern].append(callback)
+
+    def publish(self, topic, payload):
+        with self._lock:
+            matches = [cb for pattern, cbs in self._subscribers.items()
+                       if _topic_matches(pattern, topic) for cb in cbs]
+        for callback in matches:
+            callback(topic, payload)
+
+
+def _topic_matches(pattern, topic):
+    p_parts, t_parts = pattern.split("/"), topic.split("/")
+    for i, p in enumerate(p_parts):
+        if p == "#":
+            return True
+        if i >= len(t_parts) or (p != "+" and p != t_parts[i]):
+            return False
+    return len(p_parts) == len(t_parts)
+
+
+class SensorStore:
+    """Ein Ringpuffer pro Kanal; Speicher bleibt konstant."""
+
+    def __init__(self, broker, capacity=DEFAULT_CAPACITY):
+        self.buffers = {name: RingBuffer(capacity) for name in CHANNELS}
+        broker.subscribe(TOPIC_PREFIX + "+", self._on_message)
+
+    def _on_message(self, topic, payload):
+        channel = topic[len(TOPIC_PREFIX):]
+        buffer = self.buffers.get(channel)
+        if buffer is not None:
+            buffer.append(payload["ts"], payload["value"])
+
+    def latest(self):
+        return {name: buf.latest()[1] for name, buf in self.buffers.items()}
+
+    @property
+    def nbytes(self):
+        return sum(buf.nbytes for buf in self.buffers.values())
+
+
+class SimulatedSensorFeed(threading.Thread):
+    """Erzeugt ``rate_hz`` Messungen pro Sekunde und Kanal.
+
+    Ein simulierter Tag dauert ``day_seconds`` Sekunden, damit der Tagesgang
+    in der Demo sichtbar wird.
+    """
+
+    def __init__(self, broker, rate_hz=DEFAULT_RATE_HZ, day_seconds=600.0, seed=None):
+        super().__init__(name="smartag-sensor-feed", daemon=True)
+        self.broker = broker
+        self.rate_hz = rate_hz
+        self.day_seconds = day_seconds
+        self._rng = np.random.default_rng(seed)
+        self._moisture = 45.0
+        self._halt = threading.Event()
+
+    def reading(self, now):
+        phase = (now % self.day_seconds) / self.day_seconds  # 0 = Mitternacht
+        sun = max(0.0, math.sin(math.pi * (phase - 0.25) * 2))
+        # Bodenfeuchte sinkt tagsüber, gelegentlich "Bewässerung"
+        self._moisture += -0.05 * sun + self._rng.normal(0, 0.3)
+        if self._moisture < 20 and self._rng.random() < 0.05:
+            self._moisture += 40
+        self._moisture = min(max(self._moisture, 0.0), 100.0)
+        return {
+            "bodenfeuchte": self._moisture,
+            "temperatur": 12 + 18 * sun + self._rng.normal(0, 0.5),
+            "licht": max(0.0, 90000 * sun + self._rng.normal(0, 1500)),
+        }
+
+    def step(self, now=None):
+        now = time.time() if now is None else now
+        for channel, value in self.reading(now).items():
+            self.broker.publish(TOPIC_PREFIX + channel, {"ts": now, "value": value})
+
+    def run(self):
+        interval = 1.0 / self.rate_hz
+        next_tick = time.monotonic()
+        while not self._halt.is_set():
+            self.step()
+            next_tick += interval
+            self._halt.wait(max(0.0, next_tick - time.monotonic()))
+
+    def stop(self):
+        self._halt.set()
+
+
+def start_demo_feed(rate_hz=DEFAULT_RATE_HZ, capacity=DEFAULT_CAPACITY):
+    """Broker, Store und laufender Feed – einmal pro Prozess anlegen."""
+    broker = LocalBroker()
+    store = SensorStore(broker, capacity)
+    feed = SimulatedSensorFeed(broker, rate_hz)
+    feed.start()
+    return broker, store, feed
@@ -0,0 +1,247 @@
+"""Auslieferung der Präsentationsbilder als statische, cachebare URLs.
+
+Im Static-Modus werden die Dateien unter einem inhaltsgehashten Namen nach
+``static/`` kopiert und über Streamlits Static-File-Serving als
+``app/static/<name>.<hash>.<ext>?v=<hash>`` referenziert. Der ``v``-Parameter
+sorgt dafür, dass Tornado die Antwort mit einer Cache-Dauer von 10 Jahren
+markiert – der Browser lädt jedes Bild also nur einmal, statt es bei jedem
+Rerun als Base64 im HTML mitzubekommen.
+
+Der Inline-Modus (Data-URIs) bleibt als Fallback für Deployments ohne
+``.streamlit/config.toml`` erhalten. Auswahl über ``SMARTAG_ASSET_MODE``
+(``auto`` | ``static`` | ``inline`` | ``bundle`` für den Offline-Export).
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from urllib.parse import quote
+
+from smartag.assets import BASE_DIR, cache, get_base64_image
+
+STATIC_DIR = BASE_DIR / "static"
+STATIC_URL = "app/static"
+HASH_LEN = 12
+
+_published = {}
+_lock = threading.Lock()
+
+
+def asset_mode():
+    mode = os.environ.get("SMARTAG_ASSET_MODE", "auto").lower()
+    if mode in ("static", "inline", "bundle"):
+        return mode
+    try:
+        import streamlit as st
+        return "static" if st.get_option("server.enableStaticServing") else "inline"
+    except Exception:
+        return "inline"
+
+
+def is_inline(mode):
+    # "bundle" = Inline für den Offline-Export (smartag/export.py), inkl. PDF
+    return mode in ("inline", "bundle")
+
+
+def hashed_name(path, sha256):
+    return f"{path.stem}.{sha256[:HASH_LEN]}{path.suffix.lower()}"
+
+
+def publish(path):
+    """Legt ``path`` inhaltsgehasht in ``static/`` ab und liefert die URL.
+
+    Liegt die Datei schon vom Build dort, wird das Original nicht gelesen.
+    """
+    resolved = cache.resolve(path)
+    sha256 = fingerprint(path)
+    with _lock:
+        url = _published.get((resolved, sha256))
+        if url is None:
+            name = hashed_name(resolved, sha256)
+            target = STATIC_DIR / name
+            if not target.exists():
+                STATIC_DIR.mkdir(exist_ok=True)
+                tmp = target.with_suffix(target.suffix + ".tmp")
+                tmp.write_bytes(cache.get(path).raw)
+                os.replace(tmp, target)
+            url = f"{STATIC_URL}/{quote(name)}?v={sha256[:HASH_LEN]}"
+            _published[(resolved, sha256)] = url
+        return url
+
+
+def asset_url(path, mode=None):
+    """URL für Markup/CSS: statische URL oder Data-URI; ``""`` wenn die Datei fehlt."""
+    if is_inline(mode or asset_mode()):
+        return get_base64_image(path)
+    try:
+        return publish(path)
+    except OSError:
+        return ""
+
+
+def download_url(path):
+    """Statische Download-URL (nur im Static-Modus), sonst ``None``.
+
+    Tornado streamt die Datei erst beim Klick; im HTML steht nur der Link.
+    Im Bundle-Modus wird die Datei als Data-URI eingebettet.
+    """
+    mode = asset_mode()
+    try:
+        if mode == "static":
+            return publish(path)
+        if mode == "bundle":
+            return cache.data_uri(path)
+    except OSError:
+        pass
+    return None
+
+
+# --- Responsive Varianten aus ``python -m smartag.build_assets`` ---
+
+MANIFEST_PATH = STATIC_DIR / "derived" / "manifest.json"
+# sha256, Größe und mtime der Originale, beim Build erfasst
+FINGERPRINTS_PATH = STATIC_DIR / "derived" / "fingerprints.json"
+SMALL_SCREEN_PX = 640
+
+_json_files = {}
+
+
+def _load_json(path):
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    with _lock:
+        cached = _json_files.get(path)
+        if cached is None or cached[0] != mtime_ns:
+            cached = _json_files[path] = (mtime_ns, json.loads(path.read_text()))
+        return cached[1]
+
+
+def load_manifest():
+    return _load_json(MANIFEST_PATH)
+
+
+def fingerprint(path):
+    """sha256 des Originals; aus dem Build übernommen, solange Größe und mtime passen.
+
+    Spart beim Kaltstart das Lesen und Hashen großer Dateien (PDF, Originalbilder).
+    """
+    item = _load_json(FINGERPRINTS_PATH).get(str(path))
+    if item is not None:
+        st = os.stat(cache.resolve(path))
+        if item["bytes"] == st.st_size and item["mtime_ns"] == st.st_mtime_ns:
+            return item["sha256"]
+    return cache.get(path).sha256
+
+
+def variants(path):
+    """Varianten aus dem Manifest, sofern sie zum aktuellen Original passen."""
+    item = load_manifest().get(str(path))
+    try:
+        if item is None or item["source_sha256"] != fingerprint(path):
+            return None
+    except OSError:
+        return None
+    return item
+
+
+def _variant_url(variant, mode):
+    if is_inline(mode):
+        return get_base64_image(Path("static", "derived", variant["file"]))
+    digest = variant["file"].rsplit(".", 2)[-2]
+    return f"{STATIC_URL}/derived/{variant['file']}?v={digest}"
+
+
+def _servable_suffixes():
+    # Streamlit liefert nur bekannte Endungen mit passendem Content-Type aus
+    # (AVIF z. B. als text/plain) – solche Varianten lassen wir weg.
+    try:
+        from streamlit.web.server.app_static_file_handler import SAFE_APP_STATIC_FILE_EXTENSIONS
+        return set(SAFE_APP_STATIC_FILE_EXTENSIONS)
+    except ImportError:
+        return {".jpg", ".jpeg", ".png", ".webp"}
+
+
+def _by_format(item):
+    servable = _servable_suffixes()
+    grouped = {}
+    for v in item["variants"]:
+        if Path(v["file"]).suffix in servable:
+            grouped.setdefault(v["format"], []).append(v)
+    return grouped
+
+
+def _srcset(vs, mode):
+    return ", ".join(f"{_variant_url(v, mode)} {v['width']}w" for v in vs)
+
+
+def responsive_img(path, sizes, style="", alt=""):
+    """``<picture>`` mit ``srcset`` je auslieferbarem Format bzw. schlichtes ``<img>`` ohne Manifest.
+
+    Praktisch WebP plus JPEG/PNG-Fallback: AVIF-Varianten entstehen zwar beim
+    Build, Streamlits Static-Serving liefert ``.avif`` aber nicht mit
+    passendem Content-Type aus (``_servable_suffixes``).
+    """
+    mode = asset_mode()
+    item = variants(path)
+    if item is None:
+        return f'<img src="{asset_url(path, mode)}" style="{style}" alt="{alt}">'
+    grouped = _by_format(item)
+    fallback = grouped[item["fallback"]]
+    if is_inline(mode):
+        # Ohne Static-Serving zählt jedes Byte im HTML – nur die größte WebP-Variante einbetten
+        best = (grouped.get("webp") or fallback)[-1]
+        return f'<img src="{_variant_url(best, mode)}" style="{style}" alt="{alt}">'
+    sources = "".join(
+        f'<source type="{vs[0]["mime"]}" sizes="{sizes}" srcset="{_srcset(vs, mode)}">'
+        for fmt, vs in grouped.items() if fmt != item["fallback"]
+    )
+    srcset = _srcset(fallback, mode)
+    return (
+        f'<picture>{sources}<img src="{_variant_url(fallback[-1], mode)}" srcset="{srcset}" '
+        f'sizes="{sizes}" style="{style}" alt="{alt}"></picture>'
+    )
+
+
+def lite_img(path, style="", alt=""):
+    """Ein einzelnes, stark komprimiertes ``<img>`` für das Lite-Profil (``smartag.edge``)."""
+    mode = asset_mode()
+    item = variants(path)
+    if item is None:
+        return f'<img src="{asset_url(path, mode)}" style="{style}" alt="{alt}">'
+    grouped = _by_format(item)
+    # ohne eigene Lite-Variante: kleinste WebP- bzw. Fallback-Variante
+    lite = item.get("lite") or (grouped.get("webp") or grouped[item["fallback"]])[0]
+    return (
+        f'<img src="{_variant_url(lite, mode)}" width="{lite["width"]}" height="{lite["height"]}" '
+        f'style="{style}" alt="{alt}">'
+    )
+
+
+def _image_set(vs_by_format, index, mode):
+    return "image-set(" + ", ".join(
+        f'url("{_variant_url(vs[index], mode)}") type("{vs[index]["mime"]}")'
+        for vs in vs_by_format.values()
+    ) + ")"
+
+
+def background_css(selector, path):
+    """CSS-Regeln für ``background-image`` von ``selector`` (klein auf Smartphones)."""
+    mode = asset_mode()
+    item = variants(path)
+    if item is None:
+        return f"{selector} {{ background-image: url('{asset_url(path, mode)}'); }}"
+    grouped = _by_format(item)
+    fallback = grouped[item["fallback"]]
+    if is_inline(mode):
+        best = (grouped.get("webp") or fallback)[-1]
+        return f"{selector} {{ background-image: url('{_variant_url(best, mode)}'); }}"
+    return (
+        f"{selector} {{ background-image: url('{_variant_url(fallback[-1], mode)}'); "
+        f"background-image: {_image_set(grouped, -1, mode)}; }}\n"
+        f"@media (max-width: {SMALL_SCREEN_PX}px) {{ {selector} {{ "
+        f"background-image: url('{_variant_url(fallback[0], mode)}'); "
+        f"background-image: {_image_set(grouped, 0, mode)}; }} }}"
+    )
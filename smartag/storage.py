@@ -0,0 +1,257 @@
+"""Eingebetteter Zeitreihenspeicher für Kamera-Detektionen (SQLite).
+
+Lokaler Ersatz für PostgreSQL/TimescaleDB auf dem Gateway, vollständig
+offline. Angelehnt an Timescale-Hypertables werden die Detektionen in
+zeitliche Chunks (eine Tabelle pro ``chunk_days``) geschrieben; jede Chunk-
+Tabelle hat Indizes auf (Kamera, Art, Ort, Zeit), (Art, Ort, Zeit) und Zeit.
+Abfragen berühren nur die Chunks im angefragten Zeitraum, alte Daten lassen
+sich chunkweise verwerfen.
+
+    store = DetectionStore("smartag.db")
+    store.ingest({"ts": ..., "camera": ..., "species": ..., ...})   # Spalten-Arrays
+    cols = store.query(start, end, species="Tomate")                  # dict von NumPy-Arrays
+
+Schreiben läuft im WAL-Modus mit ``synchronous=NORMAL`` in einer Transaktion
+pro Batch; Lesen über eine eigene Verbindung pro Thread.
+"""
+
+import sqlite3
+import threading
+
+import numpy as np
+
+DIMENSIONS = ("camera", "species", "location")
+
+# Messwertspalten einer Detektion
+MEASURES = (
+    ("fruit_count", "INTEGER", np.int32),
+    ("ripeness", "INTEGER", np.int8),      # Reifeklasse 0..n
+    ("confidence", "REAL", np.float32),
+    ("stress", "INTEGER", np.uint8),        # Bitmaske Stressmerkmale
+    ("battery", "REAL", np.float32),        # Batteriestand in %
+)
+
+COLUMNS = ("ts",) + tuple(f"{d}_id" for d in DIMENSIONS) + tuple(m[0] for m in MEASURES)
+DTYPE = np.dtype(
+    [("ts", np.int64)] + [(f"{d}_id", np.int32) for d in DIMENSIONS]
+    + [(name, dtype) for name, _, dtype in MEASURES]
+)
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",      # ~16 MB Seitencache
+    "PRAGMA mmap_size=268435456",    # 256 MB Memory-Mapping für Lesezugriffe
+)
+
+DAY = 86400
+
+
+class DetectionStore:
+    def __init__(self, path, chunk_days=7):
+        self.path = str(path)
+        self.chunk_seconds = int(chunk_days * DAY)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._dim_cache = {d: {} for d in DIMENSIONS}
+        self._listeners = []
+        db = self._conn()
+        with db:
+            for d in DIMENSIONS:
+                db.execute(f"CREATE TABLE IF NOT EXISTS {d} (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL)")
+            db.execute("CREATE TABLE IF NOT EXISTS chunks (name TEXT PRIMARY KEY, start INTEGER, stop INTEGER)")
+        # Chunks mit festgeschriebener Tabelle und Registereintrag (nur Abkürzung beim Schreiben)
+        self._chunks = {row[0] for row in db.execute("SELECT start FROM chunks")}
+
+    # --- Verbindungen ---
+
+    def _conn(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            for pragma in PRAGMAS:
+                db.execute(pragma)
+            self._local.db = db
+        return db
+
+    def close(self):
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+    # --- Dimensionen (Name <-> Integer-ID) ---
+
+    def dimension_ids(self, dimension, names):
+        """IDs zu Namen; unbekannte Namen werden angelegt."""
+        cache = self._dim_cache[dimension]
+        missing = [n for n in dict.fromkeys(names) if n not in cache]
+        if missing:
+            db = self._conn()
+            with self._write_lock, db:
+                db.executemany(f"INSERT OR IGNORE INTO {dimension} (name) VALUES (?)", [(n,) for n in missing])
+                for name, id_ in db.execute(f"SELECT name, id FROM {dimension}"):
+                    cache[name] = id_
+        return [cache[n] for n in names]
+
+    def _dimension_id(self, dimension, name):
+        """ID zu einem Namen, ohne ihn anzulegen; ``None``, wenn unbekannt."""
+        cache = self._dim_cache[dimension]
+        if name not in cache:
+            row = self._conn().execute(f"SELECT id FROM {dimension} WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                return None
+            cache[name] = row[0]
+        return cache[name]
+
+    def dimension_names(self, dimension):
+        return {id_: name for name, id_ in self._conn().execute(f"SELECT name, id FROM {dimension}")}
+
+    def _dimension_column(self, dimension, values):
+        values = np.asarray(values)
+        if values.dtype.kind in "iu":
+            return values.astype(np.int32)
+        uniques, inverse = np.unique(values, return_inverse=True)
+        ids = np.asarray(self.dimension_ids(dimension, [str(u) for u in uniques]), dtype=np.int32)
+        return ids[inverse]
+
+    # --- Chunks ---
+
+    def _chunk_start(self, ts):
+        return (np.asarray(ts, dtype=np.int64) // self.chunk_seconds) * self.chunk_seconds
+
+    @staticmethod
+    def _chunk_table(start):
+        return f"detections_{int(start)}"
+
+    def _ensure_chunk(self, db, start):
+        """Tabelle und Registereintrag in der laufenden Transaktion anlegen; ``True``, wenn neu."""
+        if start in self._chunks:
+            return False
+        table = self._chunk_table(start)
+        cols = ", ".join(
+            ["ts INTEGER NOT NULL"] + [f"{d}_id INTEGER NOT NULL" for d in DIMENSIONS]
+            + [f"{name} {sqltype}" for name, sqltype, _ in MEASURES]
+        )
+        db.execute(f"CREATE TABLE IF NOT EXISTS {table} ({cols})")
+        db.execute(f"CREATE INDEX IF NOT EXISTS {table}_dims ON {table} (camera_id, species_id, location_id, ts)")
+        db.execute(f"CREATE INDEX IF NOT EXISTS {table}_sl ON {table} (species_id, location_id, ts)")
+        db.execute(f"CREATE INDEX IF NOT EXISTS {table}_ts ON {table} (ts)")
+        db.execute("INSERT OR IGNORE INTO chunks VALUES (?, ?, ?)", (table, int(start), int(start) + self.chunk_seconds))
+        return True
+
+    def chunk_starts(self, start=None, end=None):
+        """Beginn der Chunks, die ``[start, end)`` berühren; aus der Datenbank, also auch fremde Schreiber."""
+        clauses, params = ["1"], []
+        if end is not None:
+            clauses.append("start < ?")
+            params.append(int(end))
+        if start is not None:
+            clauses.append("stop > ?")
+            params.append(int(start))
+        rows = self._conn().execute(f"SELECT start FROM chunks WHERE {' AND '.join(clauses)} ORDER BY start", params)
+        return [row[0] for row in rows]
+
+    # --- Schreiben ---
+
+    def subscribe(self, listener):
+        """``listener(db, data)`` wird bei jedem Batch in derselben Transaktion aufgerufen."""
+        self._listeners.append(listener)
+
+    def ingest(self, columns):
+        """Spalten (``ts``, ``camera``, ``species``, ``location`` + Messwerte) in einem Batch schreiben.
+
+        Dimensionen dürfen als Namen oder bereits als IDs übergeben werden.
+        Gibt die Anzahl geschriebener Zeilen zurück.
+        """
+        ts = np.asarray(columns["ts"], dtype=np.int64)
+        n = len(ts)
+        if n == 0:
+            return 0
+        data = np.empty(n, dtype=DTYPE)
+        data["ts"] = ts
+        for d in DIMENSIONS:
+            data[f"{d}_id"] = self._dimension_column(d, columns[d])
+        for name, _, dtype in MEASURES:
+            data[name] = columns.get(name, np.zeros(n, dtype=dtype))
+
+        starts = self._chunk_start(ts)
+        order = np.argsort(starts, kind="stable")
+        data, starts = data[order], starts[order]
+        bounds = np.flatnonzero(np.diff(starts)) + 1
+        placeholders = ", ".join("?" * len(COLUMNS))
+
+        db = self._conn()
+        with self._write_lock:
+            created = []
+            with db:
+                # sqlite3 beginnt die Transaktion sonst erst beim INSERT; CREATE TABLE und der
+                # Registereintrag sollen mit dem Batch festgeschrieben oder zurückgerollt werden
+                db.execute("BEGIN")
+                for part in np.split(np.arange(n), bounds):
+                    start = int(starts[part[0]])
+                    if self._ensure_chunk(db, start):
+                        created.append(start)
+                    db.executemany(
+                        f"INSERT INTO {self._chunk_table(start)} VALUES ({placeholders})",
+                        data[part].tolist(),
+                    )
+                for listener in self._listeners:
+                    listener(db, data)
+            self._chunks.update(created)
+        return n
+
+    def drop_before(self, ts):
+        """Ganze Chunks vor ``ts`` verwerfen (Aufbewahrungsfrist)."""
+        db = self._conn()
+        dropped = [s for s in self.chunk_starts(end=ts) if s + self.chunk_seconds <= ts]
+        with self._write_lock, db:
+            for start in dropped:
+                db.execute(f"DROP TABLE IF EXISTS {self._chunk_table(start)}")
+                db.execute("DELETE FROM chunks WHERE start = ?", (start,))
+                self._chunks.discard(start)
+        return len(dropped)
+
+    # --- Lesen ---
+
+    def _where(self, start, end, filters, time_column="ts"):
+        clauses, params = [f"{time_column} >= ?", f"{time_column} < ?"], [int(start), int(end)]
+        for d in DIMENSIONS:
+            value = filters.get(d)
+            if value is None:
+                continue
+            if isinstance(value, str):
+                # nur nachschlagen, nicht anlegen; unbekannter Name ergibt keine Treffer
+                value = self._dimension_id(d, value)
+                if value is None:
+                    value = -1
+            clauses.append(f"{d}_id = ?")
+            params.append(int(value))
+        return " AND ".join(clauses), params
+
+    def query(self, start, end, columns=COLUMNS, **filters):
+        """Detektionen in ``[start, end)`` als dict von NumPy-Arrays, nach Zeit sortiert.
+
+        Filter: ``camera=``, ``species=``, ``location=`` (Name oder ID).
+        """
+        columns = tuple(columns)
+        dtype = np.dtype([(c, DTYPE[c]) for c in columns])
+        where, params = self._where(start, end, filters)
+        db = self._conn()
+        parts = []
+        for chunk in self.chunk_starts(start, end):
+            cursor = db.execute(
+                f"SELECT {', '.join(columns)} FROM {self._chunk_table(chunk)} WHERE {where} ORDER BY ts",
+                params,
+            )
+            parts.append(np.fromiter(cursor, dtype=dtype))
+        data = np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+        return {c: data[c] for c in columns}
+
+    def count(self, start=None, end=None):
+        db = self._conn()
+        total = 0
+        for chunk in self.chunk_starts(start, end):
+            total += db.execute(f"SELECT count(*) FROM {self._chunk_table(chunk)}").fetchone()[0]
+        return total
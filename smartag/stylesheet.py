@@ -0,0 +1,113 @@
+"""Ein gemeinsames, minifiziertes Stylesheet für die ganze Seite.
+
+``styles.css`` (Theme, Hintergrund-Tabelle, Druckregeln, Tabellen) wird beim
+ersten Aufruf zusammen mit den Hintergrundbild-Regeln minifiziert und über
+seinen Inhalt gehasht.
+
+``inject()`` sendet es als ``<style>`` über ``st.html``: nur Style-Tags
+landen in Streamlits Event-Container, nehmen also keinen Platz ein, und die
+Seite ist schon beim ersten Rendern gestaltet. Das Element muss in jedem Lauf
+gesendet werden – was ein Rerun nicht erneut sendet, entfernt das Frontend.
+Übertragen wird das Stylesheet trotzdem nur einmal je Session: Nachrichten ab
+``global.minCachedMessageSize`` (``.streamlit/config.toml``: 1 KB) hält der
+Browser vor, Reruns schicken nur deren Hash. ``style_tag()`` liefert das
+Markup für ``st.markdown`` (Offline-Export, Modus ``bundle``) bzw. ein
+``@import`` der Datei ``static/smartag.<hash>.css``.
+
+Im Lite-Profil (``smartag.edge``) ersetzen CSS-Verläufe die Hintergrundbilder.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+
+from smartag.static_assets import (
+    HASH_LEN, MANIFEST_PATH, STATIC_DIR, STATIC_URL, asset_mode, background_css, is_inline,
+)
+
+TEMPLATE_PATH = Path(__file__).with_name("styles.css")
+
+BACKGROUNDS = [
+    (".column-with-bg", "smartgreenhouse.png"),
+    (".column-with-bg2", "DryPlants.jpeg"),
+]
+
+# Lite-Profil: Stimmung der Bilder (Gewächshaus, trockene Pflanzen) ohne Bilddaten
+LITE_BACKGROUNDS = [
+    ".column-with-bg { background-image: linear-gradient(135deg, #e8f5e9 0%, #a5d6a7 100%); }",
+    ".column-with-bg2 { background-image: linear-gradient(160deg, #fff8e1 0%, #d7ccc8 100%); }",
+]
+
+_built = {}
+_lock = threading.Lock()
+
+
+def minify(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    # Doppelpunkt nur in Deklarationen: ".a :hover" ist ein anderer Selektor als ".a:hover"
+    css = re.sub(r"\s*:\s*(?=[^{}]*[;}])", ":", css)
+    css = css.replace(";}", "}").replace(";;", ";")
+    return css.strip()
+
+
+def _mtime(path):
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def build(mode=None, lite=False):
+    """Liefert ``(css, sha256)``; neu gebaut nur, wenn sich Vorlage oder Manifest ändern."""
+    mode = mode or asset_mode()
+    key = (mode, lite, _mtime(TEMPLATE_PATH), _mtime(MANIFEST_PATH))
+    with _lock:
+        if key not in _built:
+            rules = [TEMPLATE_PATH.read_text(encoding="utf-8")]
+            if lite:
+                rules += LITE_BACKGROUNDS
+            else:
+                rules += [background_css(selector, path) for selector, path in BACKGROUNDS]
+            css = minify("\n".join(rules))
+            for stale in [k for k in _built if k[:2] == key[:2]]:
+                del _built[stale]
+            _built[key] = (css, hashlib.sha256(css.encode()).hexdigest())
+        return _built[key]
+
+
+def publish(css, digest):
+    name = f"smartag.{digest[:HASH_LEN]}.css"
+    target = STATIC_DIR / name
+    if not target.exists():
+        STATIC_DIR.mkdir(exist_ok=True)
+        tmp = target.with_suffix(".tmp")
+        # Die Datei liegt selbst unter app/static/ – URLs relativ dazu
+        tmp.write_text(css.replace(f"{STATIC_URL}/", ""), encoding="utf-8")
+        os.replace(tmp, target)
+    return f"{STATIC_URL}/{name}?v={digest[:HASH_LEN]}"
+
+
+def inject(lite=False):
+    """Stylesheet als ``<style>`` senden; der Browser bekommt es einmal je Session."""
+    import streamlit as st
+
+    mode = asset_mode()
+    if mode == "bundle":
+        # der Export übersetzt nur Markdown-Elemente
+        st.markdown(style_tag(lite), unsafe_allow_html=True)
+        return
+    css, _ = build(mode, lite)
+    st.html(f"<style>{css}</style>")
+
+
+def style_tag(lite=False):
+    """Markup für ``st.markdown``: ``@import`` oder das ganze Stylesheet (Export, Tests)."""
+    mode = asset_mode()
+    css, digest = build(mode, lite)
+    if is_inline(mode):
+        return f"<style>{css}</style>"
+    return f'<style>@import url("{publish(css, digest)}");</style>'
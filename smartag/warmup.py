@@ -0,0 +1,44 @@
+"""Warm-up nach dem Aufwachen des Sleepy Servers.
+
+    python -m smartag.warmup [--url http://localhost:8501] [--timeout 60]
+
+Wird direkt nach ``streamlit run`` gestartet (z. B. im selben systemd-Unit
+oder Wake-on-WLAN-Skript). Wartet, bis der Server antwortet, und führt die
+Seite einmal headless über den Websocket aus. Dabei werden im Serverprozess
+Plotly und NumPy importiert, die Assets veröffentlicht, das Stylesheet und die
+Abschnitts-HTML gebaut sowie die Energiesimulation in den Cache gelegt – der
+erste echte Besucher bekommt die Seite so in der Zeit eines Warmstarts.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from smartag.wsclient import Session, wait_healthy
+
+DEFAULT_URL = "http://localhost:8501"
+
+
+async def warm_up(url=DEFAULT_URL, timeout=60.0):
+    """Einen vollständigen Skriptlauf gegen ``url`` ausführen; liefert das ``Run``-Protokoll."""
+    session = await Session.connect(url, timeout)
+    try:
+        return await session.rerun(timeout=timeout)
+    finally:
+        session.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args(argv)
+
+    waited = wait_healthy(args.url, args.timeout)
+    run = asyncio.run(warm_up(args.url, args.timeout))
+    print(f"Server bereit nach {waited:.2f} s, Warm-up-Lauf {run.finished:.2f} s ({run.deltas} Deltas)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""Minimaler Websocket-Client für eine laufende Streamlit-App (Benchmarks, Warm-up).
+
+Spricht dasselbe Protokoll wie das Browser-Frontend: ``BackMsg.rerun_script``
+startet einen Lauf, der Server antwortet mit ``ForwardMsg``-Nachrichten
+(Deltas, ``script_finished``). Jede empfangene Nachricht wird mit Zeitpunkt
+und Größe protokolliert, sodass sich Time-to-First-Section, Rerun-Latenz und
+übertragene Bytes messen lassen. Wie der Browser meldet der Client die
+Hashes bereits empfangener großer Nachrichten (der Server schickt dann nur
+Referenzen) und stößt ``run_every``-Fragmente selbst an. Nutzt Tornado, das
+Streamlit ohnehin mitbringt.
+
+    session = await Session.connect("http://localhost:8501")
+    run = await session.rerun()
+    run.first("class=\\"title\\""), run.finished, run.nbytes
+"""
+
+import asyncio
+import contextlib
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.websocket import websocket_connect
+
+STREAM_PATH = "/_stcore/stream"
+HEALTH_PATH = "/_stcore/health"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _server_env(script, env=None):
+    """Umgebung des Servers: Projektordner vorn im ``PYTHONPATH``, dahinter ein übergebener."""
+    env = dict(os.environ, **(env or {}))
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(script.parent), env.get("PYTHONPATH")) if p)
+    return env
+
+
+@contextlib.contextmanager
+def local_server(script, env=None):
+    """``streamlit run`` headless auf einem freien Port; liefert ``(url, prozess, startzeit)``."""
+    script = Path(script).resolve()
+    port = free_port()
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(script), "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=script.parent, env=_server_env(script, env),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        yield f"http://127.0.0.1:{port}", proc, started
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def wait_healthy(url, timeout=60.0, poll=0.02):
+    """Blockiert, bis ``/_stcore/health`` antwortet; gibt die Wartezeit zurück."""
+    start = time.perf_counter()
+    while True:
+        try:
+            with urllib.request.urlopen(url.rstrip("/") + HEALTH_PATH, timeout=1) as response:
+                if response.status == 200:
+                    return time.perf_counter() - start
+        except OSError:
+            pass
+        if time.perf_counter() - start > timeout:
+            raise TimeoutError(f"{url} nicht erreichbar")
+        time.sleep(poll)
+
+
+@dataclass
+class Run:
+    """Protokoll eines Skriptlaufs; Zeiten in Sekunden relativ zu ``started``."""
+    started: float
+    events: list = field(default_factory=list)   # (t, art, bytes, markdown)
+    elements: list = field(default_factory=list)  # Elementtypen neuer Elemente
+    finished: float = None
+
+    @property
+    def nbytes(self):
+        return sum(e[2] for e in self.events)
+
+    @property
+    def deltas(self):
+        return sum(1 for e in self.events if e[1] == "delta")
+
+    def first(self, marker):
+        """Zeitpunkt des ersten Markdown-/JSON-Deltas, das ``marker`` enthält."""
+        for t, kind, _, body in self.events:
+            if kind == "delta" and body and marker in body:
+                return t
+        return None
+
+    def body(self, marker):
+        """Inhalt des ersten Markdown-/JSON-Deltas, das ``marker`` enthält."""
+        for _, kind, _, body in self.events:
+            if kind == "delta" and body and marker in body:
+                return body
+        return None
+
+
+class Session:
+    def __init__(self, conn):
+        self.conn = conn
+        self.received_bytes = 0
+        self.page_script_hash = ""
+        self.query_string = ""
+        # Hashes cachebarer Nachrichten, wie sie das Frontend im Speicher hält
+        self.cached_hashes = set()
+        # fragment_id -> Intervall in s (ForwardMsg.auto_rerun)
+        self.auto_reruns = {}
+
+    @classmethod
+    async def connect(cls, url, timeout=30.0):
+        ws_url = url.rstrip("/").replace("http://", "ws://").replace("https://", "wss://") + STREAM_PATH
+        conn = await asyncio.wait_for(websocket_connect(ws_url, subprotocols=["streamlit"]), timeout)
+        return cls(conn)
+
+    async def _send(self, msg):
+        await self.conn.write_message(msg.SerializeToString(), binary=True)
+
+    def _rerun_msg(self, query_string, fragment_id=None, widget_states=None):
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.query_string = query_string
+        state.page_script_hash = self.page_script_hash
+        state.cached_message_hashes.extend(self.cached_hashes)
+        if fragment_id:
+            state.fragment_id = fragment_id
+            state.is_auto_rerun = True
+        if widget_states is not None:
+            state.widget_states.CopyFrom(widget_states)
+        return msg
+
+    def _receive(self, raw, run=None):
+        self.received_bytes += len(raw)
+        fwd = ForwardMsg()
+        fwd.ParseFromString(raw)
+        kind = fwd.WhichOneof("type")
+        if fwd.metadata.cacheable and fwd.hash:
+            self.cached_hashes.add(fwd.hash)
+        if kind == "new_session":
+            self.page_script_hash = fwd.new_session.page_script_hash
+        elif kind == "auto_rerun":
+            self.auto_reruns[fwd.auto_rerun.fragment_id] = fwd.auto_rerun.interval
+        if run is not None:
+            body = None
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                run.elements.append(element.WhichOneof("type"))
+                if element.WhichOneof("type") in ("markdown", "json"):
+                    body = getattr(element, element.WhichOneof("type")).body
+            run.events.append((time.perf_counter() - run.started, kind, len(raw), body))
+        return fwd, kind
+
+    async def rerun(self, query_string=None, widget_states=None, timeout=120.0):
+        """Skriptlauf anstoßen und bis ``script_finished`` mitprotokollieren."""
+        if query_string is not None:
+            self.query_string = query_string
+        run = Run(started=time.perf_counter())
+        await self._send(self._rerun_msg(self.query_string, widget_states=widget_states))
+        deadline = run.started + timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise TimeoutError("kein script_finished erhalten")
+            raw = await asyncio.wait_for(self.conn.read_message(), remaining)
+            if raw is None:
+                raise ConnectionError("Websocket geschlossen")
+            fwd, kind = self._receive(raw, run)
+            # Fragment-Läufe (run_every) melden ein eigenes script_finished
+            if kind == "script_finished" and fwd.script_finished != ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY:
+                run.finished = run.events[-1][0]
+                return run
+
+    async def drain(self, seconds):
+        """``seconds`` lang mitlesen und ``run_every``-Fragmente wie der Browser anstoßen; liefert Bytes."""
+        nbytes = 0
+        now = time.perf_counter()
+        deadline = now + seconds
+        due = {fid: now + interval for fid, interval in self.auto_reruns.items()}
+        while (now := time.perf_counter()) < deadline:
+            for fid, when in due.items():
+                if when <= now:
+                    await self._send(self._rerun_msg(self.query_string, fragment_id=fid))
+                    due[fid] = when + self.auto_reruns[fid]
+            wake = min([deadline, *due.values()])
+            try:
+                raw = await asyncio.wait_for(self.conn.read_message(), max(wake - now, 0.001))
+            except asyncio.TimeoutError:
+                continue
+            if raw is None:
+                break
+            nbytes += len(raw)
+            self._receive(raw)
+        return nbytes
+
+    def close(self):
+        self.conn.close()
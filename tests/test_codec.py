@@ -0,0 +1,122 @@
+"""Binärformat der Uplinks: Rundreise, Quantisierung und kaputte Nutzlasten."""
+
+import numpy as np
+import pytest
+
+from smartag import codec
+
+
+def readings(rng, n, ts0=1_750_000_000):
+    return {
+        "ts": ts0 + np.cumsum(rng.integers(1, 600, n)),
+        "fruit_count": rng.integers(0, 300, n),
+        "ripeness": rng.integers(0, 4, n),
+        "confidence": rng.uniform(0, 1, n),
+        "battery": rng.uniform(0, 100, n),
+        "stress": rng.integers(0, 16, n),
+    }
+
+
+def assert_roundtrip(columns, decoded, battery=None):
+    q = codec.quantize(columns)
+    for name in ("ts", "fruit_count", "ripeness", "stress"):
+        np.testing.assert_array_equal(decoded[name], q[name])
+    np.testing.assert_allclose(decoded["confidence"], columns["confidence"], atol=0.5 / codec.CONFIDENCE_SCALE)
+    np.testing.assert_array_equal(decoded["battery"], q["battery"] if battery is None else battery)
+
+
+def test_single_roundtrip(rng):
+    columns = readings(rng, 500)
+    messages = codec.encode(columns)
+    assert messages.shape == (500, codec.SINGLE_BYTES)
+    assert_roundtrip(columns, codec.decode(messages))
+    # als Liste einzelner Uplinks
+    assert_roundtrip(columns, codec.decode([m.tobytes() for m in messages]))
+
+
+def test_quantize_clips_to_layout():
+    q = codec.quantize({"ts": [0, 0], "fruit_count": [-3, 10_000], "confidence": [-0.5, 1.5],
+                        "battery": [-1, 250], "ripeness": [7, 1], "stress": [99, 0]})
+    assert q["fruit_count"].tolist() == [0, 4095]
+    assert q["confidence"].tolist() == [0, codec.CONFIDENCE_SCALE]
+    assert q["battery"].tolist() == [0, 100]
+    assert q["ripeness"].tolist() == [3, 1]
+    assert q["stress"].tolist() == [15, 0]
+
+
+def test_zigzag_roundtrip():
+    v = np.array([0, -1, 1, -2, 2, -2047, 2047])
+    z = codec._zigzag(v)
+    assert z.tolist() == [0, 1, 2, 3, 4, 4093, 4094]
+    np.testing.assert_array_equal(codec._unzigzag(z), v)
+
+
+def _widths(payload):
+    bits = np.unpackbits(np.frombuffer(payload, np.uint8)[:codec.BATCH_HEADER_BITS // 8])
+    offset, widths = 0, {}
+    for name, width in codec.BATCH_HEADER:
+        widths[name] = int("".join(map(str, bits[offset:offset + width])), 2)
+        offset += width
+    return widths["dt_bits"], widths["fruit_bits"]
+
+
+def test_batch_roundtrip_with_negative_deltas(rng):
+    columns = readings(rng, 24)
+    columns["fruit_count"] = np.array([50, 10, 200, 0] * 6)  # steigt und fällt
+    payload = codec.encode_batch(columns)
+    assert len(payload) == codec.batch_size(24, *_widths(payload))
+    # der Batch trägt nur den letzten Batteriestand
+    assert_roundtrip(columns, codec.decode_batch(payload), battery=codec.quantize(columns)["battery"][-1])
+
+
+def test_batch_sorts_by_time(rng):
+    columns = readings(rng, 10)
+    order = rng.permutation(10)
+    shuffled = {k: np.asarray(v)[order] for k, v in columns.items()}
+    decoded = codec.decode_batch(codec.encode_batch(shuffled))
+    np.testing.assert_array_equal(decoded["ts"], columns["ts"])
+    np.testing.assert_array_equal(decoded["fruit_count"], columns["fruit_count"])
+
+
+def test_batch_single_reading_and_equal_timestamps(rng):
+    one = readings(rng, 1)
+    assert_roundtrip(one, codec.decode_batch(codec.encode_batch(one)))
+    same = readings(rng, 5)
+    same["ts"] = np.full(5, 1_750_000_000)
+    np.testing.assert_array_equal(codec.decode_batch(codec.encode_batch(same))["ts"], same["ts"])
+
+
+def test_bad_version_raises(rng):
+    messages = codec.encode(readings(rng, 3))
+    messages[1, 0] = (messages[1, 0] & 0x0F) | 0x20
+    with pytest.raises(codec.CodecError):
+        codec.decode(messages)
+    payload = bytearray(codec.encode_batch(readings(rng, 3)))
+    payload[0] = (payload[0] & 0x0F) | 0x20
+    with pytest.raises(codec.CodecError):
+        codec.decode_batch(bytes(payload))
+
+
+def test_single_length_must_match(rng):
+    messages = codec.encode(readings(rng, 2))
+    with pytest.raises(codec.CodecError):
+        codec.decode([messages[0].tobytes(), messages[1].tobytes()[:-1]])
+    with pytest.raises(codec.CodecError):
+        codec.decode(messages.ravel()[:-4])
+
+
+def test_wrong_kind_and_truncated_batch_raise(rng):
+    with pytest.raises(codec.CodecError):
+        codec.decode_batch(codec.encode(readings(rng, 1))[0].tobytes())
+    payload = codec.encode_batch(readings(rng, 20))
+    with pytest.raises(codec.CodecError):
+        codec.decode_batch(payload[:-3])
+    with pytest.raises(codec.CodecError):
+        codec.decode_batch(payload[:4])
+
+
+def test_batch_size_limits(rng):
+    with pytest.raises(codec.CodecError):
+        codec.encode_batch(readings(rng, codec.MAX_BATCH + 1))
+    with pytest.raises(codec.CodecError):
+        codec.encode_batch(readings(rng, 0))
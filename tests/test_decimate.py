@@ -0,0 +1,66 @@
+"""Ausdünnen von Zeitreihen: Endpunkte und Extremwerte müssen erhalten bleiben."""
+
+import numpy as np
+import pytest
+
+from smartag import decimate
+
+
+@pytest.fixture
+def series(rng):
+    x = np.arange(10_000)
+    y = np.cumsum(rng.normal(size=len(x)))
+    y[3_333] += 100   # Ausreißer nach oben
+    y[7_777] -= 100   # und nach unten
+    return x, y
+
+
+def test_lttb_keeps_endpoints_and_size(series):
+    x, y = series
+    xs, ys = decimate.lttb(x, y, 500)
+    assert len(xs) == 500
+    assert (xs[0], xs[-1]) == (x[0], x[-1])
+    assert (ys[0], ys[-1]) == (y[0], y[-1])
+    assert np.all(np.diff(xs) > 0)
+    # Ausreißer ergeben die größten Dreiecke
+    assert {3_333, 7_777} <= set(xs.tolist())
+
+
+def test_minmax_keeps_extremes(series):
+    x, y = series
+    xs, ys = decimate.minmax(x, y, 500)
+    assert len(xs) <= 500
+    assert ys.max() == y.max() and ys.min() == y.min()
+    assert np.all(np.diff(xs) > 0)
+    # jeder Punkt stammt aus der Originalreihe
+    np.testing.assert_array_equal(ys, y[xs])
+
+
+@pytest.mark.parametrize("method", [decimate.lttb, decimate.minmax])
+def test_short_series_unchanged(method):
+    x, y = np.arange(10), np.arange(10.0)
+    xs, ys = method(x, y, 100)
+    np.testing.assert_array_equal(xs, x)
+    np.testing.assert_array_equal(ys, y)
+
+
+def test_minmax_uneven_buckets():
+    x = np.arange(1001)
+    y = np.sin(x / 20.0)
+    y[-1] = 5.0  # Maximum im letzten, nur teilweise gefüllten Bucket
+    xs, ys = decimate.minmax(x, y, 64)
+    assert xs[-1] == 1000 and ys.max() == 5.0
+
+
+def test_lttb_datetime_axis(rng):
+    x = np.datetime64("2025-06-01T00:00") + np.arange(2000).astype("timedelta64[m]")
+    y = rng.normal(size=2000)
+    xs, _ = decimate.lttb(x, y, 100)
+    assert xs.dtype == x.dtype and xs[0] == x[0] and xs[-1] == x[-1]
+
+
+def test_decimate_x_range(series):
+    x, y = series
+    xs, _ = decimate.decimate(x, y, width_px=100, x_range=(2_000, 3_000))
+    assert xs.min() >= 2_000 and xs.max() <= 3_000
+    assert len(xs) <= decimate.target_points(100)
@@ -0,0 +1,98 @@
+"""Unterdrückung fast gleicher Bilder: Schwelle, ``max_skipped``, Delta-Markierung."""
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from smartag import dedup
+from smartag.gallery import synthetic_frame
+
+
+def jpeg(image):
+    buf = io.BytesIO()
+    image.save(buf, "JPEG", quality=85)
+    return buf.getvalue()
+
+
+def flip(h, bits):
+    """Hash mit ``bits`` umgekippten Bits."""
+    return np.uint64(int(h) ^ ((1 << bits) - 1))
+
+
+H = np.uint64(0x0123_4567_89AB_CDEF)
+
+
+def test_hamming():
+    assert dedup.hamming(H, H) == 0
+    assert dedup.hamming(H, flip(H, 5)) == 5
+    assert dedup.hamming(np.uint64(0), np.uint64(2**64 - 1)) == 64
+
+
+@pytest.mark.parametrize("bits, kept", [(0, False), (4, False), (5, True), (64, True)])
+def test_threshold_is_inclusive(bits, kept):
+    f = dedup.NearDuplicateFilter(threshold=4)
+    keep, references, distance = f.decide([1, 1], np.array([H, flip(H, bits)], np.uint64))
+    assert keep.tolist() == [True, kept]
+    assert distance[1] == bits
+    assert references[1] == H
+
+
+def test_compares_with_last_kept_frame():
+    # kleine Schritte summieren sich: 3 + 3 Bit vom Referenzbild entfernt → behalten
+    f = dedup.NearDuplicateFilter(threshold=4, max_skipped=None)
+    hashes = np.array([H, flip(H, 3), flip(H, 6), flip(H, 6)], np.uint64)
+    keep, _, _ = f.decide([7] * 4, hashes)
+    assert keep.tolist() == [True, False, True, False]
+
+
+def test_cameras_are_independent():
+    f = dedup.NearDuplicateFilter(threshold=4)
+    keep, _, _ = f.decide([1, 2, 1, 2], np.array([H, H, H, H], np.uint64))
+    assert keep.tolist() == [True, True, False, False]
+
+
+def test_max_skipped_forces_a_frame():
+    f = dedup.NearDuplicateFilter(threshold=4, max_skipped=3)
+    keep, _, _ = f.decide([1] * 9, np.full(9, H, np.uint64))
+    assert keep.tolist() == [True, False, False, False, True, False, False, False, True]
+    assert f.forced == 2
+
+
+def test_delta_marker_and_report():
+    frames = [b"x" * 1000] * 3
+    f = dedup.NearDuplicateFilter(threshold=4, mode="delta")
+    out = f.filter([1, 1, 1], frames, np.array([H, flip(H, 2), H], np.uint64))
+    assert out[0] is frames[0]
+    assert dedup.is_delta(out[1]) and dedup.is_delta(out[2])
+    assert out[1] == dedup.delta_marker(H, 2)
+    assert not dedup.is_delta(frames[0])
+    report = f.report()
+    assert report["kept"] == 1 and report["suppressed"] == 2
+    assert report["bytes_out"] == 1000 + 2 * dedup.DELTA_BYTES
+    assert report["saved_bytes"] == 3000 - report["bytes_out"]
+    assert report["saved_share"] == pytest.approx(report["saved_bytes"] / 3000)
+
+
+def test_drop_mode_returns_none():
+    f = dedup.NearDuplicateFilter(threshold=4)
+    out = f.filter([1, 1], [b"a" * 10, b"b" * 10], np.array([H, H], np.uint64))
+    assert out == [b"a" * 10, None]
+    assert f.report()["bytes_out"] == 10
+
+
+def test_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        dedup.NearDuplicateFilter(mode="zip")
+
+
+def test_phash_separates_noise_from_new_scene(rng):
+    scene, _ = synthetic_frame(rng, 320, 240)
+    other, _ = synthetic_frame(np.random.default_rng(1), 320, 240)
+    noisy = np.clip(np.asarray(scene, np.int16) + rng.integers(-6, 7, (240, 320, 3)), 0, 255).astype(np.uint8)
+    hashes = dedup.hash_frames([jpeg(scene), jpeg(Image.fromarray(noisy)), jpeg(other)])
+    assert hashes.dtype == np.uint64
+    assert dedup.hamming(hashes[0], hashes[1]) <= dedup.DEFAULT_THRESHOLD
+    assert dedup.hamming(hashes[0], hashes[2]) > 4 * dedup.DEFAULT_THRESHOLD
+    assert dedup.hash_frames([]).size == 0
@@ -0,0 +1,59 @@
+"""Lite-Profil gegen ``smartag.edge.BUDGET``: Auswertung und Messung am laufenden Server."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+from smartag.edge import BUDGET
+
+SCRIPT = Path(__file__).resolve().parent.parent / "benchmarks" / "check_edge_budget.py"
+
+
+@pytest.fixture(scope="module")
+def budget_script():
+    spec = importlib.util.spec_from_file_location("check_edge_budget", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def check(budget_script):
+    return budget_script.check
+
+
+def result(**overrides):
+    values = {key: BUDGET[key] for key in ("rss_mib", "cpu_ms_first", "cpu_ms_rerun", "first_run_kib", "rerun_kib")}
+    values["elements"] = {"markdown", "metric"}
+    values.update(overrides)
+    return values
+
+
+def test_within_budget(check):
+    rows = check(result())
+    assert all(ok for *_, ok in rows)
+    assert {name for name, *_ in rows} == set(BUDGET)
+
+
+def test_over_budget(check):
+    rows = {name: ok for name, _, _, ok in check(result(rerun_kib=BUDGET["rerun_kib"] + 0.1))}
+    assert not rows["rerun_kib"]
+    assert rows["rss_mib"]
+
+
+def test_forbidden_element(check):
+    rows = {name: (measured, ok) for name, measured, _, ok in check(result(elements={"plotly_chart", "metric"}))}
+    assert rows["forbidden_elements"] == ("plotly_chart", False)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="misst über /proc")
+def test_lite_profile_on_server(budget_script):
+    # wie auf dem Gateway ohne Plotly: importiert das Lite-Profil es doch, bricht die Seite ab
+    result = budget_script.run("lite", reruns=3, without=("plotly",))
+    assert "exception" not in result["elements"]
+    assert "plotly_chart" not in result["elements"]
+    assert result["modules"] and "plotly" not in result["modules"]
+    assert result["first_run_kib"] <= BUDGET["first_run_kib"]
+    assert result["rerun_kib"] <= BUDGET["rerun_kib"]
@@ -0,0 +1,64 @@
+"""Schnappschuss-Index: Scan, Seitenweise Abfrage und Filter."""
+
+import pytest
+
+from smartag.gallery import SnapshotIndex, write_demo
+
+
+@pytest.fixture(scope="module")
+def root(tmp_path_factory):
+    root = tmp_path_factory.mktemp("snapshots")
+    write_demo(root, cameras=2, days=3, per_day=4, width=64, height=48)
+    return root
+
+
+@pytest.fixture
+def index(root, tmp_path):
+    index = SnapshotIndex(root, tmp_path / "index.db", workers=2)
+    index.scan()
+    yield index
+    index.close()
+
+
+def test_scan_counts(index):
+    assert index.count() == 2 * 3 * 4
+    again = index.scan()
+    assert again["changed"] == 0 and again["indexed"] == 0
+
+
+def test_pages_cover_everything_once_newest_first(index):
+    pages = [index.page(n, 5) for n in range(6)]
+    assert [len(p) for p in pages] == [5, 5, 5, 5, 4, 0]
+    rows = [row for page in pages for row in page]
+    paths = [row["path"] for row in rows]
+    assert len(set(paths)) == len(paths) == index.count()
+    keys = [(row["day"], row["name"], row["path"]) for row in rows]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_filters(index):
+    camera = index.facets("camera")[0][0]
+    rows = index.page(0, 100, camera=camera)
+    assert len(rows) == index.count(camera=camera) == 12
+    assert {row["camera"] for row in rows} == {camera}
+    days = index.facets("day")
+    assert [d for d, _ in days] == sorted((d for d, _ in days), reverse=True)
+    assert sum(n for _, n in days) == index.count()
+    with pytest.raises(ValueError):
+        index.page(0, 10, species="Tomate")
+
+
+def test_rescan_picks_up_changes(root, tmp_path):
+    index = SnapshotIndex(root, tmp_path / "index.db", workers=1)
+    index.scan()
+    victim = index.absolute(index.page(0, 1)[0])
+    data = victim.read_bytes()
+    victim.unlink()
+    try:
+        assert index.scan()["removed"] == 1
+        assert index.count() == 23
+    finally:
+        victim.write_bytes(data)
+    assert index.scan()["indexed"] == 1
+    assert index.count() == 24
+    index.close()
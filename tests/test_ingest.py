@@ -0,0 +1,70 @@
+"""Ingest-Pipeline: kaputte Uplinks und fehlschlagende Speicher dürfen sie nicht anhalten."""
+
+import asyncio
+
+import numpy as np
+
+from smartag import codec
+from smartag.ingest import IngestService
+from smartag.storage import DetectionStore
+
+REGISTRY = {1: ("Tomate", "Gewächshaus A"), 2: ("Erdbeere", "Freiland Nord")}
+
+
+def uplinks(n, camera_id=1, ts0=1_750_000_000):
+    columns = {"ts": ts0 + np.arange(n) * 60, "fruit_count": np.arange(n), "confidence": np.full(n, 0.8),
+               "battery": np.full(n, 90)}
+    return [(camera_id, m.tobytes()) for m in codec.encode(columns)]
+
+
+def bad_version(payload):
+    return bytes([(payload[0] & 0x0F) | 0x20]) + payload[1:]
+
+
+def test_decode_drops_only_broken_uplinks(tmp_path):
+    service = IngestService(DetectionStore(tmp_path / "d.db"), REGISTRY)
+    items = uplinks(5)
+    items[2] = (1, bad_version(items[2][1]))
+    items.append((2, codec.encode_batch({"ts": [1, 2, 3], "fruit_count": [4, 2, 7]})))
+    items.append((2, b"\x00" * 3))
+    items.append((99, uplinks(1)[0][1]))  # unbekannte Kamera
+    columns = service.decode(items)
+    assert len(columns["ts"]) == 4 + 3
+    assert service.metrics.errors == 3
+    assert set(columns["species"].tolist()) == {"Tomate", "Erdbeere"}
+
+
+def test_pipeline_stores_everything(tmp_path):
+    store = DetectionStore(tmp_path / "d.db")
+
+    async def run():
+        service = IngestService(store, REGISTRY, max_wait=0.01)
+        await service.start()
+        for camera_id, payload in uplinks(50) + uplinks(30, camera_id=2):
+            await service.submit(camera_id, payload)
+        await service.stop()
+        return service.metrics.snapshot()
+
+    snap = asyncio.run(run())
+    assert snap["stored"] == store.count() == 80
+    assert snap["errors"] == 0
+    store.close()
+
+
+class FailingStore:
+    def ingest(self, columns):
+        raise OSError("Karte voll")
+
+
+def test_failing_store_does_not_hang_stop():
+    async def run():
+        service = IngestService(FailingStore(), REGISTRY, max_wait=0.01)
+        await service.start()
+        for camera_id, payload in uplinks(20):
+            await service.submit(camera_id, payload)
+        await asyncio.wait_for(service.stop(), 5)
+        return service.metrics
+
+    metrics = asyncio.run(run())
+    assert metrics.errors == 20
+    assert metrics.stored == 0
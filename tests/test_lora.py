@@ -0,0 +1,66 @@
+"""Time-on-Air gegen Referenzwerte des Semtech LoRa Calculator (EU868, 125 kHz, CR 4/5)."""
+
+import numpy as np
+import pytest
+
+from smartag import lora
+
+# (Anwendungsnutzlast in Byte, SF, Airtime in ms) – inklusive 13 Byte LoRaWAN-Overhead
+REFERENCE = [
+    (0, 7, 46.336),
+    (51, 7, 118.016),
+    (0, 12, 1155.072),
+    (51, 12, 2793.472),
+]
+
+
+@pytest.mark.parametrize("payload, sf, ms", REFERENCE)
+def test_airtime_matches_semtech(payload, sf, ms):
+    assert lora.airtime(payload, sf) * 1000 == pytest.approx(ms, abs=1e-3)
+
+
+def test_airtime_vectorised():
+    payload, sf, ms = map(np.array, zip(*REFERENCE))
+    np.testing.assert_allclose(lora.airtime(payload, sf) * 1000, ms, atol=1e-3)
+
+
+def test_airtime_raw_payload():
+    # ohne LoRaWAN-Rahmen zählt ``payload`` als PHY-Nutzlast
+    assert lora.airtime(13, 7, lorawan=False) == pytest.approx(lora.airtime(0, 7))
+
+
+def test_airtime_monotonic():
+    sizes = np.arange(0, 52)
+    for sf in lora.SPREADING_FACTORS:
+        assert np.all(np.diff(lora.airtime(sizes, sf)) >= 0)
+    times = lora.airtime(20, np.array(lora.SPREADING_FACTORS))
+    assert np.all(np.diff(times) > 0)
+
+
+def test_duty_cycle_budget():
+    # 1 % Duty Cycle: 36 s Sendezeit je Stunde
+    per_hour = lora.max_messages_per_hour(51, 12)
+    assert per_hour * lora.airtime(51, 12) <= 36.0
+    assert (per_hour + 1) * lora.airtime(51, 12) > 36.0
+
+
+def test_plan_shapes_and_feasibility():
+    sfs, payloads, intervals, fleets = [7, 12], [9, 98, 222], [60, 3600], [1, 100, 1000]
+    grid = lora.plan(sfs, payloads, intervals, fleets)
+    for values in grid.values():
+        assert values.shape == (2, 3, 2, 3)
+    # 222 Byte sind bei SF12 nicht erlaubt, bei SF7 schon
+    assert not grid["feasible"][1, 2].any()
+    assert grid["feasible"][0, 2, 1].all()
+    # SF12 jede Minute überschreitet den Duty Cycle
+    assert not grid["feasible"][1, 0, 0].any()
+    np.testing.assert_allclose(grid["airtime"][0, 1, 0, 0], lora.airtime(98, 7))
+    # mehr Geräte, mehr Kollisionen
+    assert np.all(np.diff(grid["collision"], axis=-1) > 0)
+
+
+def test_max_fleet_meets_collision_target():
+    for sf in lora.SPREADING_FACTORS:
+        n = lora.max_fleet(9, sf, 3600, max_collision=0.1)
+        collision = lora.plan([sf], [9], [3600], [n, n + 1])["collision"].ravel()
+        assert collision[0] <= 0.1 < collision[1]
@@ -0,0 +1,45 @@
+"""Detektionen aus Sidecar-Dateien: gültige, fehlende und kaputte Dateien."""
+
+import numpy as np
+import pytest
+
+from smartag import overlay
+
+DETECTIONS = [
+    {"box": [0.1, 0.2, 0.3, 0.4], "label": "Tomate", "ripeness": 2, "confidence": 0.87},
+    {"box": [0.5, 0.5, 0.9, 0.95], "label": "Tomate", "ripeness": 9},
+]
+
+
+def test_roundtrip(tmp_path):
+    image = tmp_path / "120000.jpg"
+    overlay.write_detections(image, DETECTIONS, model="test")
+    version, raw = overlay.read_sidecar(image)
+    assert version and raw
+    cols = overlay.parse(raw)
+    np.testing.assert_allclose(cols["box"], [d["box"] for d in DETECTIONS])
+    # Reifeklasse außerhalb des Bereichs wird begrenzt, fehlende Konfidenz ist 1
+    assert cols["ripeness"].tolist() == [2, len(overlay.RIPENESS_CLASSES) - 1]
+    np.testing.assert_allclose(cols["confidence"], [0.87, 1.0])
+    assert cols["label"] == ["Tomate", "Tomate"]
+
+
+def test_missing_sidecar(tmp_path):
+    assert overlay.read_sidecar(tmp_path / "fehlt.jpg") == (None, None)
+    assert overlay.parse(None)["box"].shape == (0, 4)
+
+
+@pytest.mark.parametrize("raw", [
+    b'{"detections": [{"box": [0.1, 0.2',          # halb geschrieben
+    b"\xff\xfe\x00",                                # kein UTF-8
+    b"[]",                                          # falscher Typ
+    b'{"model": "x"}',                              # Schlüssel fehlt
+    b'{"detections": [{"box": [1, 2, 3]}]}',        # Box mit 3 Werten
+    b'{"detections": [{"label": "Tomate"}]}',       # Box fehlt
+    b'{"detections": [{"box": "abc"}]}',
+    b'{"detections": 5}',
+])
+def test_malformed_sidecar_gives_no_detections(raw):
+    cols = overlay.parse(raw)
+    assert cols["box"].shape == (0, 4)
+    assert len(cols["ripeness"]) == len(cols["confidence"]) == len(cols["label"]) == 0
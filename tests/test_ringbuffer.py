@@ -0,0 +1,63 @@
+"""Ringpuffer: Überlauf, Reihenfolge und ``since``-Filter."""
+
+import numpy as np
+
+from smartag.ringbuffer import RingBuffer
+
+
+def test_empty():
+    buf = RingBuffer(4)
+    assert len(buf) == 0
+    t, value = buf.latest()
+    assert t is None and np.isnan(value)
+    assert buf.latest(default=0) == (None, 0)
+    times, values = buf.snapshot()
+    assert len(times) == len(values) == 0
+
+
+def test_append_wraps_around():
+    buf = RingBuffer(4)
+    for t in range(10):
+        buf.append(t, t * 10)
+    assert len(buf) == 4
+    times, values = buf.snapshot()
+    assert times.tolist() == [6, 7, 8, 9]
+    assert values.tolist() == [60, 70, 80, 90]
+    assert buf.latest() == (9.0, 90.0)
+
+
+def test_extend_across_the_end():
+    buf = RingBuffer(5)
+    buf.extend([0, 1, 2], [0, 1, 2])
+    buf.extend([3, 4, 5, 6], [3, 4, 5, 6])  # schreibt über das Array-Ende hinaus
+    times, values = buf.snapshot()
+    assert times.tolist() == [2, 3, 4, 5, 6]
+    assert values.tolist() == [2, 3, 4, 5, 6]
+
+
+def test_extend_longer_than_capacity():
+    buf = RingBuffer(3)
+    buf.append(-1, -1)
+    buf.extend(np.arange(10), np.arange(10))
+    times, _ = buf.snapshot()
+    assert times.tolist() == [7, 8, 9]
+    buf.extend([], [])
+    assert len(buf) == 3
+
+
+def test_snapshot_since():
+    buf = RingBuffer(8)
+    buf.extend(np.arange(12), np.arange(12.0))
+    times, values = buf.snapshot(since=9)
+    assert times.tolist() == [9, 10, 11]
+    assert values.tolist() == [9.0, 10.0, 11.0]
+    # Kopie, kein View auf den Puffer
+    values[:] = 0
+    assert buf.latest() == (11.0, 11.0)
+
+
+def test_memory_is_fixed():
+    buf = RingBuffer(100)
+    before = buf.nbytes
+    buf.extend(np.arange(1000), np.arange(1000))
+    assert buf.nbytes == before == 100 * 16
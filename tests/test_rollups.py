@@ -0,0 +1,95 @@
+"""Vorberechnete Summen: additiv über Batches und gleich der Rohdatenaggregation."""
+
+import numpy as np
+import pytest
+
+from smartag.rollups import GRAINS, SUMS, Rollups, bucket
+from smartag.storage import DAY, DetectionStore
+
+START = 1_748_736_000  # 2025-06-01, Sonntag
+
+
+def readings(rng, n):
+    return {
+        "ts": START + rng.integers(0, 21 * DAY, n),
+        "camera": rng.choice(["kamera-001", "kamera-002", "kamera-003"], n),
+        "species": rng.choice(["Tomate", "Erdbeere"], n),
+        "location": rng.choice(["Gewächshaus A", "Freiland Nord"], n),
+        "fruit_count": rng.integers(0, 40, n),
+        "ripeness": rng.integers(0, 4, n),
+        "confidence": rng.uniform(0.5, 1.0, n),
+        "stress": rng.integers(0, 2, n),
+    }
+
+
+def open_store(path):
+    store = DetectionStore(path)
+    return store, Rollups(store)
+
+
+@pytest.fixture
+def data(rng):
+    return readings(rng, 3000)
+
+
+def test_bucket_alignment():
+    assert bucket(START + 3599, "hour") == START
+    assert bucket(START + DAY - 1, "day") == START
+    # Wochen beginnen am Montag
+    assert bucket(START, "week") == START - 6 * DAY
+    assert bucket(START + DAY, "week") == START + DAY
+    with pytest.raises(ValueError):
+        bucket(START, "month")
+
+
+@pytest.mark.parametrize("grain", GRAINS)
+def test_batches_add_up(tmp_path, data, grain):
+    whole, whole_rollups = open_store(tmp_path / "whole.db")
+    whole.ingest(data)
+    split, split_rollups = open_store(tmp_path / "split.db")
+    cut = np.array_split(np.arange(len(data["ts"])), 7)
+    for part in cut:
+        split.ingest({k: np.asarray(v)[part] for k, v in data.items()})
+
+    a = whole_rollups.query(grain, START, START + 21 * DAY)
+    b = split_rollups.query(grain, START, START + 21 * DAY)
+    for name in SUMS:
+        np.testing.assert_allclose(a[name], b[name], rtol=1e-6)
+    assert a["n"].sum() == len(data["ts"])
+    whole.close()
+    split.close()
+
+
+def test_matches_raw_data(tmp_path, data):
+    store, rollups = open_store(tmp_path / "d.db")
+    store.ingest(data)
+    result = rollups.query("day", START, START + 21 * DAY, by=("species",))
+    raw = store.query(START, START + 21 * DAY)
+    tomato = store.dimension_ids("species", ["Tomate"])[0]
+    for b, species, n, fruit in zip(result["bucket"], result["species_id"], result["n"], result["fruit_sum"]):
+        mask = (raw["ts"] // DAY * DAY == b) & (raw["species_id"] == species)
+        assert n == mask.sum()
+        assert fruit == raw["fruit_count"][mask].sum()
+    assert set(result["species_id"].tolist()) == {tomato, store.dimension_ids("species", ["Erdbeere"])[0]}
+    np.testing.assert_allclose(result["ripeness"].sum(axis=1), 1.0)
+    store.close()
+
+
+def test_rebuild_restores_sums(tmp_path, data):
+    store, rollups = open_store(tmp_path / "d.db")
+    store.ingest(data)
+    before = rollups.query("week", START, START + 21 * DAY)
+    rollups.rebuild()
+    after = rollups.query("week", START, START + 21 * DAY)
+    for name in SUMS:
+        np.testing.assert_allclose(before[name], after[name], rtol=1e-6)
+    store.close()
+
+
+def test_rejects_camera_grouping(tmp_path):
+    store, rollups = open_store(tmp_path / "d.db")
+    with pytest.raises(ValueError):
+        rollups.query("day", START, START + DAY, by=("camera",))
+    with pytest.raises(ValueError):
+        rollups.query("minute", START, START + DAY)
+    store.close()
@@ -0,0 +1,53 @@
+"""Vektorisierte Regelauswertung gegen den skalaren Referenzpfad."""
+
+import numpy as np
+import pytest
+
+from smartag.rules import DEFAULT_STATE, RuleEngine
+
+
+def test_vectorised_matches_evaluate_one(rng):
+    n = 5000
+    readings = {
+        "bodenfeuchte": rng.uniform(0, 100, n),
+        "temperatur": rng.uniform(-10, 45, n),
+        "licht": rng.uniform(0, 120_000, n),
+    }
+    engine = RuleEngine()
+    decisions = engine.evaluate(readings)
+    expected = [engine.evaluate_one({c: v[i] for c, v in readings.items()}) for i in range(n)]
+    assert [decisions[i] for i in range(n)] == expected
+    # jede Regel kommt in der Stichprobe vor
+    assert all(decisions.counts().values())
+
+
+def test_priority_and_bounds():
+    engine = RuleEngine()
+    # trocken und heiß zugleich: Bewässerung hat Vorrang
+    decisions = engine.evaluate({"bodenfeuchte": [20, 30, 70, 50], "temperatur": [40, 20, 20, 35]})
+    assert [decisions[i].name for i in range(4)] == ["bewaesserung", "optimal", "optimal", "optimal"]
+    assert engine.evaluate_one({"bodenfeuchte": 20, "temperatur": 40}).name == "bewaesserung"
+
+
+def test_missing_channels_are_ignored():
+    engine = RuleEngine()
+    decisions = engine.evaluate({"licht": np.array([90_000.0, 100.0])})
+    assert [decisions[i].name for i in range(2)] == ["einstrahlung", "optimal"]
+    assert engine.evaluate_one({}) is DEFAULT_STATE
+
+
+def test_empty_readings():
+    with pytest.raises(ValueError):
+        RuleEngine().evaluate({})
+    # Kanal ohne Werte: leeres Ergebnis
+    decisions = RuleEngine().evaluate({"licht": []})
+    assert len(decisions) == 0 and sum(decisions.counts().values()) == 0
+
+
+def test_from_toml(tmp_path):
+    path = tmp_path / "regeln.toml"
+    path.write_text(
+        '[[rule]]\nname = "nass"\nlabel = "Nass"\ncolor = "#000"\nchannel = "bodenfeuchte"\nabove = 50\n'
+    )
+    engine = RuleEngine.from_toml(path)
+    assert engine.evaluate({"bodenfeuchte": [60, 40]}).counts() == {"optimal": 1, "nass": 1}
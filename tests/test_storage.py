@@ -0,0 +1,115 @@
+"""Zeitlich gechunkter Detektionsspeicher: Chunkgrenzen, Abfragefenster, Aufbewahrung."""
+
+import numpy as np
+import pytest
+
+from smartag.storage import DAY, DetectionStore
+
+WEEK = 7 * DAY
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DetectionStore(tmp_path / "detections.db", chunk_days=7)
+    yield store
+    store.close()
+
+
+def batch(ts, camera="kamera-001", species="Tomate", location="Gewächshaus A"):
+    ts = np.asarray(ts, dtype=np.int64)
+    n = len(ts)
+    return {
+        "ts": ts, "camera": [camera] * n, "species": [species] * n, "location": [location] * n,
+        "fruit_count": np.arange(n), "confidence": np.full(n, 0.9),
+    }
+
+
+def test_rows_split_at_chunk_boundaries(store):
+    ts = [WEEK - 1, WEEK, WEEK + 1, 2 * WEEK - 1, 2 * WEEK, 5]
+    assert store.ingest(batch(ts)) == 6
+    assert store.chunk_starts() == [0, WEEK, 2 * WEEK]
+    assert store.count() == 6
+    assert store.count(WEEK, 2 * WEEK) == 3
+
+
+def test_query_is_half_open_across_chunks(store):
+    ts = np.arange(WEEK - 10, WEEK + 10)
+    store.ingest(batch(ts[::-1]))
+    got = store.query(WEEK - 3, WEEK + 3)["ts"]
+    assert got.tolist() == list(range(WEEK - 3, WEEK + 3))
+    assert store.query(WEEK, WEEK)["ts"].size == 0
+    # Fenster ganz innerhalb eines Chunks, der nicht existiert
+    assert store.query(10 * WEEK, 11 * WEEK)["ts"].size == 0
+
+
+def test_chunk_starts_window(store):
+    store.ingest(batch([0, WEEK, 2 * WEEK, 3 * WEEK]))
+    assert store.chunk_starts(WEEK, 2 * WEEK) == [WEEK]
+    assert store.chunk_starts(WEEK + 1, 2 * WEEK + 1) == [WEEK, 2 * WEEK]
+
+
+def test_filters_by_name_and_id(store):
+    store.ingest(batch([1, 2], camera="kamera-001"))
+    store.ingest(batch([3], camera="kamera-002"))
+    assert store.query(0, WEEK, camera="kamera-002")["ts"].tolist() == [3]
+    camera_id = store.dimension_ids("camera", ["kamera-001"])[0]
+    assert store.query(0, WEEK, camera=camera_id)["ts"].tolist() == [1, 2]
+
+
+def test_drop_before_removes_whole_chunks_only(store):
+    store.ingest(batch([0, WEEK, WEEK + DAY, 2 * WEEK]))
+    assert store.drop_before(WEEK + DAY) == 1
+    assert store.chunk_starts() == [WEEK, 2 * WEEK]
+    assert store.query(0, 3 * WEEK)["ts"].tolist() == [WEEK, WEEK + DAY, 2 * WEEK]
+
+
+def test_reopen_keeps_chunks(tmp_path):
+    path = tmp_path / "detections.db"
+    store = DetectionStore(path)
+    store.ingest(batch([0, WEEK]))
+    store.close()
+    store = DetectionStore(path)
+    assert store.chunk_starts() == [0, WEEK]
+    assert store.count() == 2
+    store.close()
+
+
+def test_failed_batch_leaves_no_half_registered_chunk(tmp_path):
+    path = tmp_path / "detections.db"
+    store = DetectionStore(path)
+    calls = []
+
+    def listener(db, data):
+        calls.append(len(data))
+        if len(calls) == 1:
+            raise RuntimeError("Listener fehlgeschlagen")
+
+    store.subscribe(listener)
+    with pytest.raises(RuntimeError):
+        store.ingest(batch([5]))
+    assert store.chunk_starts() == [] and store.count() == 0
+    store.ingest(batch([6]))
+    assert store.count() == 1
+    store.close()
+
+    store = DetectionStore(path)
+    assert store.chunk_starts() == [0]
+    assert store.query(0, WEEK)["ts"].tolist() == [6]
+    store.close()
+
+
+def test_second_instance_sees_new_chunks(tmp_path):
+    path = tmp_path / "detections.db"
+    reader = DetectionStore(path)
+    writer = DetectionStore(path)
+    writer.ingest(batch([0, WEEK]))
+    assert reader.chunk_starts() == [0, WEEK]
+    assert reader.count() == 2
+    writer.close()
+    reader.close()
+
+
+def test_unknown_filter_name_is_not_created(store):
+    store.ingest(batch([1]))
+    assert store.query(0, WEEK, species="Gurke")["ts"].size == 0
+    assert "Gurke" not in store.dimension_names("species").values()